@@ -0,0 +1,192 @@
+"""
+Benchmarks the Python and C versions of every algorithm on a fixed corpus of sets, for catching performance changes between versions of the code.
+The corpus is made by the same set generator the experiment uses, with a fixed seed, so every run (and every machine) benchmarks the exact same sets.
+Each set gets a few untimed warm up runs (the first call into a version is always slower), then is timed over and over, and each algorithm is reported with its median, 95th percentile, and a bootstrapped confidence interval of the median.
+Results are saved as JSON, and if given a saved baseline JSON the results are compared against it, exiting with a failure if anything got slower than the tolerance allows.
+
+Replaces testCversions.py, which only ever timed a single 8 integer list once.
+
+Made by bananathrowingmachine on Mar 14, 2026.
+"""
+from experiment_code.ComplexityExperiment import ComplexityExperiment, OutLevel, meetInMiddleLimit
+from experiment_code.TaskScheduler import initWorker, workerRegistry
+from data_processing_code.MiscDataCode import AlgoNames, GridSpec
+from FastPartitionExperiment import buildCLibrary
+
+from argparse import Namespace
+from datetime import datetime
+from pathlib import Path
+from typing import Callable
+import numpy as np
+import argparse, json, platform, sys, time
+
+benchmarkAlgorithms = [AlgoNames.NewMemoizedCrazy, AlgoNames.OldMemoizedCrazy, AlgoNames.MemoizedNormal, AlgoNames.TabulatedCrazy, AlgoNames.TabulatedNormal, AlgoNames.RecursiveNormal, AlgoNames.MeetInMiddle]
+
+def experimentArgs(**options) -> Namespace:
+    """
+    Builds the command line arguments the experiment would get with no options given, so the benchmark loads and builds everything exactly like a plain run does.
+
+    :param options: Any options to set instead of their default.
+    :return: Every option the experiment reads, at its default unless it was given.
+    """
+    return Namespace(**({"example": False, "reduced": False, "python": False, "numpy": False, "bitset": False, "countsOnly": False, "preprocess": False, "iterative": None, "seed": None, "grid": GridSpec()} | options))
+
+def loadVersions(implementations: list[str]) -> dict[str, dict[AlgoNames, Callable[[np.ndarray], tuple[int, bool]]]]:
+    """
+    Loads every version of every algorithm the same way a worker of the experiment does, building the C binaries first if they are needed.
+
+    :param implementations: Which implementations to load, out of 'python' and 'c'.
+    :return: The run function of each algorithm, keyed by implementation and then algorithm name.
+    """
+    versions = {}
+    for implementation in implementations:
+        if implementation == 'c':
+            buildCLibrary(Path(__file__).resolve().parent / "experiment_code" / "versions")
+        workerRegistry.clear()
+        initWorker(experimentArgs(python=implementation == 'python'))
+        versions[implementation] = dict(workerRegistry)
+    workerRegistry.clear()
+    return versions
+
+def buildCorpus(sizes: list[int], targetIndexes: list[int], setCount: int, seed: int) -> dict[tuple[int, int], list[np.ndarray]]:
+    """
+    Builds the fixed corpus of sets to benchmark, using the experiment's own set generator.
+
+    :param sizes: The integer counts of the sets.
+    :param targetIndexes: The absolute sum target indexes of the sets.
+    :param setCount: How many sets to make for each size and target index.
+    :param seed: The seed to build the sets from. The same seed always gives the same corpus.
+    :return: The sets of each (size, target index) cell, as int32 arrays.
+    """
+    corpus = {}
+    for size in sizes:
+        experiment = ComplexityExperiment(size, OutLevel.NONE, experimentArgs(seed=seed))
+        for targetIndex in targetIndexes:
+            corpus[(size, targetIndex)] = [np.array(list(experiment.generateRandomSet(targetIndex, testNum)), dtype=np.int32) for testNum in range(1, setCount + 1)]
+    return corpus
+
+def timeCell(run: Callable[[np.ndarray], tuple[int, bool]], testLists: list[np.ndarray], warmups: int, repeats: int) -> tuple[np.ndarray, list[int]]:
+    """
+    Times a single algorithm on every set of a corpus cell.
+
+    :param run: The run function of the algorithm.
+    :param testLists: The sets of the cell.
+    :param warmups: How many untimed runs each set gets first.
+    :param repeats: How many timed runs each set gets.
+    :return: Every timing in nanoseconds, and the iteration count of each set.
+    """
+    samples = []
+    iterationCounts = []
+    for testList in testLists:
+        for _ in range(warmups):
+            run(testList)
+        for _ in range(repeats):
+            startTime = time.perf_counter_ns()
+            iterationCount, _ = run(testList)
+            samples.append(time.perf_counter_ns() - startTime)
+        iterationCounts.append(int(iterationCount))
+    return np.array(samples, dtype=np.float64), iterationCounts
+
+def summarize(samples: np.ndarray, resamples: int, random: np.random.Generator) -> dict[str, float]:
+    """
+    Summarizes the timings of a cell, with a percentile bootstrap for the 95% confidence interval of the median.
+
+    :param samples: Every timing of the cell in nanoseconds.
+    :param resamples: How many bootstrap resamples to take.
+    :param random: The generator used for resampling.
+    :return: The median, 95th percentile, mean, and confidence interval bounds, all in nanoseconds.
+    """
+    bootMedians = np.median(random.choice(samples, size=(resamples, len(samples)), replace=True), axis=1)
+    ciLow, ciHigh = np.percentile(bootMedians, [2.5, 97.5])
+    return {"medianNs": float(np.median(samples)), "p95Ns": float(np.percentile(samples, 95)), "meanNs": float(np.mean(samples)),
+            "ciLowNs": float(ciLow), "ciHighNs": float(ciHigh)}
+
+def compareToBaseline(results: list[dict], baseline: dict, tolerance: float, noiseFloor: float) -> tuple[list[str], list[str]]:
+    """
+    Compares every cell against the same cell of a baseline. A cell only counts as a regression if its median is slower than both the tolerance and the noise floor allow, and its confidence interval doesn't overlap the baseline's, so noise alone shouldn't fail it.
+    Changed iteration counts are also found, since that means the algorithm itself changed rather than just its speed, and the timings aren't comparable anymore.
+
+    :param results: The results of this run.
+    :param baseline: A saved JSON output of a previous run.
+    :param tolerance: The fraction slower than the baseline's median a cell is allowed to be.
+    :param noiseFloor: How many nanoseconds slower a cell is always allowed to be, since the fastest cells are close to the resolution of the timer.
+    :return: A description of each regression found, and a description of each cell whose iteration counts changed.
+    """
+    baselineCells = {(cell["implementation"], cell["algorithm"], cell["size"], cell["targetIndex"]): cell for cell in baseline["results"]}
+    regressions = []
+    countChanges = []
+    for cell in results:
+        key = (cell["implementation"], cell["algorithm"], cell["size"], cell["targetIndex"])
+        if key not in baselineCells:
+            continue
+        old = baselineCells[key]
+        change = cell["medianNs"] / old["medianNs"] - 1
+        if change > tolerance and cell["medianNs"] - old["medianNs"] > noiseFloor and cell["ciLowNs"] > old["ciHighNs"]:
+            regressions.append(f"{key[0]:6} {key[1]:13} size {key[2]:3} index {key[3]:2}: median {old['medianNs']:.0f}ns -> {cell['medianNs']:.0f}ns ({change:+.1%})")
+        if cell["iterationCounts"] != old["iterationCounts"]:
+            countChanges.append(f"{key[0]:6} {key[1]:13} size {key[2]:3} index {key[3]:2}: iteration counts {old['iterationCounts']} -> {cell['iterationCounts']}")
+    return regressions, countChanges
+
+def main():
+    """
+    The main method of the benchmark. Builds the corpus, times every version, saves the results, and compares them against the baseline if one was given.
+    """
+    parser = argparse.ArgumentParser(description="Benchmark for the Python and C versions of every partition algorithm.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[5, 10, 20], help="The integer counts of the sets in the corpus.")
+    parser.add_argument('--targets', type=int, nargs='+', default=[0, 10, 20], help="The absolute sum target indexes of the sets in the corpus, from 0 to 20.")
+    parser.add_argument('--sets', type=int, default=3, help="How many sets the corpus has for each size and target index.")
+    parser.add_argument('--seed', type=int, default=0, help="The seed the corpus is built from. Only compare against a baseline made with the same corpus.")
+    parser.add_argument('--warmups', type=int, default=2, help="How many untimed runs each set gets before timing.")
+    parser.add_argument('--repeats', type=int, default=10, help="How many timed runs each set gets.")
+    parser.add_argument('--bootstrap', type=int, default=2000, help="How many bootstrap resamples are used for the confidence intervals.")
+    parser.add_argument('--versions', choices=['python', 'c'], nargs='+', default=['python', 'c'], help="Which implementations to benchmark.")
+    parser.add_argument('--algorithms', choices=[str(name) for name in benchmarkAlgorithms], nargs='+', default=[str(name) for name in benchmarkAlgorithms], help="Which algorithms to benchmark.")
+    parser.add_argument('--recurse-limit', type=int, default=20, help="The largest integer count Recursive Normal is benchmarked on, since it's exponential time.")
+    parser.add_argument('--output', type=Path, default=Path("benchmark_results.json"), help="Where to save the results JSON.")
+    parser.add_argument('--baseline', type=Path, default=None, help="A saved results JSON to compare against. Any regression makes the benchmark exit with a failure.")
+    parser.add_argument('--tolerance', type=float, default=0.10, help="The fraction slower than the baseline's median a result can be before it counts as a regression.")
+    parser.add_argument('--noise-floor', type=float, default=1000, help="How many nanoseconds slower than the baseline's median a result can always be, no matter the tolerance.")
+    args = parser.parse_args()
+
+    versions = loadVersions(args.versions)
+    corpus = buildCorpus(args.sizes, args.targets, args.sets, args.seed)
+    random = np.random.default_rng(args.seed)
+    results = []
+    for implementation, registry in versions.items():
+        for algoName in args.algorithms:
+            for (size, targetIndex), testLists in corpus.items():
+                if algoName == AlgoNames.RecursiveNormal and size > args.recurse_limit or algoName == AlgoNames.MeetInMiddle and size > meetInMiddleLimit:
+                    continue
+                samples, iterationCounts = timeCell(registry[algoName], testLists, args.warmups, args.repeats)
+                cell = {"implementation": implementation, "algorithm": algoName, "size": size, "targetIndex": targetIndex, "samples": len(samples), "iterationCounts": iterationCounts}
+                cell |= summarize(samples, args.bootstrap, random)
+                results.append(cell)
+                print(f"{implementation:6} {algoName:13} size {size:3} index {targetIndex:2}: median {cell['medianNs']:12.0f}ns  p95 {cell['p95Ns']:12.0f}ns  95% CI [{cell['ciLowNs']:.0f}, {cell['ciHighNs']:.0f}]")
+
+    meta = {"date": datetime.now().isoformat(timespec='seconds'), "platform": platform.platform(), "python": platform.python_version(),
+            "sizes": args.sizes, "targets": args.targets, "sets": args.sets, "seed": args.seed, "warmups": args.warmups, "repeats": args.repeats}
+    with open(args.output, "w") as file:
+        json.dump({"meta": meta, "results": results}, file, indent=2)
+    print(f"()~~}}|[==>>--:>- Benchmark results saved to {args.output}. -<:--<<==]|{{~~()")
+
+    if args.baseline is not None:
+        with open(args.baseline, "r") as file:
+            baseline = json.load(file)
+        if any(baseline["meta"][key] != meta[key] for key in ("sizes", "targets", "sets", "seed")):
+            print("()~~}|[==>>--:>-  The baseline was made with a different corpus, only matching cells are compared.  -<:--<<==]|{~~()")
+        regressions, countChanges = compareToBaseline(results, baseline, args.tolerance, args.noise_floor)
+        if len(regressions) != 0:
+            print(f"()~~}}|[==>>--:>- {len(regressions)} regression(s) found against {args.baseline}. -<:--<<==]|{{~~()")
+            for regression in regressions:
+                print(regression)
+        if len(countChanges) != 0:
+            print(f"()~~}}|[==>>--:>- {len(countChanges)} cell(s) changed iteration counts against {args.baseline}, so they are no longer the same algorithm. -<:--<<==]|{{~~()")
+            for countChange in countChanges:
+                print(countChange)
+        if len(regressions) != 0 or len(countChanges) != 0:
+            sys.exit(1)
+        print("()~~}|[==>>--:>-             No regressions found against the baseline.              -<:--<<==]|{~~()")
+    sys.exit(0)
+
+if __name__ == '__main__':
+    main()
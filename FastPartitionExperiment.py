@@ -4,43 +4,56 @@ This program on a deeper level will delete the output subdirectories if they exi
 Both the data collector and the data processor run on independent threads, and the complexity experiment will actually run multiple parallel threads as well.
 
 Details on the data collector:
-Due to how the complexity tester was designed, this file also maintains how many integers should be in the sets tested, starting from 5, and in increments of 5 going up to 100, and sends that to the complexity tester.
+Due to how the complexity tester was designed, this file also maintains the grid of the experiment (how many integers should be in the sets tested, starting from 5, and in increments of 5 going up to 100 by default, along with the target indexes, repeats and largest integer), and sends that to the complexity tester.
+Every size is scheduled at once onto a single shared worker pool, so sizes are sent off to the data processor in whatever order they finish in.
+Every finished test and size is also written to a run journal as it happens, so that a run that crashed or was stopped can be picked back up with --resume.
 Additionally, it will send the complexity tester directory information for the small bit of output it produces, and if it should generate a quick example output or a full computationally expensive output.
 After the complexity tester has produced results, this program will take them, wrap them up with a few other useful bits of information, then send it to the data processor for processing.
 The entire process was designed to try and keep all computer science stuff away from the data processing as possible.
 
 Details on the data processor:
-The data processor will check for packaged data every 0.25 seconds, until the signal by the orchestrator that computation has stopped is sent. 
+The data processor will wait on the queue and pick up each chunk of packaged data the moment it arrives, until the data collector sends the end of stream marker (which it always does, even when crashing or stopped with Ctrl-C).
 It will then send the packaged data completely unmodified to the data processing code, along with the same directory information given to the data collector.
 Once in the data processing code, the processor will unpack the data, processes it, and then once done will return back to the orchestrator, waiting for another chunk of data.
+The queue only holds a few chunks at a time, so if the processor falls behind the collector waits for it instead of piling up data. Ctrl-C is left to the collector, so the processor always gets to save whatever made it over before stopping.
 Was designed to have as little code as possible to help my non comp sci major friend who does know how to graph in python.
 
 Made by bananathrowingmachine on Feb 23, 2026.
 """
 from experiment_code.ComplexityExperiment import ComplexityExperiment
+from experiment_code.TaskScheduler import TaskScheduler
+from experiment_code.RunJournal import RunJournal
+from experiment_code.RawResultsStore import RawResultsStore
+from experiment_code.SetGenerator import SetGenerator
 from data_processing_code.MainDataProcessor import MainDataProcessor
-from data_processing_code.MiscDataCode import ResultsWrapper, DisagreeData, AlgoNames
+from data_processing_code.MiscDataCode import ResultsWrapper, DisagreeData, AlgoNames, GridSpec, FullSuite, SpeedySuite
 from data_processing_code.DisagreeProcessor import DisagreeProcessor
 
-from multiprocessing import Process, Queue, Event
+from multiprocessing import Process, Queue
+from contextlib import nullcontext
 from shutil import rmtree
 from pathlib import Path
-from queue import Empty
 from cffi import FFI
+import numpy as np
 
-import argparse, sys, os, glob, time
+import argparse, json, sys, os, glob, signal, time
 
-disagreeCount = 1
+endOfStream = "endOfStream" # Sent by the data collector once it is done (for any reason), telling the data processor nothing else is coming.
+queueLimit = 8 # How many chunks can wait on the data processor before the data collector has to wait for it to catch up.
 
-def collectData(queue: Queue, args):
+def collectData(queue: Queue, args, journalPath: Path, storeDir: Path):
     """
     Allows data collection to happen in a seperate thread. Takes data and inputs it into the queue.
 
     :param queue: The data queue. Used to allow the computer to collect and process data simultaneously. Effectively the output of the method.
     :param args: The command line arguments passed when the program started.
+    :param journalPath: The run journal that every finished test and size gets recorded in, and that a resumed run picks back up from. Not used if generating example output.
+    :param storeDir: The raw results store every test of a finished size gets saved to. Not used if generating example output.
     """
     sheets = None
-    if args.example:
+    if args.example and args.grid != GridSpec():
+        print('()~~}|[==>>--:>- Example data only exists for the default grid. Generating random data. -<:--<<==]|{~~()')
+    elif args.example:
         import pandas as pd
         import urllib.error
         try:
@@ -56,64 +69,94 @@ def collectData(queue: Queue, args):
             print('()~~}|[==>>--:>-    Could not download data. Resorting to generating random data.    -<:--<<==]|{~~()')
     else:
         print("|[==>>--:>- ============================================================================= -<:--<<==]|")
-    noDisagrees = True
-    for n in range(1, 21):
-        size = n * 5
-        try:
-            fullResults = ComplexityExperiment.testProblemSize(size, args, sheets)
-        except:
-            print("()~~}|[==>>--:>-                  Test process crashed. Terminating.                 -<:--<<==]|{~~()")
-            raise
-        results = fullResults[0]
-        queue.put(ResultsWrapper(size, None if size <= 25 else 2 ** size, results))
-        disagreeList = fullResults[1]
-        if len(disagreeList) != 0:
-            noDisagrees = False
-            queue.put(disagreeList)
-    if noDisagrees:
-        queue.put(None)
-
-def processData(queue: Queue, keepGoing, genFilesDir: Path, speedy: bool):
+    try:
+        with nullcontext() if args.example else TaskScheduler(args) as scheduler, nullcontext() if args.example else RunJournal(journalPath) as journal:
+            store = None if args.example else RawResultsStore(storeDir)
+            for size, results, disagreeList in ComplexityExperiment.testProblemSizes(list(args.grid.Sizes), args, scheduler, sheets, journal, store):
+                queue.put(ResultsWrapper(size, None if size <= 25 else float(2 ** size), results)) # Blocks while the queue is full, until the data processor catches up.
+                if len(disagreeList) != 0:
+                    queue.put(disagreeList)
+    except KeyboardInterrupt:
+        print("()~~}|[==>>--:>-   Test process stopped. Sending off everything finished so far.    -<:--<<==]|{~~()")
+    except:
+        print("()~~}|[==>>--:>-                  Test process crashed. Terminating.                 -<:--<<==]|{~~()")
+        raise
+    finally:
+        queue.put(endOfStream)
+
+def reprocessData(queue: Queue, storeDir: Path):
     """
-    Allows data processing to happen in a seperate thread. Takes data inputted into the queue and heads off to processes it. Will wait idly until data arrives.
+    Stands in for the data collector when reprocessing, sending the averages of every size in the raw results store instead of running anything. Each shard is only read once it's needed.
+
+    :param queue: The data queue, the same as the data collector uses.
+    :param storeDir: The raw results store to read from.
+    """
+    store = RawResultsStore(storeDir)
+    try:
+        for size in store.sizes():
+            queue.put(ResultsWrapper(size, None if size <= 25 else float(2 ** size), store.summarize(size)))
+    except KeyboardInterrupt:
+        print("()~~}|[==>>--:>-  Reprocessing stopped. Sending off everything finished so far.   -<:--<<==]|{~~()")
+    finally:
+        queue.put(endOfStream)
+
+def processData(queue: Queue, genFilesDir: Path, speedy: bool, grid: GridSpec, live: bool, preprocessed: bool):
+    """
+    Allows data processing to happen in a seperate thread. Takes data inputted into the queue and heads off to processes it. Will wait idly until data arrives, and stops once the end of stream marker arrives.
+    Ignores Ctrl-C, since the data collector will always send the end of stream marker once it stops, and then everything received so far gets saved.
 
     :param queue: The data queue. Used to allow the computer to collect and process data simultaneously. Effectively the input of the method. Instantly calls the data processor when data is made available.
+    :param grid: The grid of the experiment, which the data tables and graphs are laid out by.
+    :param live: If the data table and graphs should be refreshed after every chunk, instead of only at the end.
+    :param preprocessed: If the sets went through the preprocessing stage, which adds a table for each of its reductions.
     """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
     if speedy:
-        DataProcessor = MainDataProcessor(genFilesDir, (AlgoNames.TargetSum, AlgoNames.NewMemoizedCrazy, AlgoNames.OldMemoizedCrazy))
+        DataProcessor = MainDataProcessor(genFilesDir, (AlgoNames.TargetSum,) + SpeedySuite, grid, live, preprocessed)
     else:
-        DataProcessor = MainDataProcessor(genFilesDir, (AlgoNames.TargetSum, AlgoNames.NewMemoizedCrazy, AlgoNames.MemoizedNormal, AlgoNames.TabulatedCrazy, AlgoNames.TabulatedNormal, AlgoNames.RecursiveNormal))
-    while keepGoing.is_set() or not queue.empty():
-        try: 
-            data = queue.get(timeout=0.25)
-            if data is None:
-                DisagreeProcessor.noDisagreements(genFilesDir)
-            elif isinstance(data, ResultsWrapper):
-                DataProcessor.appendData(data)
-            elif isinstance(data, list) and all(isinstance(item, DisagreeData) for item in data):
-                global disagreeCount
-                DisagreeProcessor.processBulkDisagreements(genFilesDir, data, disagreeCount)
-                disagreeCount += len(data)
-        except Empty:
-            continue
-        except KeyboardInterrupt:
-            DataProcessor.outputTableData()
-            break
+        DataProcessor = MainDataProcessor(genFilesDir, (AlgoNames.TargetSum,) + FullSuite, grid, live, preprocessed)
+    disagreeProcessor = DisagreeProcessor(genFilesDir)
+    while (data := queue.get()) != endOfStream:
+        if isinstance(data, ResultsWrapper):
+            DataProcessor.appendData(data)
+        elif isinstance(data, list) and all(isinstance(item, DisagreeData) for item in data):
+            disagreeProcessor.appendDisagreements(data)
     DataProcessor.outputImageData()
+    disagreeProcessor.renderRecord()
 
 def main():
     """
     The main method. Starts up the threads, flags, and gets everything moving. This is the file to run to start up everything else.
 
-    Do note that this program will also wipe all previously generated graphs, data tables, and recorded solution conflicts when run.
+    Do note that this program will also wipe all previously generated graphs, data tables, and recorded solution conflicts when run. When resuming, the run journal is kept and everything else is rebuilt from it.
     """
     parser = argparse.ArgumentParser(description="Driver/main for my partition algorithm complexity experiment.", add_help=False)
     parser.add_argument('-h', '--help', action='help', default=argparse.SUPPRESS, help='Show this help message and exit. No files or folders will be created or deleted.')
     parser.add_argument('-c', '--clean', action='store_true', help="Clean then C binaries then exits. If used with --python, all __pycache__ will be cleaned as well.")
     parser.add_argument('-e', '--example', action='store_true', help="Output old/outdated example data downloaded from GitHub if online, or randomly generated data if offline. Will not attempt to compile C binaries.")
     parser.add_argument('-r', '--reduced', action='store_true', help="Run the reduced test suite. If used with --example will output example data of the reduced test suite.")
-    parser.add_argument('-p', '--python', action='store_true', help="Run the Python versions of the algorithms instead of the C versions. Will not attempt to compile C binaries.")
+    backend = parser.add_mutually_exclusive_group()
+    backend.add_argument('-p', '--python', action='store_true', help="Run the Python versions of the algorithms instead of the C versions. Will not attempt to compile C binaries.")
+    backend.add_argument('-n', '--numpy', action='store_true', help="Run the NumPy versions of the tabulated algorithms, and the Python versions of the rest, instead of the C versions. Will not attempt to compile C binaries.")
+    parser.add_argument('-b', '--bitset', action='store_true', help="Run the Python tabulated versions with a single rolling bitset row instead of the full table. Iteration counts are unchanged. Only used with --python.")
+    parser.add_argument('-o', '--counts-only', dest='countsOnly', action='store_true', help="Work out the iteration counts of the tabulated algorithms from the size of their table instead of filling it, only solving for the answer (with a rolling bitset) to check for disagreements. Their times and memory are not measured.")
+    parser.add_argument('-i', '--iterative', choices=[str(AlgoNames.NewMemoizedCrazy), str(AlgoNames.OldMemoizedCrazy), str(AlgoNames.MemoizedNormal), str(AlgoNames.RecursiveNormal)], nargs='*', default=None,
+                        help="Run the explicit stack versions of the given recursive algorithms instead of the recursive ones, or of all of them if none are given. Answers and iteration counts are unchanged. Only used with --python or --numpy.")
+    parser.add_argument('--preprocess', action='store_true', help="Run every set through a shared preprocessing stage before any algorithm gets it, which drops zeros, divides by the GCD, groups repeated absolute values, and answers sets with an odd sum or one integer bigger than the rest by itself. What it left of each set is saved to the data tables.")
+    parser.add_argument('--reprocess', action='store_true', help="Rebuild the data tables and graphs from the raw results of the last run instead of running anything. Uses the seed, grid and suite of the last run.")
+    parser.add_argument('-l', '--live', action='store_true', help="Refresh the data table and graphs every time an integer count finishes, instead of only once at the end. Graphs are always drawn in parallel.")
+    parser.add_argument('--resume', action='store_true', help="Resume the last run from its run journal instead of starting over, skipping every test it already finished. Uses the seed and grid of the last run, and every other option (along with the seed and grid, if given) must match it.")
+    parser.add_argument('-s', '--seed', type=int, default=None, help="The seed every randomized set is built from. Running again with the same seed and options rebuilds the exact same sets. If not given, a random seed is picked and printed.")
+    grid = parser.add_argument_group('grid', "The shape of the experiment. Anything not given comes from --grid if it was given, and from the default grid (or the journaled grid when resuming) if not.")
+    grid.add_argument('--grid', dest='gridFile', type=Path, default=None, metavar='FILE', help="A JSON file with any of the keys sizes, targets, repeats, maxMagnitude, tolerance and minRepeats, used the same as the options below.")
+    grid.add_argument('--sizes', type=int, nargs='+', default=None, help="Every set integer count to run. Defaults to 5 to 100 by 5.")
+    grid.add_argument('--targets', type=int, default=None, help="How many target indexes the absolute sums are evenly split into, from the smallest possible to the largest possible. Defaults to 21 (5%% apart).")
+    grid.add_argument('--repeats', type=int, default=None, help="How many sets each integer count and target index gets (or at most gets, with --tolerance). Defaults to 50.")
+    grid.add_argument('--max-magnitude', type=int, default=None, help="The largest absolute value any integer in a set can have. Defaults to 32767.")
+    grid.add_argument('--tolerance', type=float, default=None, help="Stop giving an integer count and target index more sets once the 95%% confidence interval of every algorithm's average iteration count is within this fraction of the average (like 0.05). Runs every repeat if not given.")
+    grid.add_argument('--min-repeats', type=int, default=None, help="How many sets each integer count and target index starts with when using --tolerance. Defaults to 10.")
     args = parser.parse_args()
+    args.grid = buildGrid(parser, args)
     if sys.platform == 'win32':
         from multiprocessing import freeze_support
         freeze_support()
@@ -124,36 +167,132 @@ def main():
             for path in Path('.').rglob('__pycache__'):
                 rmtree(path)
         sys.exit(0)
-    if not (args.python or args.example):
+    if not (args.python or args.numpy or args.example or args.reprocess):
         buildCLibrary(cParentDir)
     genFilesDir = Path(__file__).resolve().parent / "generated_files"
-    rmtree(genFilesDir, ignore_errors=True)
-    genFilesDir.mkdir(parents=True, exist_ok=True)
-    if not args.example:
+    journalPath = genFilesDir / "run_journal" / "RunJournal.jsonl"
+    storeDir = genFilesDir / "raw_results"
+    if args.reprocess:
+        if not RawResultsStore.exists(storeDir):
+            print("()~~}|[==>>--:>-      There are no raw results to reprocess. Terminating.          -<:--<<==]|{~~()")
+            sys.exit(1)
+        store = RawResultsStore(storeDir)
+        args.seed = store.meta["seed"]
+        args.grid = store.grid
+        args.reduced = store.meta["reduced"]
+        args.preprocess = store.meta["preprocess"]
+        for path in [genFilesDir / "graphs", genFilesDir / "data_tables"]: # Only what gets rebuilt is wiped, the disagreement record and journal are left alone.
+            rmtree(path, ignore_errors=True)
+    elif args.resume and not args.example:
+        header = RunJournal.readHeader(journalPath)
+        if header is None:
+            print("()~~}|[==>>--:>-       There is no run journal to resume from. Terminating.         -<:--<<==]|{~~()")
+            sys.exit(1)
+        if not RawResultsStore.exists(storeDir):
+            print("()~~}|[==>>--:>-  The run journal has no raw results to resume with. Terminating.  -<:--<<==]|{~~()")
+            sys.exit(1)
+        mismatched = RunJournal.mismatchedOptions(header, args)
+        if len(mismatched) != 0:
+            print(f"()~~}}|[==>>--:>- Options {', '.join(mismatched)} do not match the journaled run. Terminating. -<:--<<==]|{{~~()")
+            sys.exit(1)
+        args.seed = header["seed"]
+        args.grid = RunJournal.readGrid(header)
+        for path in genFilesDir.iterdir(): # Everything besides the journal and raw results gets rebuilt from them.
+            if path in (journalPath.parent, storeDir):
+                continue
+            if path.is_dir():
+                rmtree(path)
+            else:
+                path.unlink()
+    else:
+        if args.seed is None:
+            args.seed = np.random.SeedSequence().entropy
+        if args.grid is None:
+            args.grid = GridSpec()
+        rmtree(genFilesDir, ignore_errors=True)
+        genFilesDir.mkdir(parents=True, exist_ok=True)
+        if not args.example:
+            RunJournal.start(journalPath, args)
+            RawResultsStore.start(storeDir, args)
+    print(f"()~~}}|[==>>--:>- Seed for this run (rerun with --seed to repeat it): {args.seed} -<:--<<==]|{{~~()")
+    startTime = time.time()
+    if args.reprocess:
+        print("()~~}|[==>>--:>-     Reprocessing the raw results of the last run. Nothing is run.    -<:--<<==]|{~~()")
+    elif not args.example:
         print("()~~}|[==>>--:>-       Data collection has started. This will take a long time.      -<:--<<==]|{~~()")
-        startTime = time.time()
-    queue = Queue()
-    keepGoing = Event()
-    keepGoing.set()
-    try:
-        collector = Process(target=collectData, args=(queue, args))
-        processor = Process(target=processData, args=(queue, keepGoing, genFilesDir, args.reduced))
-    except KeyboardInterrupt:
-        keepGoing.clear()
-        sys.exit(1)
+    queue = Queue(maxsize=queueLimit)
+    if args.reprocess:
+        collector = Process(target=reprocessData, args=(queue, storeDir))
     else:
-        collector.start()
-        processor.start()
+        collector = Process(target=collectData, args=(queue, args, journalPath, storeDir))
+    processor = Process(target=processData, args=(queue, genFilesDir, args.reduced, args.grid, args.live, args.preprocess))
+    collector.start()
+    processor.start()
+    try:
         collector.join()
-        keepGoing.clear() # Signals end of work to the data processor.
-        print("()~~}|[==>>--:>-        Data collection has finished. Finishing up processing.       -<:--<<==]|{~~()")
+    except KeyboardInterrupt: # The collector got the Ctrl-C too, so it only needs waiting on while it shuts down its workers and sends off what it has.
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        collector.join()
+        print("()~~}|[==>>--:>-     Stopped early. Saving everything that was finished so far.     -<:--<<==]|{~~()")
         processor.join()
-        print("()~~}|[==>>--:>-      All processing has been completed. Program has completed.      -<:--<<==]|{~~()")
-        if not args.example:
-            hours, remainder = divmod(time.time() - startTime, 3600)
-            minutes = remainder / 60
-            print(f"()~~}}|[==>>--:>-               Execution took {int(hours):2} hours and {int(minutes):2} minutes.               -<:--<<==]|{{~~()")
-        sys.exit(0)
+        sys.exit(1)
+    if collector.exitcode < 0: # Killed outright, so it never got to send the end of stream marker itself.
+        queue.put(endOfStream)
+    print("()~~}|[==>>--:>-        Data collection has finished. Finishing up processing.       -<:--<<==]|{~~()")
+    processor.join()
+    print("()~~}|[==>>--:>-      All processing has been completed. Program has completed.      -<:--<<==]|{~~()")
+    if not args.example:
+        hours, remainder = divmod(time.time() - startTime, 3600)
+        minutes = remainder / 60
+        print(f"()~~}}|[==>>--:>-               Execution took {int(hours):2} hours and {int(minutes):2} minutes.               -<:--<<==]|{{~~()")
+    sys.exit(0 if collector.exitcode == 0 else 1)
+
+def buildGrid(parser: argparse.ArgumentParser, args) -> GridSpec | None:
+    """
+    Builds the grid of the experiment out of the grid file and grid options, with the options taking priority over the file. Any invalid grid ends the program with a usage error.
+
+    :param parser: The argument parser, used to report an invalid grid.
+    :param args: The parsed command line arguments.
+    :return: The grid, or None if no grid file or grid options were given.
+    """
+    fields = {}
+    if args.gridFile is not None:
+        try:
+            with open(args.gridFile, "r") as file:
+                config = json.load(file)
+        except (OSError, json.JSONDecodeError) as error:
+            parser.error(f"could not read grid file {args.gridFile}: {error}")
+        unknown = set(config) - {"sizes", "targets", "repeats", "maxMagnitude", "tolerance", "minRepeats"}
+        if len(unknown) != 0:
+            parser.error(f"unknown grid file keys: {', '.join(sorted(unknown))}")
+        fields = {name: config[key] for key, name in (("sizes", "Sizes"), ("targets", "TargetCount"), ("repeats", "Repeats"), ("maxMagnitude", "MaxMagnitude"), ("tolerance", "Tolerance"), ("minRepeats", "MinRepeats")) if key in config}
+    for value, name in ((args.sizes, "Sizes"), (args.targets, "TargetCount"), (args.repeats, "Repeats"), (args.max_magnitude, "MaxMagnitude"), (args.tolerance, "Tolerance"), (args.min_repeats, "MinRepeats")):
+        if value is not None:
+            fields[name] = value
+    if len(fields) == 0:
+        return None
+    if "Sizes" in fields:
+        fields["Sizes"] = tuple(fields["Sizes"])
+    grid = GridSpec(**fields)
+
+    if len(grid.Sizes) == 0 or min(grid.Sizes) < 1 or len(set(grid.Sizes)) != len(grid.Sizes):
+        parser.error("the grid sizes must be unique and at least 1")
+    if grid.TargetCount < 2:
+        parser.error("the grid needs at least 2 target indexes")
+    if grid.Repeats < 1:
+        parser.error("the grid needs at least 1 repeat")
+    if grid.Tolerance is not None and grid.Tolerance <= 0:
+        parser.error("the grid tolerance must be above 0")
+    if grid.Tolerance is not None and not 4 <= grid.MinRepeats <= grid.Repeats: # Any fewer and the confidence interval is too wide to mean anything.
+        parser.error("the grid min repeats must be at least 4 and at most the repeats")
+    if grid.MaxMagnitude < max(grid.Sizes): # Every integer in a set has a different absolute value, so there has to be enough of them to go around.
+        parser.error(f"the grid max magnitude must be at least the largest size ({max(grid.Sizes)})")
+    if grid.MaxMagnitude * max(grid.Sizes) > 2 ** 31 - 1: # The sets are int32, and so are the sums the C versions work with.
+        parser.error("the grid max magnitude times the largest size has to fit in a signed 32 bit int")
+    for size in grid.Sizes:
+        if not SetGenerator(size, 0, grid.TargetCount, grid.MaxMagnitude).canBuildEveryTarget():
+            parser.error(f"the grid max magnitude is too small to build sets of size {size} at the smallest and largest target indexes")
+    return grid
 
 def buildCLibrary(parentDir: Path):
     """
@@ -164,20 +303,21 @@ def buildCLibrary(parentDir: Path):
     targetDir = parentDir / "c_bin"
     sourceDir = parentDir / "c"
     filesToClean = []
-    for name in ["MemoizedNormal", "NewMemoizedCrazy", "OldMemoizedCrazy", "RecursiveNormal", "TabulatedCrazy", "TabulatedNormal"]:
+    for name in ["MemoizedNormal", "NewMemoizedCrazy", "OldMemoizedCrazy", "RecursiveNormal", "TabulatedCrazy", "TabulatedNormal", "MeetInMiddle"]:
         binary = next(targetDir.glob(f"_{name}.*.{'pyd' if os.name == 'nt' else 'so'}"), None)
-        srcFile = sourceDir / f"{name}.c"
-        if binary is None or srcFile.stat().st_mtime > binary.stat().st_mtime:
+        srcFiles = [sourceDir / f"{name}.c", sourceDir / "typedefs.h", sourceDir / "batch.h", sourceDir / "answerMap.h"]
+        if binary is None or max(srcFile.stat().st_mtime for srcFile in srcFiles) > binary.stat().st_mtime:
             ffibuilder = FFI()
             ffibuilder.cdef(""" 
                 typedef unsigned char uint8_t;
                             
                 typedef struct {
-                    int iterationCount;
+                    int64_t iterationCount;
                     uint8_t result;
                 } Output;
 
                 Output testIterations(int* inputList, int listLength);
+                void testIterationsBatch(int* flatLists, int* offsets, int numLists, Output* out);
             """)
 
             ffibuilder.set_source(
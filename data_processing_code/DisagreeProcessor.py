@@ -1,76 +1,84 @@
 """
-Processes algorithm result disagreements, with protections against race conditions.
+Processes algorithm result disagreements. Every disagreement is appended to a compact JSON lines log as soon as it arrives, and the readable Word document is only rendered once from that log at the very end.
 
 Made by bananathrowingmachine on Nov 27th, 2025
 """
-from data_processing_code.MiscDataCode import DisagreeData
+from data_processing_code.MiscDataCode import DisagreeData, AlgoNames
 
+from dataclasses import asdict
 from pathlib import Path
 from docx import Document
+import json
+
+officialNames = {AlgoNames.NewMemoizedCrazy: "New Memoized Crazy", AlgoNames.OldMemoizedCrazy: "Old Memoized Crazy", AlgoNames.MemoizedNormal: "Memoized Normal", AlgoNames.TabulatedCrazy: "Tabulated Crazy",
+                 AlgoNames.TabulatedNormal: "Tabulated Normal", AlgoNames.RecursiveNormal: "Recursive Normal", AlgoNames.MeetInMiddle: "Meet In The Middle"}
+docxLimit = 1000 # The most disagreements written out in full in the Word document. Any past this are only in the log, so an algorithm that disagrees on everything can't make rendering it take forever.
 
 class DisagreeProcessor:
     def __init__(self, genFilesDir: Path):
         """
-        Simple disagreement data processor object. Processes the data and stores it in a subdirectory of the one given to it during construction.
+        Simple disagreement data processor object. Keeps the log open for appending, and stores everything in a subdirectory of the one given to it during construction.
 
         :param genFilesDir: The directory for all generated files.
         """
         self.disagreeDir = genFilesDir / "solution_conflicts"
         self.disagreeDir.mkdir(parents=True, exist_ok=True)
+        self.logPath = self.disagreeDir / "DisagreementLog.jsonl"
+        self.logFile = open(self.logPath, "a")
 
-    @classmethod
-    def processBulkDisagreements(cls, genFilesDir: Path, dataInput: list[DisagreeData], idNum: int):
+    def appendDisagreements(self, dataInput: list[DisagreeData]):
         """
-        Processes a group of disagreements, and their associated data. 
+        Appends a group of disagreements to the end of the log, one line each. Nothing else is opened or rewritten, so this costs the same no matter how many came before.
 
-        :param genFilesDir: The directory for all generated files.
-        :param dataList: The list of each disagreement are the conditions were it arised in DisagreeData named tuple format.
-        :param idNum: The disagreement number. Starts at the number given and will increment by one for each given disagreement.
+        :param dataInput: The list of each disagreement and the conditions where it arose in DisagreeData format.
         """
-        processor = cls(genFilesDir)
         for disagreement in dataInput:
-            processor.processDisagreement(disagreement, idNum)
-            idNum += 1
+            self.logFile.write(json.dumps(asdict(disagreement)) + "\n")
+        self.logFile.flush()
 
-    @classmethod
-    def noDisagreements(cls, genFilesDir: Path):
+    def readLog(self) -> list[DisagreeData]:
+        """
+        :return: Every disagreement in the log, in the order they were recorded.
         """
-        Handles cases where there were no recorded disagreements.
+        with open(self.logPath, "r") as file:
+            return [DisagreeData(**json.loads(line)) for line in file if line.strip()]
 
-        :param genFilesDir: The directory for the generated file.
+    def renderRecord(self):
         """
-        directory = cls(genFilesDir)
+        Closes the log and renders the whole Word document from it in one go. If there were no disagreements the document just says so.
+        """
+        self.logFile.close()
+        disagreements = self.readLog()
         document = Document()
         document.add_heading("Complete Algorithms Disagreement Record")
-        document.add_heading("This document has all recorded instances where the different partition algorithms disagreed on the answer for a given set. It is procedurally generated as the experiment runs.", 3)
-        document.add_paragraph("There were no recorded disagreements throughout running the entire experiment. Therefore, there is nothing else here to see.")
-        document.save(directory.disagreeDir / "DisagreementRecord.docx")
+        document.add_heading("This document has all recorded instances where the different partition algorithms disagreed on the answer for a given set. It is procedurally generated from DisagreementLog.jsonl once the experiment finishes.", 3)
+        if len(disagreements) == 0:
+            document.add_paragraph("There were no recorded disagreements throughout running the entire experiment. Therefore, there is nothing else here to see.")
+        elif len(disagreements) > docxLimit:
+            document.add_paragraph(f"There were {len(disagreements)} recorded disagreements, so only the first {docxLimit} are shown here. Every one of them is in DisagreementLog.jsonl.")
+        for idNum, disagreement in enumerate(disagreements[:docxLimit], start=1):
+            self.processDisagreement(document, disagreement, idNum)
+        document.save(self.disagreeDir / "DisagreementRecord.docx")
 
-    def processDisagreement(self, data: DisagreeData, idNum: int):
+    @classmethod
+    def processDisagreement(cls, document, data: DisagreeData, idNum: int):
         """
-        Records any disagreement between the algorithms. Since the tested sets can get pretty big, all data besides the set is recorded on one txt file, and then it will point to the specific set that caused the disagreement.
-        Records will list which algorithms disagreed, the current set integer count, the current target index and it's associated sum, the current test number, and the actual set was tested.
+        Writes a single disagreement into the document. Records will list which algorithms disagreed, the current set integer count, the current target index and it's associated sum, the current test number, and the actual set was tested.
 
+        :param document: The Word document being rendered.
         :param data: All of the disagreement data, neatly packaged for use.
         :param idNum: The disagreement number.
         """
         xnor = data.AlgoOutputs
-        algoNames = ["New Memoized Crazy: ", ", Memoized Normal: " if len(xnor) != 2 else " and Old Memoized Crazy: ", 
-                     ", Tabulated Crazy: ", ("," if data.IntCount <= 25 else " and") + " Tabulated Normal: ", " and Recursive Normal: "]
-        try:
-            document = Document(self.disagreeDir / "DisagreementRecord.docx")
-        except FileNotFoundError:
-            document = Document()
-            document.add_heading("Complete Algorithms Disagreement Record")
-            document.add_heading("This document has all recorded instances where the different partition algorithms disagreed on the answer for a given set. It is procedurally generated as the experiment runs.", 3)
+        algoNames = [("" if i == 0 else " and " if i == len(xnor) - 1 else ", ") + officialNames[name] + ": " for i, name in enumerate(data.Algorithms)]
 
         document.add_paragraph().add_run(f"Disagreement number {idNum}:").bold = True
-        
+
         paragraph = document.add_paragraph()
         resultString = ""
         for i in range(len(xnor)):
             resultString += algoNames[i] + str(xnor[i])
-        
+
         paragraph.add_run(f"The results from each algorithm are; {resultString}.")
         paragraph.add_run().add_break()
         paragraph.add_run(f"The specific environment being tested when this disagreement occurred is shown below:").add_break()
@@ -84,6 +92,5 @@ class DisagreeProcessor:
         paragraph.add_run(f"The amount of integers per set was {data.IntCount}.").add_break()
         paragraph.add_run(f"The current target index was {data.TargetIndex} which corresponds to a target absolute sum of {data.TargetSum}.").add_break()
         paragraph.add_run(f"The specific set that was tested has a sum of {sum(data.CurrentList)}, and a absolute sum of {sum(map(abs, data.CurrentList))}. It is shown below:").add_break()
-        paragraph.add_run(f"{data.CurrentList}")
-    
-        document.save(self.disagreeDir / "DisagreementRecord.docx")
\ No newline at end of file
+        paragraph.add_run(f"{data.CurrentList}").add_break()
+        paragraph.add_run(f"The seed of the run was {data.Seed}, so this exact set can be rebuilt by running again with --seed {data.Seed}.")
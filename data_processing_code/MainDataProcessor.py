@@ -3,25 +3,35 @@ Processes all of the data into data tables and graphs.
 
 Made by bananathrowingmachine and Earthquakeshaker2 on Feb 16, 2026.
 """
-from data_processing_code.MiscDataCode import ResultsWrapper, DataProcessingInfo, AlgoNames
+from data_processing_code.MiscDataCode import ResultsWrapper, DataProcessingInfo, AlgoNames, MeasureNames, ReductionNames, GridSpec, confidenceSuffix, sampleCountField
+from concurrent.futures import ProcessPoolExecutor, Future
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import numpy as np
 import pandas as pd
 from pathlib import Path
 import matplotlib.pyplot as plt
 import matplotlib.ticker as ticker
-import sys
+import os, sys
 
 class MainDataProcessor:
     """
     Data processor class, that stores, saves, and handles all the data tables and graphs. Best if created once and appendData is called repeatedly.
     """
-    def __init__(self, genFilesDir: Path | None, presets: tuple[AlgoNames]):
+    def __init__(self, genFilesDir: Path | None, presets: tuple[AlgoNames], grid: GridSpec = GridSpec(), live: bool = False, preprocessed: bool = False):
         """
         Simple regular data processor object. Processes the data and stores it in subdirectories of the one given to it during construction.
 
         :param genFilesDir: The directory to store generated processed data in. Will create the sub directories for graphs and data tables if they do not exist. Will do nothing if given None.
         :param presets: Which presets to make frames for. Use the AlgoNames enum to tell the data processor which algorithm graphs/tables to generate. 
+        :param grid: The grid of the experiment, which decides the rows (integer counts) and columns (target indexes) of every frame.
+        :param live: If the data table and graphs should be refreshed every time a chunk of data comes in, instead of only once at the end.
+        :param preprocessed: If the sets went through the preprocessing stage, which gives each of its reductions a table.
         """
+        self.live = live
+        self.staleGraphs: set[str] = set() # Every frame that got new data since its graph was last drawn.
+        self.renderPool: ProcessPoolExecutor | None = None
+        self.pendingGraphs: dict[str, Future] = {}
         if genFilesDir is not None:
             self.graphsDir = genFilesDir / "graphs"
             self.tablesDir = genFilesDir / "data_tables"
@@ -32,12 +42,15 @@ class MainDataProcessor:
             self.graphsDir = None
             self.tablesDir = None
 
-        self.xValues = [i for i in range(5, 101, 5)]
-        self.yValues = [i for i in range(21)]
+        self.xValues = list(grid.Sizes)
+        self.yValues = [i for i in range(grid.TargetCount)]
+        sizeGaps = np.diff(sorted(self.xValues))
+        self.barDepth = 0.99 * (sizeGaps.min() if len(sizeGaps) != 0 else 5) # Keeps the bars of neighboring integer counts from touching, however far apart they are.
         
         self.algorithmData: dict[str, DataProcessingInfo] = {}
         if AlgoNames.TargetSum in presets: 
             self.algorithmData[AlgoNames.TargetSum] = DataProcessingInfo('Absolute Target Sum', pd.DataFrame(columns=self.yValues, index=self.xValues, dtype=np.int64), None, None)
+            self.algorithmData[sampleCountField] = DataProcessingInfo('Sample Count', pd.DataFrame(columns=self.yValues, index=self.xValues, dtype=np.int64), None, None)
         if AlgoNames.NewMemoizedCrazy in presets: 
             self.algorithmData[AlgoNames.NewMemoizedCrazy] = DataProcessingInfo('New Memoized Crazy', pd.DataFrame(columns=self.yValues, index=self.xValues, dtype=np.float64), (0.00, 0.40, 0.20), (0.00, 0.10, 0.05))
         if AlgoNames.OldMemoizedCrazy in presets: 
@@ -50,10 +63,26 @@ class MainDataProcessor:
             self.algorithmData[AlgoNames.TabulatedNormal] = DataProcessingInfo('Tabulated Normal', pd.DataFrame(columns=self.yValues, index=self.xValues, dtype=np.float64), (0.70, 0.00, 0.00), (0.10, 0.00, 0.00))            
         if AlgoNames.RecursiveNormal in presets: 
             self.algorithmData[AlgoNames.RecursiveNormal] = DataProcessingInfo('Recursive Normal', pd.DataFrame(columns=self.yValues, index=self.xValues, dtype=np.float64), (0.60, 0.00, 0.50), (0.10, 0.00, 0.08))
+        if AlgoNames.MeetInMiddle in presets: 
+            self.algorithmData[AlgoNames.MeetInMiddle] = DataProcessingInfo('Meet In The Middle', pd.DataFrame(columns=self.yValues, index=self.xValues, dtype=np.float64), (0.00, 0.60, 0.60), (0.00, 0.10, 0.10))
+
+        # Every algorithm also gets a frame for each measurement taken alongside its iteration count, using the same colors as its iteration count graph.
+        measureLabels = {MeasureNames.WallTime: ('Wall Time', 'Average Wall Time (ns)'), MeasureNames.CpuTime: ('CPU Time', 'Average CPU Time (ns)'), 
+                         MeasureNames.PeakMemory: ('Peak Memory', 'Average Peak Memory (bytes)')}
+        # The confidence interval of each average only gets a table, since a graph of it would look just like the iteration count graph.
+        for algoName in [name for name in self.algorithmData.keys() if name not in (AlgoNames.TargetSum, sampleCountField)]:
+            info = self.algorithmData[algoName]
+            for measureName, (officialSuffix, zLabel) in measureLabels.items():
+                self.algorithmData[algoName + measureName] = DataProcessingInfo(f'{info.OfficialName} {officialSuffix}', pd.DataFrame(columns=self.yValues, index=self.xValues, dtype=np.float64), 
+                                                                                info.BarColor, info.EdgeColor, zLabel)
+            self.algorithmData[algoName + confidenceSuffix] = DataProcessingInfo(f'{info.OfficialName} 95% CI', pd.DataFrame(columns=self.yValues, index=self.xValues, dtype=np.float64), None, None)
+        if preprocessed:
+            for reductionName, officialName in {ReductionNames.IntCount: 'Preprocessed Integer Count', ReductionNames.AbsSum: 'Preprocessed Absolute Sum', ReductionNames.Trivial: 'Preprocessed Answer Share'}.items():
+                self.algorithmData[reductionName] = DataProcessingInfo(officialName, pd.DataFrame(columns=self.yValues, index=self.xValues, dtype=np.float64), None, None)
 
     def appendData(self, results: ResultsWrapper) -> None:
         """
-        Appends a new chunk of data to the appropriate x rows for each algorithm in it's data frame.
+        Appends a new chunk of data to the appropriate x rows for each algorithm in it's data frame. In live mode the data table is then rewritten and every graph that changed starts redrawing in the background.
 
         :param data: The data to get processed, wrapped up with the x index and estimated exponential time value.
         """
@@ -62,10 +91,18 @@ class MainDataProcessor:
         
         for algoName in self.algorithmData.keys():
             if algoName == AlgoNames.RecursiveNormal and results.RecurseEstimate is not None:
-                yData = np.array([results.RecurseEstimate for _ in range(21)])
+                yData = np.array([results.RecurseEstimate for _ in self.yValues])
+            elif algoName not in rawData.dtype.names:
+                continue
             else:
                 yData = np.array([row[algoName] for row in rawData])
             self.algorithmData[algoName].DataFrame.loc[xIndex] = yData
+            self.staleGraphs.add(algoName)
+
+        if self.live and self.graphsDir is not None and sys.platform != 'win32':
+            self.outputTableData()
+            self.renderGraphs([algoName for algoName in self.algorithmData.keys() if algoName in self.staleGraphs])
+            self.staleGraphs.clear()
 
     def outputTableData(self) -> None:
         """
@@ -93,67 +130,136 @@ class MainDataProcessor:
 
     def outputImageData(self) -> list[plt.Figure]:
         """
-        Generates all of the images and files for the generated data. If a path is set during object construction, this method will save the figures to the path location.
-        In either case, a list of figures will be returned as well. 
+        Generates all of the images and files for the generated data. If a path is set during object construction, this method will save the figures to the path location, rendering them in parallel worker processes.
+        Only graphs whose data changed since they were last rendered get redrawn, so in live mode there is usually nothing left to do by the time this is called.
+        If no path was given (or on Windows, where every graph is shown interactively) the figures are drawn here one at a time instead, and returned as a list.
 
-        :return: A list of each figure generated.
+        :return: A list of each figure drawn in this process, which is empty when the graphs were rendered in parallel.
         """
+        self.outputTableData()
         output = []
-        for algoName in self.algorithmData.keys():
-            currFrame = self.algorithmData[algoName].DataFrame
-            currRealName = self.algorithmData[algoName].OfficialName
-
-            self.outputTableData()
-                
-            if algoName != AlgoNames.TargetSum:
-
-                # To show off the numbers increasing better, this code swaps the x and y axis, and then reverses the new x axis.
-                x, y = np.meshgrid(self.xValues, self.yValues)
-                dz = currFrame.T.to_numpy(dtype=float).ravel()
+        staleGraphs = [algoName for algoName in self.algorithmData.keys() if algoName in self.staleGraphs]
+        self.staleGraphs.clear()
+        if self.graphsDir is None or sys.platform == 'win32':
+            for algoName in staleGraphs:
+                info = self.algorithmData[algoName]
+                if not graphable(info):
+                    continue
                 fig = plt.figure()
-                ax = fig.add_subplot(111, projection = '3d')
-
-                if algoName == AlgoNames.RecursiveNormal: # Does all the special handling needed for the exponential time Recursive Normal algorithm.
-                    mask = x.ravel() > 25  
-
-                    xPre = x.ravel()[~mask]
-                    yPre = y.ravel()[~mask]
-                    dzPre = dz[~mask]
-                    xPost = x.ravel()[mask]
-                    yPost = y.ravel()[mask]
-                    dzPost = dz[mask]
-
-                    dzPreLog = np.log2(dzPre)
-                    dzPostLog = np.log2(dzPost)
-
-                    ax.bar3d(yPre, xPre, 1e-10 * np.ones_like(xPre), 0.95, 4.95, dzPreLog, color=self.algorithmData[algoName].BarColor, edgecolor=self.algorithmData[algoName].EdgeColor)  
-                    ax.bar3d(yPost, xPost, 1e-10 * np.ones_like(xPost), 0.95, 4.95, dzPostLog, color=self.algorithmData[algoName].BarColor, edgecolor=(0.40, 0.33, 0.00)) 
-                  
-                    scale = 10
-                    major_vals = [10, 100]
-                    major_locs = np.log2(major_vals) * scale
-                    major_labels = [r"$10^1$", r"$10^2$"]
-
-                    ax.set_zticks(major_locs)
-                    ax.set_zticklabels(major_labels)
-
-                else:
-                    ax.bar3d(y.ravel(), x.ravel(), np.ones_like(x.ravel()), 0.95, 4.95, dz, color = self.algorithmData[algoName].BarColor, edgecolor = self.algorithmData[algoName].EdgeColor)  
-                    ax.zaxis.set_major_formatter(ticker.ScalarFormatter(useMathText=True))
-                    ax.zaxis.set_major_formatter(ticker.FuncFormatter(lambda x, _: f"{x:.2e}"))
-                    ax.set_zlabel('Average Iteration Count', labelpad=28)
-                    ax.tick_params(axis='z', which='major', pad=14) 
-
-                ax.set_xlabel('Absolute Sum Target Index')  
-                ax.invert_xaxis()  
-                ax.set_ylabel('Set Integer Count')       
-                ax.set_title(f'{currRealName} Graph')
-
+                drawGraph(fig, algoName, info, self.xValues, self.yValues, self.barDepth)
                 if self.graphsDir != None:
                     # Shows the interactive plot window for my friend helping me, who is on windows.
-                    if sys.platform == 'win32': plt.show()
-                    plt.savefig(self.graphsDir / f'{currRealName} Graph.png')  
+                    plt.show()
+                    plt.savefig(self.graphsDir / f'{info.OfficialName} Graph.png')  
                     plt.close()
-                output.append(plt.gcf())
+                output.append(fig)
+            return output
+
+        self.renderGraphs(staleGraphs)
+        for future in self.pendingGraphs.values():
+            future.result()
+        self.pendingGraphs.clear()
+        if self.renderPool is not None:
+            self.renderPool.shutdown()
+            self.renderPool = None
+        return output
+
+    def renderGraphs(self, algoNames: list[str]) -> None:
+        """
+        Hands the graphs of the given frames off to the render pool, starting the pool the first time it is needed. Doesn't wait for them to finish.
+        Any graph still rendering from an earlier chunk is waited on first, so that an older version can never overwrite a newer one.
+
+        :param algoNames: The names of the frames to redraw.
+        """
+        jobs = [algoName for algoName in algoNames if graphable(self.algorithmData[algoName])]
+        if len(jobs) == 0:
+            return
+        if self.renderPool is None:
+            self.renderPool = ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(jobs)))
+        for algoName in jobs:
+            if algoName in self.pendingGraphs:
+                self.pendingGraphs.pop(algoName).result()
+            info = self.algorithmData[algoName]
+            self.pendingGraphs[algoName] = self.renderPool.submit(saveGraph, algoName, info, self.xValues, self.yValues, self.barDepth, self.graphsDir / f'{info.OfficialName} Graph.png')
+
+def graphable(info: DataProcessingInfo) -> bool:
+    """
+    Checks if a frame gets a graph at all. Frames without colors are table only, and measurements are all nan when nothing was measured, like with example output.
+
+    :param info: The frame and its graph details.
+    :return: If the frame should be graphed.
+    """
+    return info.BarColor is not None and not info.DataFrame.isna().all(axis=None)
+
+def saveGraph(algoName: str, info: DataProcessingInfo, xValues: list[int], yValues: list[int], barDepth: float, savePath: Path) -> Path:
+    """
+    Draws a single graph and saves it, without ever touching pyplot, so that it can run in a worker process on the Agg renderer no matter what backend the main process picked.
+
+    :param algoName: The name of the frame being graphed.
+    :param info: The frame and its graph details.
+    :param xValues: The integer counts of every row.
+    :param yValues: The target indexes of every column.
+    :param barDepth: How deep each bar is along the integer count axis.
+    :param savePath: Where to save the png.
+    :return: Where the png was saved.
+    """
+    fig = Figure()
+    FigureCanvasAgg(fig)
+    drawGraph(fig, algoName, info, xValues, yValues, barDepth)
+    fig.savefig(savePath)
+    return savePath
+
+def drawGraph(fig: Figure, algoName: str, info: DataProcessingInfo, xValues: list[int], yValues: list[int], barDepth: float) -> None:
+    """
+    Draws the 3D bar graph of a frame onto a figure.
+
+    :param fig: The figure to draw on.
+    :param algoName: The name of the frame being graphed, since Recursive Normal is drawn on a log scale.
+    :param info: The frame and its graph details.
+    :param xValues: The integer counts of every row.
+    :param yValues: The target indexes of every column.
+    :param barDepth: How deep each bar is along the integer count axis.
+    """
+    # To show off the numbers increasing better, this code swaps the x and y axis, and then reverses the new x axis.
+    x, y = np.meshgrid(xValues, yValues)
+    dz = info.DataFrame.T.to_numpy(dtype=float).ravel()
+    ax = fig.add_subplot(111, projection = '3d')
+
+    if algoName == AlgoNames.RecursiveNormal: # Does all the special handling needed for the exponential time Recursive Normal algorithm.
+        mask = x.ravel() > 25  
+
+        xPre = x.ravel()[~mask]
+        yPre = y.ravel()[~mask]
+        dzPre = dz[~mask]
+        xPost = x.ravel()[mask]
+        yPost = y.ravel()[mask]
+        dzPost = dz[mask]
+
+        dzPreLog = np.log2(dzPre)
+        dzPostLog = np.log2(dzPost)
+
+        if len(xPre) != 0: # Either side can be empty, depending on the integer counts in the grid.
+            ax.bar3d(yPre, xPre, 1e-10 * np.ones_like(xPre), 0.95, barDepth, dzPreLog, color=info.BarColor, edgecolor=info.EdgeColor)  
+        if len(xPost) != 0:
+            ax.bar3d(yPost, xPost, 1e-10 * np.ones_like(xPost), 0.95, barDepth, dzPostLog, color=info.BarColor, edgecolor=(0.40, 0.33, 0.00)) 
+      
+        scale = 10
+        major_vals = [10, 100]
+        major_locs = np.log2(major_vals) * scale
+        major_labels = [r"$10^1$", r"$10^2$"]
+
+        ax.set_zticks(major_locs)
+        ax.set_zticklabels(major_labels)
+
+    else:
+        measured = ~np.isnan(dz) # Recursive Normal's measurements and everything of Meet In The Middle are nan past where they stop being run.
+        ax.bar3d(y.ravel()[measured], x.ravel()[measured], np.ones_like(x.ravel()[measured]), 0.95, barDepth, dz[measured], color = info.BarColor, edgecolor = info.EdgeColor)  
+        ax.zaxis.set_major_formatter(ticker.ScalarFormatter(useMathText=True))
+        ax.zaxis.set_major_formatter(ticker.FuncFormatter(lambda x, _: f"{x:.2e}"))
+        ax.set_zlabel(info.ZLabel, labelpad=28)
+        ax.tick_params(axis='z', which='major', pad=14) 
 
-        return output
\ No newline at end of file
+    ax.set_xlabel('Absolute Sum Target Index')  
+    ax.invert_xaxis()  
+    ax.set_ylabel('Set Integer Count')       
+    ax.set_title(f'{info.OfficialName} Graph')
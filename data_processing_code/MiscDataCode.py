@@ -21,21 +21,45 @@ class AlgoNames(StrEnum):
     TabulatedCrazy = 'tabCrazy'
     TabulatedNormal = 'tabNormal'
     RecursiveNormal = 'recurseNormal'
+    MeetInMiddle = 'meetInMiddle'
+
+class MeasureNames(StrEnum):
+    """
+    A enum of each of the measurements taken alongside the iteration count of every test. The results field of a measurement is the algorithm name followed by the measurement name, like 'memoNormalWallTime'.
+    """
+    WallTime = 'WallTime'
+    CpuTime = 'CpuTime'
+    PeakMemory = 'PeakMemory'
+
+class ReductionNames(StrEnum):
+    """
+    A enum of each of the reductions the preprocessing stage reports for every test. The results field of each is its average over every test, so the trivial field is the share of sets answered without running any algorithm.
+    """
+    IntCount = 'reducedIntCount'
+    AbsSum = 'reducedAbsSum'
+    Trivial = 'trivial'
+
+confidenceSuffix = 'CiHalfWidth' # The results field of a confidence interval is the algorithm name followed by this, like 'memoNormalCiHalfWidth'.
+sampleCountField = 'sampleCount' # The results field of how many tests the averages of a target index are over, which is the same for every algorithm.
+
+FullSuite = (AlgoNames.NewMemoizedCrazy, AlgoNames.MemoizedNormal, AlgoNames.TabulatedCrazy, AlgoNames.TabulatedNormal, AlgoNames.RecursiveNormal, AlgoNames.MeetInMiddle) # Every algorithm of the full test suite, in the order their results are stored.
+SpeedySuite = (AlgoNames.NewMemoizedCrazy, AlgoNames.OldMemoizedCrazy) # The same for the reduced test suite.
 
 FullResultsDType = np.dtype([
-    (AlgoNames.TargetSum, np.uint32),
-    (AlgoNames.NewMemoizedCrazy, np.float64), 
-    (AlgoNames.MemoizedNormal, np.float64), 
-    (AlgoNames.TabulatedCrazy, np.float64),
-    (AlgoNames.TabulatedNormal, np.float64), 
-    (AlgoNames.RecursiveNormal, np.float64) 
-])
+    (AlgoNames.TargetSum, np.uint64),
+    (sampleCountField, np.uint32),
+] + [(algoName, np.float64) for algoName in FullSuite]
+  + [(algoName + measureName, np.float64) for algoName in FullSuite for measureName in MeasureNames]
+  + [(algoName + confidenceSuffix, np.float64) for algoName in FullSuite]
+  + [(reductionName, np.float64) for reductionName in ReductionNames])
 
 SpeedyResultsDType = np.dtype([
-    (AlgoNames.TargetSum, np.uint32),
-    (AlgoNames.NewMemoizedCrazy, np.float64), 
-    (AlgoNames.OldMemoizedCrazy, np.float64), 
-])
+    (AlgoNames.TargetSum, np.uint64),
+    (sampleCountField, np.uint32),
+] + [(algoName, np.float64) for algoName in SpeedySuite]
+  + [(algoName + measureName, np.float64) for algoName in SpeedySuite for measureName in MeasureNames]
+  + [(algoName + confidenceSuffix, np.float64) for algoName in SpeedySuite]
+  + [(reductionName, np.float64) for reductionName in ReductionNames])
 
 MachinePredResultsDType = np.dtype([
     (AlgoNames.NewMemoizedCrazy, np.float64), 
@@ -46,13 +70,48 @@ MachinePredResultsDType = np.dtype([
 
 UnionDType = Union[FullResultsDType, SpeedyResultsDType, MachinePredResultsDType]
 
+answerSuffix = 'Answer' # The raw results field of an answer is the algorithm name followed by this, like 'memoNormalAnswer'.
+
+def rawResultsDType(algorithms: list[AlgoNames], preprocessed: bool = False) -> np.dtype:
+    """
+    Builds the dtype of a raw results shard, which has a row for every single test instead of the averages. Each algorithm gets its iteration count, its answer (1 for true, 0 for false, and -1 if unknown) and a field for each measurement.
+    Preprocessed runs also get what the preprocessing stage left of each set, and a 1 in the trivial field if it answered the set by itself.
+
+    :param algorithms: The algorithms that were run, in the order their fields should be in.
+    :param preprocessed: If the sets went through the preprocessing stage.
+    :return: The dtype of each row.
+    """
+    fields = [('size', np.uint16), ('targetIndex', np.uint16), ('testNum', np.uint32), (str(AlgoNames.TargetSum), np.uint64)] # Plain strings, since the enum names can't be read back out of a .npy header.
+    for algoName in algorithms:
+        fields += [(str(algoName), np.uint64), (algoName + answerSuffix, np.int8)] + [(algoName + measureName, np.float64) for measureName in MeasureNames]
+    if preprocessed:
+        fields += [(str(ReductionNames.IntCount), np.uint16), (str(ReductionNames.AbsSum), np.uint64), (str(ReductionNames.Trivial), np.uint8)]
+    return np.dtype(fields)
+
+def confidenceHalfWidths(results: np.ndarray) -> np.ndarray:
+    """
+    Finds the half width of the 95% confidence interval of the average of each column, using the Student's t distribution since there are often only a handful of tests.
+    The t value comes from a Cornish-Fisher expansion around the normal distribution, which is within 0.15% of the exact value from 3 degrees of freedom up (and far closer as they grow), so no stats library is needed.
+
+    :param results: The iteration counts of every test so far, with a row per test and a column per algorithm.
+    :return: The half width of each column's confidence interval, or nan for every column if there is only a single test.
+    """
+    count = len(results)
+    if count < 2:
+        return np.full(results.shape[1], np.nan)
+    dof = count - 1
+    z = 1.959963984540054
+    t = (z + (z**3 + z) / (4 * dof) + (5 * z**5 + 16 * z**3 + 3 * z) / (96 * dof**2) + (3 * z**7 + 19 * z**5 + 17 * z**3 - 15 * z) / (384 * dof**3)
+         + (79 * z**9 + 776 * z**7 + 1482 * z**5 - 1920 * z**3 - 945 * z) / (92160 * dof**4))
+    return t * np.std(results.astype(np.float64), axis=0, ddof=1) / np.sqrt(count)
+
 @dataclass(frozen=True)
 class ResultsWrapper:
     """
     A helpful wrapper with the current chunk of results and a few other helpful pieces of information.
     """
     IntCount: int
-    RecurseEstimate: int
+    RecurseEstimate: float | None
     RawData: np.ndarray = field(default_factory=lambda: np.empty(21, dtype=UnionDType))
 
 @dataclass(frozen=True)
@@ -66,6 +125,63 @@ class DisagreeData:
     TestNum: int
     TargetSum: int
     CurrentList: list[int]
+    Seed: int
+    Algorithms: list[str] # The name of the algorithm behind each answer, in the same order.
+
+@dataclass(frozen=True)
+class GridSpec:
+    """
+    The shape of the whole experiment, which is every set integer count that gets run, how many target indexes the absolute sums are split into, how many sets each (integer count, target index) pair gets, and the largest absolute value an integer can have.
+    The defaults are the original experiment, integer counts 5 to 100 by 5, 21 target indexes (5% apart), 50 sets each, and integers up to the signed 16 bit int limit.
+    If given a tolerance, each (integer count, target index) pair instead starts with MinRepeats sets and only gets more (up to Repeats) until the 95% confidence interval of every algorithm's average iteration count is within that fraction of the average.
+    """
+    Sizes: tuple[int, ...] = tuple(range(5, 101, 5))
+    TargetCount: int = 21
+    Repeats: int = 50
+    MaxMagnitude: int = 32767
+    Tolerance: float | None = None
+    MinRepeats: int = 10
+
+@dataclass(frozen=True)
+class TestResult:
+    """
+    What a worker gives back after running an algorithm on a single set. The times are in nanoseconds, and the peak memory is how many bytes the worker grew by while running it.
+    """
+    IterationCount: int
+    Result: bool
+    WallTime: float
+    CpuTime: float
+    PeakMemory: float
+
+@dataclass(frozen=True)
+class Reduction:
+    """
+    What the preprocessing stage did to a single set. A set it could answer by itself has nothing left for the algorithms, so its integer count and absolute sum are both 0.
+    """
+    IntCount: int
+    AbsSum: int
+    Divisor: int
+    Answer: bool | None # The answer if the set never needed solving, or None if it still goes to the algorithm.
+
+@dataclass(frozen=True)
+class TestJob:
+    """
+    A single algorithm being run on a single set, which is the smallest piece of work handed to the worker pool. The set itself is not included, since the worker rebuilds it from its coordinates.
+    """
+    IntCount: int
+    TargetIndex: int
+    TestNum: int
+    Algorithm: AlgoNames
+    ExpectedCost: float
+
+@dataclass(frozen=True)
+class BatchJob:
+    """
+    A group of jobs for the same algorithm that get solved by a single call to a worker, used when each job alone would be too cheap to be worth sending to the pool.
+    """
+    Algorithm: AlgoNames
+    Jobs: tuple[TestJob, ...]
+    ExpectedCost: float
 
 @dataclass()
 class DataProcessingInfo:
@@ -74,5 +190,6 @@ class DataProcessingInfo:
     """
     OfficialName: str
     DataFrame: pd.DataFrame
-    BarColor: tuple[float, float, float]
-    EdgeColor: tuple[float, float, float]
\ No newline at end of file
+    BarColor: tuple[float, float, float] | None # Frames with no colors only get a table, not a graph.
+    EdgeColor: tuple[float, float, float] | None
+    ZLabel: str = 'Average Iteration Count'
@@ -3,51 +3,17 @@ Runs an experiment of integer count size for all versions of the algorithm.
 
 Written by bananathrowingmachine, Feb 16, 2026.
 """
-from data_processing_code.MiscDataCode import FullResultsDType, SpeedyResultsDType, DisagreeData, AlgoNames
-import concurrent.futures as ThreadPool
-from multiprocessing import Manager
+from data_processing_code.MiscDataCode import FullResultsDType, SpeedyResultsDType, FullSuite, SpeedySuite, DisagreeData, AlgoNames, MeasureNames, TestJob, BatchJob, TestResult, GridSpec, ReductionNames, confidenceSuffix, confidenceHalfWidths, rawResultsDType, answerSuffix, sampleCountField
+from experiment_code.TaskScheduler import TaskScheduler
+from experiment_code.SetGenerator import SetGenerator
+from experiment_code.RunJournal import RunJournal
+from experiment_code.RawResultsStore import RawResultsStore
+from experiment_code.Preprocessor import preprocess
+from typing import Iterator
 import numpy as np
 from enum import IntEnum
 import pandas as pd
 
-def worker(taskName: AlgoNames, testList: list[int], runPython: bool) -> tuple[int, bool]:
-    """
-    Worker function for the threads so that python can pickle everything.
-    
-    :param taskName: The name of the task
-    :type taskName: str
-    :param testList: The list to be tested
-    :type testList: list[int]
-    :param runPython: Boolean on running the Python versions instead of the C versions
-    :type runPython: bool
-    :return: The result of the experiment, with the iteration count and then if the list is partitionable
-    :rtype: tuple[int, bool]
-    """
-    if runPython: # luckily python only imports stuff once and then just reuses the pointers
-        from experiment_code.versions.python.MemoizedNormal import MemoizedNormal
-        from experiment_code.versions.python.OldMemoizedCrazy import OldMemoizedCrazy
-        from experiment_code.versions.python.NewMemoizedCrazy import NewMemoizedCrazy
-        import experiment_code.versions.python.TabulatedCrazy as TabulatedCrazy
-        import experiment_code.versions.python.TabulatedNormal as TabulatedNormal
-        from experiment_code.versions.python.RecursiveNormal import RecursiveNormal
-    else:
-        from experiment_code.versions.c_bin._MemoizedNormal import lib as MemoizedNormal
-        from experiment_code.versions.c_bin._OldMemoizedCrazy import lib as OldMemoizedCrazy
-        from experiment_code.versions.c_bin._NewMemoizedCrazy import lib as NewMemoizedCrazy
-        from experiment_code.versions.c_bin._TabulatedCrazy import lib as TabulatedCrazy
-        from experiment_code.versions.c_bin._TabulatedNormal import lib as TabulatedNormal
-        from experiment_code.versions.c_bin._RecursiveNormal import lib as RecursiveNormal
-        from experiment_code.versions.c_bin._NewMemoizedCrazy import ffi
-        testList = ffi.new("int[]", testList)
-
-    registry = {AlgoNames.NewMemoizedCrazy: NewMemoizedCrazy, AlgoNames.OldMemoizedCrazy: OldMemoizedCrazy, AlgoNames.MemoizedNormal: MemoizedNormal, 
-                AlgoNames.TabulatedCrazy: TabulatedCrazy, AlgoNames.TabulatedNormal: TabulatedNormal, AlgoNames.RecursiveNormal: RecursiveNormal}
-
-    if runPython:
-        return registry[taskName].testIterations(testList) 
-    result = registry[taskName].testIterations(testList, len(testList)) 
-    return (int(result.iterationCount), bool(result.result))
-
 class OutLevel(IntEnum):
     """
     An enum for the console output level of the complexity tester. Each level will output what is describe as well as what is before it.
@@ -66,78 +32,184 @@ class OutLevel(IntEnum):
     """
     BATCH = 3
     """
-    Will output each time the next batch of 4 algorithms has started or finished testing.
+    Will output each time the next set has started or finished testing with every algorithm.
     """
     ALL = 4
     """
     Will output each time a single algorithm has finished testing.
     """
 
+batchCostLimit = 2 ** 22 # The most expected work a batch of C jobs can have before the per set call and pickling overhead stops mattering.
+meetInMiddleLimit = 40 # The largest integer count Meet In The Middle is run on, since each half of a bigger set has over a million subset sums to hold in memory.
+
 class ComplexityExperiment:
     """
     Class for running a complexity experiment. Not desinged for each class to be called seperately however some are more detachable than others but I give you 0 promises on any functionality outside of running it the expected way.
-    To run it the expected way, call class method testProblemSize, and give it an integer that says how many integers should be in a randomized set given to each algorithm.
+    To run it the expected way, call class method testProblemSizes, and give it a list of integers that say how many integers should be in a randomized set given to each algorithm.
     """
-    def __init__(self, size: int, outLevel: OutLevel, inputArgs):
+    def __init__(self, size: int, outLevel: OutLevel, inputArgs, journal: RunJournal | None = None):
         """
-        Experiment setup. Finds the sets of size n with the smallest possible and largest possible (with signed 32 bit int limit being the largest number added) absolute sums. Then finds the size each targetIndex should be.
-        Designed to be run by calling the class method testProblemSize.
+        Experiment setup. Makes the set generator for size n, which finds the sets with the smallest possible and largest possible (with signed 16 bit int limit being the largest number added) absolute sums, and the size each targetIndex should be.
+        Designed to be run by calling the class method testProblemSizes.
 
         :param size: The amount of integers that should be in each set.
         :param outLevel: The amount of console output the app should produce. I don't plan on making this modifiable by user input.
+        :param inputArgs: The command line arguments passed when the program started.
+        :param journal: The journal every finished test gets recorded in. Nothing gets recorded if given None.
         """
         self.runRecurse = size <= 25
+        self.runMeetInMiddle = size <= meetInMiddleLimit
         self.setCount = size
-        self.sumSizeTarget = [None for _ in range(21)]
-        self.sumSizeBound = self.findAbsSumBounds() # The maximum allowed difference between the predetermined absolute sum (self.sumSize[i]) and the actual absolute sum.
-        self.intSizeBound = round(self.sumSizeBound/self.setCount)
+        self.grid: GridSpec = inputArgs.grid
+        self.generator = SetGenerator(size, inputArgs.seed, self.grid.TargetCount, self.grid.MaxMagnitude)
+        self.sumSizeTarget = self.generator.sumSizeTarget
+        self.sumSizeBound = self.generator.sumSizeBound # The maximum allowed difference between the predetermined absolute sum (self.sumSize[i]) and the actual absolute sum.
+        self.intSizeBound = self.generator.intSizeBound
         self.disagreeList: list[DisagreeData] = []
-        self.disagreeLock = Manager().Lock()
         self.runReduced = inputArgs.reduced
-        self.runPython = inputArgs.python
+        self.runPython = inputArgs.python or inputArgs.numpy
+        self.countsOnly = inputArgs.countsOnly
+        self.preprocess = inputArgs.preprocess
         self.outputLevel = outLevel
+        self.random = self.generator.stream() # Only used to make up example output.
         if self.runReduced:
             self.tasks = [AlgoNames.OldMemoizedCrazy]
         else:
             self.tasks = [AlgoNames.MemoizedNormal, AlgoNames.TabulatedCrazy, AlgoNames.TabulatedNormal]
             if self.runRecurse:
                 self.tasks.append(AlgoNames.RecursiveNormal)
+            if self.runMeetInMiddle:
+                self.tasks.append(AlgoNames.MeetInMiddle)
         self.tasks.append(AlgoNames.NewMemoizedCrazy)
+        self.resultOrder = list(SpeedySuite if self.runReduced else FullSuite)
+        self.allRegResults = np.zeros(self.grid.TargetCount, dtype=SpeedyResultsDType if self.runReduced else FullResultsDType)
+        for name in self.allRegResults.dtype.names: # Anything never measured (like the example output) stays as nan.
+            if self.allRegResults.dtype[name].kind == 'f':
+                self.allRegResults[name] = np.nan
+        self.testResults = np.zeros((self.grid.TargetCount, self.grid.Repeats, len(self.resultOrder)), dtype=np.uint64)
+        self.testMeasures = np.full((self.grid.TargetCount, self.grid.Repeats, len(self.resultOrder), len(MeasureNames)), np.nan)
+        self.testAnswers = np.full((self.grid.TargetCount, self.grid.Repeats, len(self.resultOrder)), -1, dtype=np.int8)
+        self.testReductions = np.full((self.grid.TargetCount, self.grid.Repeats, len(ReductionNames)), np.nan) # Only filled in when preprocessing.
+        self.testLists: dict[tuple[int, int], np.ndarray] = {}
+        self.pendingResults: dict[tuple[int, int], dict[AlgoNames, tuple[int, bool]]] = {}
+        self.adaptive = self.grid.Tolerance is not None
+        self.testsRun = [self.grid.MinRepeats if self.adaptive else self.grid.Repeats for _ in range(self.grid.TargetCount)] # How many tests each target index needs, which only grows when adaptive.
+        self.testsScheduled = [0 for _ in range(self.grid.TargetCount)]
+        self.testsDone = [0 for _ in range(self.grid.TargetCount)]
+        self.extended = False # If a target index needs more tests that haven't been turned into jobs yet.
+        self.indicesLeft = self.grid.TargetCount
+        self.journal = journal
 
     @classmethod
-    def testProblemSize(cls, size: int, inputArgs, sheets: list[pd.DataFrame] | None = None) -> tuple[np.ndarray, list[DisagreeData]]:
+    def testProblemSizes(cls, sizes: list[int], inputArgs, scheduler: TaskScheduler | None = None, sheets: list[pd.DataFrame] | None = None, journal: RunJournal | None = None, 
+                         store: RawResultsStore | None = None) -> Iterator[tuple[int, np.ndarray, list[DisagreeData]]]:
         """
-        In a simple TLDR sense, will run a experiment (or example of one).
+        In a simple TLDR sense, will run a experiment (or example of one) for every size given. 
+        Every test of every size is given to the scheduler at once, so the results of a size are given back as soon as its last test finishes, which is not always in the order the sizes were given.
+        If given a journal, every test already recorded in it is skipped, and every size already recorded in it is given back right away without running anything.
 
-        :param size: The amount of seperate integers should be in a set sent to the algorithms. Commonly referred to as size. Stays constant throughtout a single class of the method.
+        :param sizes: The amounts of seperate integers that should be in a set sent to the algorithms. Each one is commonly referred to as size.
         :param inputArgs: The command line arguments passed when the program started.
+        :param scheduler: The task scheduler that owns the shared worker pool. Not used if generating example output.
         :param sheets: The list of data frames generated by pandas for use by the sample output generator. Not used if running the actual experiment.
-        :return: A numpy array where each column is [targetSum], [newMemoCrazy], [memoNormal], [tabCrazy], [tabNormal], and [recurseNormal] named in that order and the list of all recorded disagreements between algorithms.
+        :param journal: The journal to record finished tests and sizes in, and to resume from. Not used if generating example output.
+        :param store: The raw results store every test of a finished size is saved to. Not used if generating example output.
+        :return: An iterator of the size, a numpy array where each column is [targetSum], [newMemoCrazy], [memoNormal], [tabCrazy], [tabNormal], [recurseNormal], and [meetInMiddle] named in that order, and the list of all recorded disagreements between algorithms for that size.
         """
         if inputArgs.example:
             yapLevel = OutLevel.NONE
         elif inputArgs.reduced:
-            if inputArgs.python:
+            if inputArgs.python or inputArgs.numpy:
                 yapLevel = OutLevel.SUM
             else:
                 yapLevel = OutLevel.SUITE
-        elif not inputArgs.python:
+        elif not (inputArgs.python or inputArgs.numpy):
             yapLevel = OutLevel.BATCH
         else:
             yapLevel = OutLevel.ALL
-        experiment = cls(size, yapLevel, inputArgs)
-        allRegResults = np.empty(21, dtype=SpeedyResultsDType) if inputArgs.reduced else np.empty(21, dtype=FullResultsDType)
-        if experiment.outputLevel >= OutLevel.SUITE: print(f"|[==>>--:>-  Started entire test suite for set integer count {size:3}. This will take awhile.  -<:--<<==]|")
-        for targetIndex in range(21):
-            r = experiment.generateSampleOutput(targetIndex, sheets) if inputArgs.example else experiment.runSingleSize(targetIndex)
-            allRegResults[targetIndex] = (experiment.sumSizeTarget[targetIndex], r[0], r[1]) if inputArgs.reduced else (experiment.sumSizeTarget[targetIndex], r[0], r[1], r[2], r[3], r[4])
-        
-        if experiment.outputLevel >= OutLevel.SUITE: 
-            print(f"|[==>>--:>- Finished entire test suite for set integer count {size:3}. Results have been sent. -<:--<<==]|")
-            print("|[==>>--:>- ============================================================================= -<:--<<==]|")
-        return allRegResults, experiment.disagreeList
+
+        if inputArgs.example:
+            for size in sizes:
+                experiment = cls(size, yapLevel, inputArgs)
+                for targetIndex in range(experiment.grid.TargetCount):
+                    experiment.recordAverages(targetIndex, experiment.generateSampleOutput(targetIndex, sheets))
+                yield size, experiment.allRegResults, experiment.disagreeList
+            return
+
+        experiments: dict[int, ComplexityExperiment] = {}
+        for size in sizes:
+            experiment = cls(size, yapLevel, inputArgs, journal)
+            if journal is not None and size in journal.finishedSizes:
+                experiment.replaySize()
+                if yapLevel >= OutLevel.SUITE: print(f"|[==>>--:>-  Resumed entire test suite for set integer count {size:3} from the run journal.   -<:--<<==]|")
+                yield size, experiment.allRegResults, experiment.disagreeList
+                continue
+            if journal is not None and experiment.replayTests():
+                if store is not None:
+                    store.writeShard(size, experiment.rawRecords())
+                journal.recordSize(size, experiment.allRegResults)
+                yield size, experiment.allRegResults, experiment.disagreeList
+                continue
+            experiments[size] = experiment
+            scheduler.addJobs(experiment.buildJobs())
+            if yapLevel >= OutLevel.SUITE: print(f"|[==>>--:>-  Started entire test suite for set integer count {size:3}. This will take awhile.  -<:--<<==]|")
+
+        for job, result in scheduler.results():
+            experiment = experiments[job.IntCount]
+            sizeFinished = experiment.recordResult(job, result)
+            if experiment.extended:
+                scheduler.addJobs(experiment.buildJobs())
+            if sizeFinished:
+                if experiment.outputLevel >= OutLevel.SUITE: 
+                    print(f"|[==>>--:>- Finished entire test suite for set integer count {job.IntCount:3}. Results have been sent. -<:--<<==]|")
+                    print("|[==>>--:>- ============================================================================= -<:--<<==]|")
+                if store is not None: # Written before the size is journaled, so every journaled size always has its shard.
+                    store.writeShard(job.IntCount, experiment.rawRecords())
+                if journal is not None:
+                    journal.recordSize(job.IntCount, experiment.allRegResults)
+                yield job.IntCount, experiment.allRegResults, experiment.disagreeList
+                del experiments[job.IntCount]
+
+    @classmethod
+    def testProblemSize(cls, size: int, inputArgs, scheduler: TaskScheduler | None = None, sheets: list[pd.DataFrame] | None = None) -> tuple[np.ndarray, list[DisagreeData]]:
+        """
+        Runs a experiment (or example of one) for a single size. Simply a wrapper around testProblemSizes.
+
+        :param size: The amount of seperate integers should be in a set sent to the algorithms. Commonly referred to as size.
+        :param inputArgs: The command line arguments passed when the program started.
+        :param scheduler: The task scheduler that owns the shared worker pool. Not used if generating example output.
+        :param sheets: The list of data frames generated by pandas for use by the sample output generator. Not used if running the actual experiment.
+        :return: A numpy array where each column is [targetSum], [newMemoCrazy], [memoNormal], [tabCrazy], [tabNormal], [recurseNormal], and [meetInMiddle] named in that order and the list of all recorded disagreements between algorithms.
+        """
+        _, allRegResults, disagreeList = next(cls.testProblemSizes([size], inputArgs, scheduler, sheets))
+        return allRegResults, disagreeList
+
+    def recordAverages(self, targetIndex: int, averages: tuple[np.float64, ...], measureAverages: np.ndarray | None = None, 
+                       halfWidths: np.ndarray | None = None, sampleCount: int = 0, reductionAverages: np.ndarray | None = None) -> None:
+        """
+        Stores the average iteration counts of a target index along with its target absolute sum in the results array, and the average measurements, confidence intervals, reductions and amount of tests if there are any.
+
+        :param targetIndex: The index for the sum size target. Ranges from 0 to one less than the grid's target count.
+        :param averages: The average iteration count of each variation in order, depending on if full results are being calculated.
+        :param measureAverages: The average of each measurement for each variation, with a row for each variation in the same order as averages and a column for each measurement in MeasureNames order.
+        :param halfWidths: The half width of the 95% confidence interval of each average, in the same order as averages.
+        :param sampleCount: How many tests the averages are over.
+        :param reductionAverages: The average of each preprocessing reduction, in ReductionNames order.
+        """
+        self.allRegResults[AlgoNames.TargetSum][targetIndex] = self.sumSizeTarget[targetIndex]
+        self.allRegResults[sampleCountField][targetIndex] = sampleCount
+        for rowIndex, name in enumerate(self.resultOrder):
+            self.allRegResults[name][targetIndex] = averages[rowIndex]
+            if halfWidths is not None:
+                self.allRegResults[name + confidenceSuffix][targetIndex] = halfWidths[rowIndex]
+            if measureAverages is not None:
+                for measureIndex, measureName in enumerate(MeasureNames):
+                    self.allRegResults[name + measureName][targetIndex] = measureAverages[rowIndex, measureIndex]
+        if reductionAverages is not None:
+            for reductionIndex, reductionName in enumerate(ReductionNames):
+                self.allRegResults[reductionName][targetIndex] = reductionAverages[reductionIndex]
     
-    def generateSampleOutput(self, targetIndex: int, sheets: list[pd.DataFrame] | None) -> tuple[np.float64, np.float64, np.float64, np.float64, np.float64] |  tuple[np.float64, np.float64]:
+    def generateSampleOutput(self, targetIndex: int, sheets: list[pd.DataFrame] | None) -> tuple[np.float64, ...]:
         """
         If provided with a list of sheets will read off them and output their values, and if not will make some random values up.
 
@@ -147,181 +219,265 @@ class ComplexityExperiment:
         """
         if sheets is None:
             currSize = self.sumSizeTarget[targetIndex]
-            random = np.random.default_rng()
-            exampleBound = self.sumSizeTarget[20] - self.sumSizeTarget[0]
+            random = self.random
+            exampleBound = self.sumSizeTarget[-1] - self.sumSizeTarget[0]
             output = (abs(random.normal(currSize, exampleBound / 2)), abs(random.normal(currSize, exampleBound / 4)), abs(random.normal(currSize, exampleBound / 6)), 
-                    abs(random.normal(currSize, exampleBound / 8)), abs(random.normal(currSize, exampleBound / 10)) if self.runRecurse else np.nan)
+                    abs(random.normal(currSize, exampleBound / 8)), abs(random.normal(currSize, exampleBound / 10)) if self.runRecurse else np.nan,
+                    abs(random.normal(currSize, exampleBound / 12)) if self.runMeetInMiddle else np.nan)
             
-            if targetIndex in np.random.default_rng().integers(0, 21, size=2):
-                xnor = [random.integers(0, 2) == 0, random.integers(0, 2) == 0]
-                if not self.runReduced:
-                    xnor.extend([random.integers(0, 2) == 0, random.integers(0, 2) == 0])
-                    if self.runRecurse: xnor.append(random.integers(0, 2) == 0)
-                self.disagreeList.append(DisagreeData(xnor, self.setCount, targetIndex, 1, self.sumSizeTarget[targetIndex], self.generateRandomSet(targetIndex)))
+            if targetIndex in random.integers(0, self.grid.TargetCount, size=2):
+                xnor = [bool(random.integers(0, 2) == 0) for name in self.resultOrder if name in self.tasks]
+                self.disagreeList.append(DisagreeData(xnor, self.setCount, targetIndex, 1, self.sumSizeTarget[targetIndex], list(self.generateRandomSet(targetIndex)), self.generator.seed, self.ranAlgorithms()))
             return output
         
         rowIdx = int(self.setCount / 5)
         if self.runReduced:
             return (sheets[0].iat[targetIndex, rowIdx], sheets[1].iat[targetIndex, rowIdx])
-        return (sheets[0].iat[targetIndex, rowIdx], sheets[1].iat[targetIndex, rowIdx], sheets[2].iat[targetIndex, rowIdx], sheets[3].iat[targetIndex, rowIdx], sheets[4].iat[targetIndex, rowIdx] if self.runRecurse else np.nan)
+        return (sheets[0].iat[targetIndex, rowIdx], sheets[1].iat[targetIndex, rowIdx], sheets[2].iat[targetIndex, rowIdx], sheets[3].iat[targetIndex, rowIdx], sheets[4].iat[targetIndex, rowIdx] if self.runRecurse else np.nan,
+                np.nan) # The example results are from before Meet In The Middle existed.
 
         
-    def findAbsSumBounds(self) -> int:
-        """
-        Finds the smallest and largest possible set for the size given at object construction, in terms of sum of the absolute values inside of the set. Called by the constructor (so therefore you shouldn't call it).
-        Then fills in the rest of the sumSize as 5% increments from the smallest to the largest, and it's index in the array is known throught the class as "targetIndex".
-
-        :return: 1% of the distance between sumSizeTarget[0] and sumSizeTarget[20]. Used for the set builder error, so that absolute sums don't leave a 1% range from the target absolute sum.
-        """
-        smallest = 0
-        biggest = 32767 # I arbitrarily chose the signed 16 bit int limit, I know python goes larger.
-        smallBound = 0
-        bigBound = 0
-        toggleChange = True # Due to the 0, the time when I increment smallest and decrement biggest are opposite, so this toggles which one happens.
-        for _ in range(self.setCount): # Since I'm building the max and min absolute sum of a set, instead of dealing with negatives and absolute values, I just add every positive twice.
-            smallBound += smallest
-            bigBound += biggest 
-            if toggleChange: smallest += 1
-            else: biggest -= 1
-            toggleChange = not toggleChange
-        self.sumSizeTarget[0] = smallBound
-        self.sumSizeTarget[20] = bigBound
-        percent5inc = (bigBound - smallBound)/20
-        for i in range(1, 20):
-            self.sumSizeTarget[i] = round(percent5inc + self.sumSizeTarget[i-1])
-        return round(percent5inc/5)
-
-    def generateRandomSet(self, targetIndex: int) -> set[int]:
-        """
-        Generates a set of random ints of size n and absolute sum +-1% of sumSize[targetIndex]. The absolute sum will also not be above sumSize[21] or below sumSize[0], and will always be even.
-        Uses numpy gaussian distribution to generate the sets.
-
-        :param targetIndex: The size target index of the set. Can be from 0->20 inclusive where 0 is smallest possible, 20 is largest possible, and everything else is increments of 5%.
+    def generateRandomSet(self, targetIndex: int, testNum: int = 1) -> set[int]:
+        """
+        Generates a single set of random ints of size n and absolute sum +-1% of sumSize[targetIndex]. Simply a wrapper around the set generator for when only one set is needed.
+
+        :param targetIndex: The size target index of the set, where 0 is smallest possible, the last index is largest possible, and everything else is even increments between them.
+        :param testNum: The test number of the set, which along with the target index decides which random stream it comes from.
         :return: A randomized set with a sum that has an absolute value within 1% of the 5% increment given to it through targetIndex.
         """
-        currentAbsSum = 0
-
-        newSet = set()
-        mean = round(self.sumSizeTarget[targetIndex]/self.setCount) # Target abs sum / size of set
-        standardDeviation = (self.intSizeBound * 6) / 12
-
-        random = np.random.default_rng()
-        for _ in range(0, self.setCount):
-            nextNum = abs(round(random.normal(mean, standardDeviation)))
-            if nextNum > 32767: nextNum = nextNum - (nextNum - 32767) * 2 # Wraps numbers that are too big around, similar to absolute value for negative
-            while nextNum in newSet or -nextNum in newSet:
-                nextNum = abs(round(random.normal(mean, standardDeviation)))
-                if nextNum > 32767: nextNum = nextNum - (nextNum - 32767) * 2 # Wraps numbers that are too big around, similar to absolute value for negatives
-                standardDeviation += 1 
-            currentAbsSum += nextNum
-            if random.integers(0, 2) == 1: nextNum *= -1
-            newSet.add(int(nextNum))
-            devDiv = (14 - len(newSet) / self.setCount * 10)
-            standardDeviation = (6 * (2 * self.intSizeBound - abs(abs(nextNum) - mean))) / devDiv # Self adjusting standard deviation.
-            if standardDeviation <= 0: # Rarely happens, will set the deviation to slightly lower than full with the current standard deviation.
-                standardDeviation = (self.intSizeBound * 1.5) / devDiv
-
-        if currentAbsSum > self.sumSizeBound + self.sumSizeTarget[targetIndex] or currentAbsSum < self.sumSizeTarget[targetIndex] - self.sumSizeBound: # Exceedingly rare, but failsafe just in case.
-            if currentAbsSum > self.sumSizeBound + self.sumSizeTarget[targetIndex]:
-                neededChange = (currentAbsSum - (self.sumSizeBound + self.sumSizeTarget[targetIndex])) * 2
-            else:
-                neededChange = ((self.sumSizeBound + self.sumSizeTarget[targetIndex]) - currentAbsSum) * 2
-                neededChange *= -1
-            loops = 0
-            while currentAbsSum > self.sumSizeBound + self.sumSizeTarget[targetIndex] or currentAbsSum < self.sumSizeTarget[targetIndex] - self.sumSizeBound:
-                if loops > 5: # Had extremely long loops happen once every few tests, this attempts to stop that by just recursively making a new set.
-                    return self.generateRandomSet(targetIndex)
-                victim = newSet.pop()
-                if victim > 0 and (victim - neededChange) not in newSet: # Positive integers (not including 0).
-                    newSet.add(victim - neededChange)
-                    currentAbsSum -= neededChange
-                elif victim < 0 and (victim + neededChange) not in newSet: # Negative integers (not including 0).
-                    newSet.add(victim + neededChange)
-                    currentAbsSum -= neededChange
+        return set(self.generator.generateRandomSets(targetIndex, [testNum])[0].tolist())
+    
+    def buildJobs(self) -> list[TestJob | BatchJob]:
+        """
+        Generates every set for every target index and test number of this size that hasn't been given out yet, and turns each set and algorithm combination into a job for the scheduler.
+        The first call gives out the starting tests, and every call after only gives out the extra tests of target indexes that needed more to converge.
+        The sets themselves stay here for checking disagreements, since the workers rebuild their own copy from the job's coordinates. Any test already in the journal is skipped.
+        When running the C versions, every test of a target index for an algorithm is grouped into one batch if they are cheap enough that the overhead of giving them out one at a time would take longer than solving them.
+
+        :return: The list of every job (or batch of jobs) this size needs run.
+        """
+        jobs = []
+        self.extended = False
+        finishedTests = self.journal.finishedTests.get(self.setCount, {}) if self.journal is not None else {}
+        for targetIndex in range(self.grid.TargetCount):
+            firstTest = self.testsScheduled[targetIndex] + 1
+            testNums = [testNum for testNum in range(firstTest, self.testsRun[targetIndex] + 1) if (targetIndex, testNum) not in finishedTests]
+            self.testsScheduled[targetIndex] = self.testsRun[targetIndex]
+            if len(testNums) == 0:
+                continue
+            if self.outputLevel >= OutLevel.SUM: 
+                if firstTest == 1:
+                    print(f">>--:>-  Started tests for integer count {self.setCount:3} and absolute sum target index {targetIndex:2}. -<:--<<")
                 else:
-                    newSet.add(victim)   
-                loops += 1
+                    print(f">>--:>- Extended tests for integer count {self.setCount:3} and absolute sum target index {targetIndex:2} to {self.testsRun[targetIndex]:3} sets. -<:--<<")
+            indexJobs: dict[AlgoNames, list[TestJob]] = {name: [] for name in self.tasks}
+            indexSets = self.generator.generateRandomSets(targetIndex, testNums)
+            for testNum, testList in zip(testNums, indexSets):
+                self.testLists[(targetIndex, testNum)] = testList
+                self.pendingResults[(targetIndex, testNum)] = {}
+                for name in self.tasks:
+                    indexJobs[name].append(TestJob(self.setCount, targetIndex, testNum, name, self.expectedCost(name, testList)))
+            for name in self.tasks:
+                totalCost = sum(job.ExpectedCost for job in indexJobs[name])
+                if not self.runPython and totalCost <= batchCostLimit:
+                    jobs.append(BatchJob(name, tuple(indexJobs[name]), totalCost))
+                else:
+                    jobs.extend(indexJobs[name])
+        return jobs
 
-        if sum(newSet) == 0: # The sum being equal to 0 is trivial and uninteresting, therefore try again if this happens.
-            return self.generateRandomSet(targetIndex)
+    def expectedCost(self, taskName: AlgoNames, testList: np.ndarray) -> float:
+        """
+        Guesses how much work an algorithm will need to do on a set, using the known cost of each algorithm. Only the order of the guesses matters, as it is only used to run the longest jobs first.
+        The tabulated versions are exact, while the memoized versions use the size of their table as an upper bound since they can't fill in more than that.
+        With counts only the tabulated versions are just the bitset oracle, which does a whole machine word of the table at a time.
 
-        while currentAbsSum % 2 == 1: # The sum being odd is trivial and uninteresting, therefore make it even if this happens.
-            victim = newSet.pop()
-            if victim + 1 not in newSet:
-                newSet.add(victim + 1)
-                currentAbsSum += 1
-            else:
-                newSet.add(victim)
+        :param taskName: The algorithm that will be run.
+        :param testList: The set it will be run on.
+        :return: The expected amount of work.
+        """
+        absSum = int(np.abs(testList, dtype=np.int64).sum())
+        sumRange = absSum + 1 # Since the positive sum minus the negative sum is just the absolute sum.
+        wordSize = 64 if self.countsOnly else 1
+        if taskName == AlgoNames.TabulatedNormal:
+            return sumRange * len(testList) / wordSize
+        if taskName == AlgoNames.TabulatedCrazy:
+            return (absSum // 2) * len(testList) / wordSize
+        if taskName == AlgoNames.RecursiveNormal:
+            return 2 ** len(testList)
+        if taskName == AlgoNames.MeetInMiddle:
+            return 2 ** (len(testList) // 2) + 2 ** (len(testList) - len(testList) // 2)
+        if taskName == AlgoNames.MemoizedNormal:
+            return min(2 ** len(testList), sumRange * len(testList))
+        return min(2 ** len(testList), (absSum // 2) * len(testList))
 
-        return newSet
-    
-    def runSingleSize(self, targetIndex: int) -> tuple[np.float64, np.float64, np.float64, np.float64, np.float64] | tuple[np.float64, np.float64]:
+    def recordResult(self, job: TestJob, result: TestResult) -> bool:
         """
-        Runs multiple tests of the same condition (set size and abs sum size). Will return a tuple of the average iterations count from each test.
-        Uses a python multithreading pool to run 3 (or 4 if not using regular recursion) tests at once as my computer allows this program 12 threads.
+        Stores the result of a single finished job. Once the last algorithm for a set finishes the set is checked for disagreements, and once the last set of a target index finishes its averages are calculated.
 
-        :param targetIndex: The index for the sum size target. Ranges from 0->20 inclusive.
-        :return: A tuple with each variations average results in order, depending on if full results are being calculated and if recursiveNormal is being run.
+        :param job: The job that finished.
+        :param result: The iteration count, answer and measurements the job produced.
+        :return: If this was the last job of this entire size, meaning allRegResults and disagreeList are complete.
         """
-        if self.outputLevel >= OutLevel.SUM: print(f">>--:>-  Started tests for integer count {self.setCount:3} and absolute sum target index {targetIndex:2}. -<:--<<")
-        results = np.empty((50, 2 if self.runReduced else 5), dtype=np.uint32)
+        officialNames = {AlgoNames.NewMemoizedCrazy: "New Memoized Crazy", AlgoNames.OldMemoizedCrazy: "Old Memoized Crazy", AlgoNames.MemoizedNormal: "   Memoized Normal", 
+                         AlgoNames.TabulatedCrazy: "   Tabulated Crazy", AlgoNames.TabulatedNormal: "  Tabulated Normal", AlgoNames.RecursiveNormal: "  Recursive Normal",
+                         AlgoNames.MeetInMiddle: "Meet In The Middle"}
+        if self.outputLevel >= OutLevel.ALL: print(f"- Finished test for {officialNames[job.Algorithm]} take {job.TestNum:2}. -")
+        key = (job.TargetIndex, job.TestNum)
+        self.pendingResults[key][job.Algorithm] = result
+        if len(self.pendingResults[key]) != len(self.tasks):
+            return False
         
-        workerCount = 6 if self.runReduced else 3
-        with ThreadPool.ProcessPoolExecutor(max_workers=workerCount) as outerPool:
-            tasks = [i + 1 for i in reversed(range(50))]
-            activeTests = set()
-            try:
-                while len(tasks) != 0 or len(activeTests) != 0:
-                    while len(activeTests) < workerCount and len(tasks) != 0:
-                        activeTests.add(outerPool.submit(self.runSingleTest, targetIndex, tasks.pop()))
-                    completedTest = next(ThreadPool.as_completed(activeTests))
-                    activeTests.remove(completedTest)
-                    testResult = completedTest.result()
-                    results[testResult[0]-1] = testResult[1]
-            except KeyboardInterrupt:
-                outerPool.shutdown(wait=False, cancel_futures=True)
-                raise
+        return self.finishTest(job.TargetIndex, job.TestNum, *self.runSingleTest(job.TargetIndex, job.TestNum, self.testLists.pop(key), self.pendingResults.pop(key)))
+
+    def finishTest(self, targetIndex: int, testNum: int, testResult: tuple[int, ...], testMeasures: list[list[float]], testAnswers: list[bool | None], 
+                   testReduction: list[int] | None = None) -> bool:
+        """
+        Stores the iteration counts and measurements of a finished test, and calculates the averages of its target index if it was the last test of it.
+
+        :param targetIndex: The size target index of the test.
+        :param testNum: The test number of the test.
+        :param testResult: The iteration count of each algorithm, in the same order as runSingleTest gives them.
+        :param testMeasures: The measurements of each algorithm, in the same order as runSingleTest gives them.
+        :param testAnswers: The answer of each algorithm, in the same order as runSingleTest gives them, with None for any that wasn't run.
+        :param testReduction: What preprocessing left of the set, in ReductionNames order, or None if it wasn't preprocessed.
+        :return: If this was the last test of this entire size, meaning allRegResults and disagreeList are complete.
+        """
+        self.testResults[targetIndex, testNum - 1] = testResult
+        self.testMeasures[targetIndex, testNum - 1] = testMeasures
+        self.testAnswers[targetIndex, testNum - 1] = [-1 if answer is None else int(answer) for answer in testAnswers]
+        if testReduction is not None:
+            self.testReductions[targetIndex, testNum - 1] = testReduction
+        self.testsDone[targetIndex] += 1
+        if self.testsDone[targetIndex] != self.testsRun[targetIndex]:
+            return False
         
+        sampleCount = self.testsRun[targetIndex]
+        results = self.testResults[targetIndex, :sampleCount]
+        halfWidths = confidenceHalfWidths(results)
+        if self.adaptive and sampleCount < self.grid.Repeats:
+            needed = self.testsNeeded(results, halfWidths)
+            if needed > sampleCount:
+                self.testsRun[targetIndex] = min(needed, self.grid.Repeats)
+                self.extended = True
+                return False
+
         if self.outputLevel >= OutLevel.SUM: print(f">>--:>- Finished tests for integer count {self.setCount:3} and absolute sum target index {targetIndex:2}. -<:--<<")
-        if self.runReduced:
-            return (np.mean(results[:, 0]), np.mean(results[:, 1]))
-        return (np.mean(results[:, 0]), np.mean(results[:, 1]), np.mean(results[:, 2]), np.mean(results[:, 3]), np.mean(results[:, 4]) if self.runRecurse else np.nan)
+        measureAverages = np.mean(self.testMeasures[targetIndex, :sampleCount], axis=0)
+        ran = np.array([name in self.tasks for name in self.resultOrder]) # Anything past its integer count limit (like Recursive Normal past 25) stays nan.
+        halfWidths[~ran] = np.nan
+        reductionAverages = np.mean(self.testReductions[targetIndex, :sampleCount], axis=0) if self.preprocess else None
+        self.recordAverages(targetIndex, tuple(np.where(ran, np.mean(results, axis=0), np.nan)), measureAverages, halfWidths, sampleCount, reductionAverages)
+        self.indicesLeft -= 1
+        return self.indicesLeft == 0
 
-    def runSingleTest(self, targetIndex: int, testNum: int) -> tuple[int, tuple[np.uint32, np.uint32, np.uint32, np.uint32, np.uint32]] | tuple[int, tuple[np.uint32, np.uint32]]:
+    def testsNeeded(self, results: np.ndarray, halfWidths: np.ndarray) -> int:
         """
-        Runs each algorithm once for the full version. Verifies all algorithms returned the same bool, and will record the parameters and which algorithm disagrees if not. Also returns the iteration count of each.
-        Uses a python multithreading pool to run each version at the same time.
+        Finds how many tests a target index needs for every algorithm's confidence interval to be within the tolerance of its average, by scaling the current amount by how far off each one is (since the half width shrinks with the square root of the amount of tests).
 
-        :param targetIndex: The size target index of the set. Can be from 0->20 inclusive where 0 is smallest possible, 20 is largest possible, and everything else is increments of 5%.
-        :param testNum: The test number (used solely for console output).
-        :return: A tuple of the testNum, and a inner tuple of the results in order New Memoized Crazy, Old Memoized Crazy, Memoized Normal, Tabulated Crazy, Tabulated Normal and Recursive Normal, with 0 given if set size is too high.
+        :param results: The iteration counts of every test of the target index so far.
+        :param halfWidths: The half width of each algorithm's confidence interval so far.
+        :return: How many tests are needed in total, which is the amount so far if every algorithm has already converged.
         """
-        if self.outputLevel >= OutLevel.BATCH: print(f":>-  Started test take {testNum:2} for specs {self.setCount:3} and {targetIndex:2}. -<:")
-        testList = list(self.generateRandomSet(targetIndex))
-        officialNames = {AlgoNames.NewMemoizedCrazy: "New Memoized Crazy", AlgoNames.OldMemoizedCrazy: "Old Memoized Crazy", AlgoNames.MemoizedNormal: "   Memoized Normal", 
-                         AlgoNames.TabulatedCrazy: "   Tabulated Crazy", AlgoNames.TabulatedNormal: "  Tabulated Normal", AlgoNames.RecursiveNormal: "  Recursive Normal"}
-    
-        with ThreadPool.ProcessPoolExecutor(max_workers=len(self.tasks)) as innerPool:
-            futures = {innerPool.submit(worker, name, testList, self.runPython): name for name in self.tasks}
-            results = {}
-            for future in ThreadPool.as_completed(futures):
-                name = futures[future]
-                if self.outputLevel >= OutLevel.ALL: print(f"- Finished test for {officialNames[name]} take {testNum:2}. -")
-                results[name] = future.result()
+        count = len(results)
+        allowed = self.grid.Tolerance * np.abs(np.mean(results, axis=0))
+        if np.all(halfWidths <= allowed):
+            return count
+        with np.errstate(divide='ignore'):
+            scale = np.max(np.where(halfWidths > allowed, (halfWidths / allowed) ** 2, 1))
+        return self.grid.Repeats if not np.isfinite(scale) else max(count + 1, int(np.ceil(count * scale)))
 
-        if self.runReduced:
-            xnor = [results[AlgoNames.OldMemoizedCrazy][1]]
-        else:
-            xnor = [results[AlgoNames.MemoizedNormal][1], results[AlgoNames.TabulatedCrazy][1], results[AlgoNames.TabulatedNormal][1]]
-            if self.runRecurse: 
-                xnor.append(results[AlgoNames.RecursiveNormal][1])
-        xnor.append(results[AlgoNames.NewMemoizedCrazy][1])
-        if len(set(xnor)) > 1:
-            with self.disagreeLock:
-                self.disagreeList.append(DisagreeData(xnor, self.setCount, targetIndex, testNum, self.sumSizeTarget[targetIndex], testList))
+    def replayTests(self) -> bool:
+        """
+        Fills in every test of this size that was already recorded in the journal, so that only the rest of them get given to the scheduler. Disagreements are rebuilt from the seed since the sets aren't journaled.
+
+        :return: If every test of this size was already in the journal, meaning allRegResults and disagreeList are already complete.
+        """
+        finished = False
+        for (targetIndex, testNum), (testResult, testMeasures, disagree, testAnswers, testReduction) in sorted(self.journal.finishedTests.get(self.setCount, {}).items()): # In order, so that adaptive target indexes grow the same way they did the first time.
+            if disagree is not None:
+                self.recordDisagreement(disagree, targetIndex, testNum)
+            finished = self.finishTest(targetIndex, testNum, tuple(testResult), testMeasures, testAnswers, testReduction)
+        return finished
+
+    def rawRecords(self) -> np.ndarray:
+        """
+        Gathers every test of this size into rows for the raw results store. Only the algorithms that were actually run get fields, so Recursive Normal is left out past where it stops being run, and the reductions only get fields if the sets were preprocessed.
+
+        :return: A row for every test, ordered by target index and then test number.
+        """
+        targetIndexes = np.array([targetIndex for targetIndex in range(self.grid.TargetCount) for _ in range(self.testsRun[targetIndex])], dtype=np.intp)
+        testNums = np.array([testNum for targetIndex in range(self.grid.TargetCount) for testNum in range(1, self.testsRun[targetIndex] + 1)], dtype=np.intp)
+        algorithms = [name for name in self.resultOrder if name in self.tasks]
+        records = np.zeros(len(targetIndexes), dtype=rawResultsDType(algorithms, self.preprocess))
+        records['size'] = self.setCount
+        records['targetIndex'] = targetIndexes
+        records['testNum'] = testNums
+        records[AlgoNames.TargetSum] = np.asarray(self.sumSizeTarget, dtype=np.uint64)[targetIndexes]
+        for column, name in enumerate(self.resultOrder):
+            if name not in algorithms:
+                continue
+            records[name] = self.testResults[targetIndexes, testNums - 1, column]
+            records[name + answerSuffix] = self.testAnswers[targetIndexes, testNums - 1, column]
+            for measureIndex, measureName in enumerate(MeasureNames):
+                records[name + measureName] = self.testMeasures[targetIndexes, testNums - 1, column, measureIndex]
+        if self.preprocess:
+            for reductionIndex, reductionName in enumerate(ReductionNames):
+                records[reductionName] = self.testReductions[targetIndexes, testNums - 1, reductionIndex]
+        return records
+
+    def replaySize(self) -> None:
+        """
+        Loads the results of this size straight from the journal, for when every test of it had already finished and been sent off. Only the disagreements have to be rebuilt.
+        """
+        self.allRegResults = np.array([tuple(row) for row in self.journal.finishedSizes[self.setCount]], dtype=self.allRegResults.dtype)
+        for (targetIndex, testNum), (_, _, disagree, _, _) in self.journal.finishedTests.get(self.setCount, {}).items():
+            if disagree is not None:
+                self.recordDisagreement(disagree, targetIndex, testNum)
+
+    def recordDisagreement(self, xnor: list[bool], targetIndex: int, testNum: int, testList: np.ndarray | None = None) -> None:
+        """
+        Records which algorithm disagreed on a set, along with everything needed to find the set again.
+
+        :param xnor: The answer of each algorithm.
+        :param targetIndex: The size target index of the set.
+        :param testNum: The test number of the set.
+        :param testList: The set every algorithm was given. Is rebuilt from the seed if not given.
+        """
+        if testList is None:
+            testList = self.generator.generateRandomSets(targetIndex, [testNum])[0]
+        self.disagreeList.append(DisagreeData(xnor, self.setCount, targetIndex, testNum, self.sumSizeTarget[targetIndex], testList.tolist(), self.generator.seed, self.ranAlgorithms()))
+
+    def ranAlgorithms(self) -> list[str]:
+        """
+        :return: The name of every algorithm run on this size, in result order, which is the same order as the answers of a disagreement.
+        """
+        return [str(name) for name in self.resultOrder if name in self.tasks]
+
+    def runSingleTest(self, targetIndex: int, testNum: int, testList: np.ndarray, results: dict[AlgoNames, TestResult]) -> tuple[tuple[int, ...], list[list[float]], list[bool | None], list[int] | None]:
+        """
+        Finishes up a single test once the last algorithm has returned its result for the set. Verifies all algorithms returned the same bool, and will record the parameters and which algorithm disagrees if not. Also returns the iteration count and measurements of each.
+
+        :param targetIndex: The size target index of the set, where 0 is smallest possible, the last index is largest possible, and everything else is even increments between them.
+        :param testNum: The test number (used solely for console output).
+        :param testList: The set that every algorithm was given, used to record any disagreement.
+        :param results: The iteration count, answer and measurements of each algorithm, keyed by the algorithm name.
+        :return: A tuple of the iteration counts in order New Memoized Crazy, Old Memoized Crazy, Memoized Normal, Tabulated Crazy, Tabulated Normal and Recursive Normal, with 0 given if set size is too high.
+                 Then the wall time, CPU time and peak memory of each in the same order, with nan given if set size is too high, and then the answer of each, with None given if set size is too high.
+                 Last is what preprocessing left of the set in ReductionNames order, or None if it wasn't preprocessed. The workers don't send it back, since running the set through it again here is far cheaper than solving it.
+        """
+        xnor = [bool(results[name].Result) for name in self.resultOrder if name in results] # In the same order the disagreement record labels them.
+        disagrees = len(set(xnor)) > 1
+        if disagrees:
+            self.recordDisagreement(xnor, targetIndex, testNum, testList)
         
         if self.outputLevel >= OutLevel.BATCH: print(f":>- Finished test take {testNum:2} for specs {self.setCount:3} and {targetIndex:2}. -<:")
-        if self.runReduced:
-            return testNum, (results[AlgoNames.NewMemoizedCrazy][0], results[AlgoNames.OldMemoizedCrazy][0]) 
-        return testNum, (results[AlgoNames.NewMemoizedCrazy][0], results[AlgoNames.MemoizedNormal][0], results[AlgoNames.TabulatedCrazy][0], 
-                         results[AlgoNames.TabulatedNormal][0], results[AlgoNames.RecursiveNormal][0] if self.runRecurse else 0) 
+        testResult = tuple(results[name].IterationCount if name in results else 0 for name in self.resultOrder)
+        testMeasures = [[results[name].WallTime, results[name].CpuTime, results[name].PeakMemory] if name in results else [np.nan] * len(MeasureNames) for name in self.resultOrder]
+        testAnswers = [bool(results[name].Result) if name in results else None for name in self.resultOrder]
+        testReduction = None
+        if self.preprocess:
+            reduction = preprocess(testList)[1]
+            testReduction = [reduction.IntCount, reduction.AbsSum, int(reduction.Answer is not None)]
+        if self.journal is not None:
+            self.journal.recordTest(self.setCount, targetIndex, testNum, testResult, testMeasures, testAnswers, xnor if disagrees else None, testReduction)
+        return testResult, testMeasures, testAnswers, testReduction
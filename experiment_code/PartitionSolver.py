@@ -0,0 +1,62 @@
+"""
+A reusable solver for asking many subset sum questions about the same set, for secondary experiments like finding every achievable subset sum or trying several goals on one set.
+Wraps the Python version of one of the memoized crazy algorithms, whose answer map stays warm between queries, so each new goal only solves the subproblems no earlier goal already did.
+The experiment itself still calls testIterations on each version, which is now just a single query on a fresh solver.
+
+Written by bananathrowingmachine, Mar 19, 2026.
+"""
+from data_processing_code.MiscDataCode import AlgoNames
+from experiment_code.versions.python.OldMemoizedCrazy import OldMemoizedCrazy
+from experiment_code.versions.python.NewMemoizedCrazy import NewMemoizedCrazy
+
+class PartitionSolver:
+    """
+    Answers subset sum queries about the absolute values of one set, the same values the crazy versions solve partition with.
+    Memoized Normal isn't offered, since it solves over the signed integers instead of their absolute values, so a goal would mean something else entirely to it.
+    """
+    def __init__(self, inputList: list[int], algorithm: AlgoNames = AlgoNames.NewMemoizedCrazy, iterative: bool = False):
+        """
+        Sets up the solver with an empty answer map. Nothing is solved until the first query.
+
+        :param inputList: The set to ask about.
+        :param algorithm: Which memoized algorithm to answer with, out of New Memoized Crazy and Old Memoized Crazy.
+        :param iterative: If the explicit stack versions should be used instead of the recursive ones, for sets too big for Python's recursion limit.
+        """
+        self.inputList = [int(num) for num in inputList]
+        self.algorithm = algorithm
+        self.iterative = iterative
+        if algorithm == AlgoNames.NewMemoizedCrazy:
+            self.solver = NewMemoizedCrazy(sorted(self.inputList, reverse=True))
+        elif algorithm == AlgoNames.OldMemoizedCrazy:
+            self.solver = OldMemoizedCrazy(self.inputList)
+        else:
+            raise ValueError(f"{algorithm} is not a memoized crazy algorithm.")
+        self.iterationCount = 0 # Every subproblem solved across every query so far.
+
+    def query(self, goal: int) -> bool:
+        """
+        Asks if some subset of the absolute values adds up to the goal.
+
+        :param goal: The goal to reach.
+        :return: If the goal can be reached.
+        """
+        newIterations, result = self.solver.query(goal, self.iterative)
+        self.iterationCount += newIterations
+        return result
+
+    def partition(self) -> bool:
+        """
+        Asks if the absolute values can be split into two halves with the same sum. An odd absolute sum can never be split evenly, so it's turned down without a query.
+
+        :return: If the set can be partitioned.
+        """
+        absSum = sum(map(abs, self.inputList))
+        return absSum % 2 == 0 and self.query(absSum // 2)
+
+    def achievableSums(self) -> list[int]:
+        """
+        Finds every goal some subset of the absolute values adds up to, by querying every goal from 0 to the absolute sum.
+
+        :return: Every achievable goal, smallest first.
+        """
+        return [goal for goal in range(sum(self.solver.absoluteList) + 1) if self.query(goal)]
@@ -0,0 +1,55 @@
+"""
+An optional preprocessing stage every set can go through before it reaches an algorithm, which shrinks the set down without ever changing if it can be partitioned.
+A set can be partitioned exactly when some signs make its absolute values add up to 0, so everything here only looks at the absolute values:
+- Zeros are dropped, since they never change a sum.
+- Every integer is divided by the greatest common divisor of the absolute values, which divides the absolute sum (and so every table) by the same amount.
+- Sets with an odd absolute sum left over are answered false, since the two halves could never be equal. The generated sets are always even, but dividing by an even divisor can still leave an odd sum.
+- Sets where a single integer is bigger than every other one put together are answered false, since nothing can balance it out.
+- Integers that share an absolute value are grouped and split back up into 1, 2, 4, ... copies of it, the same way bounded knapsack items are, so k copies only take about log2(k) integers while every subset sum stays reachable.
+
+Written by bananathrowingmachine, Mar 21, 2026.
+"""
+from data_processing_code.MiscDataCode import Reduction
+import numpy as np
+
+def preprocess(testList: np.ndarray) -> tuple[np.ndarray, Reduction]:
+    """
+    Runs every step of the preprocessing stage on a set.
+
+    :param testList: The set to preprocess.
+    :return: The set left over as an int32 array (empty if the set was answered), and what was done to it.
+    """
+    testList = np.asarray(testList, dtype=np.int64)
+    testList = testList[testList != 0]
+    if len(testList) == 0: # Two empty halves always balance.
+        return np.zeros(0, dtype=np.int32), Reduction(0, 0, 1, True)
+    absolutes = np.abs(testList)
+    divisor = int(np.gcd.reduce(absolutes))
+    testList //= divisor
+    absolutes //= divisor
+    absSum = int(absolutes.sum())
+    if absSum % 2 == 1 or 2 * int(absolutes.max()) > absSum:
+        return np.zeros(0, dtype=np.int32), Reduction(0, 0, divisor, False)
+    reducedList = groupRepeats(testList)
+    return reducedList, Reduction(len(reducedList), absSum, divisor, None)
+
+def groupRepeats(testList: np.ndarray) -> np.ndarray:
+    """
+    Swaps every group of integers sharing an absolute value for copies of that value in chunks of 1, 2, 4, and so on (with whatever is left as the last chunk), which can still add up to any amount of copies from none to all of them.
+    Each chunk takes the sign most of the group had, since flipping a sign never changes if a set can be partitioned. Sets with no repeats are given back untouched.
+
+    :param testList: The set, with no zeros in it.
+    :return: The grouped set, as an int32 array.
+    """
+    values, counts = np.unique(np.abs(testList), return_counts=True)
+    if np.all(counts == 1):
+        return testList.astype(np.int32)
+    reducedList = [int(num) for num in testList if counts[np.searchsorted(values, abs(num))] == 1]
+    for value, count in zip(values[counts > 1].tolist(), counts[counts > 1].tolist()):
+        sign = 1 if np.count_nonzero(testList == value) * 2 >= count else -1
+        chunk = 1
+        while count > 0:
+            reducedList.append(sign * value * min(chunk, count))
+            count -= min(chunk, count)
+            chunk *= 2
+    return np.array(reducedList, dtype=np.int32)
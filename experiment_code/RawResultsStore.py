@@ -0,0 +1,120 @@
+"""
+Keeps every single test of a run, instead of only the averages that end up in the data tables, so that the results can be looked at again (medians, percentiles, new graphs) without running anything.
+Each integer count gets its own .npy shard with one row per test, which can be memory mapped so that only what is looked at gets read. Alongside the shards is a small JSON file with the seed, grid and options of the run, since those are the same for every row.
+
+Written by bananathrowingmachine, Mar 18, 2026.
+"""
+from data_processing_code.MiscDataCode import FullResultsDType, SpeedyResultsDType, AlgoNames, MeasureNames, ReductionNames, GridSpec, confidenceSuffix, confidenceHalfWidths, sampleCountField
+from dataclasses import asdict
+from pathlib import Path
+import numpy as np
+import json, os
+
+class RawResultsStore:
+    """
+    Reads and writes the raw results shards of a run. Every shard is written in one go once its integer count has finished, so a shard is never half written.
+    """
+    def __init__(self, storeDir: Path):
+        """
+        Opens a raw results store. Nothing is read until it is asked for.
+
+        :param storeDir: The directory of the store. Must have already been started with RawResultsStore.start.
+        """
+        self.storeDir = storeDir
+        with open(storeDir / "meta.json", "r") as file:
+            self.meta = json.load(file)
+        self.grid = GridSpec(**(self.meta["grid"] | {"Sizes": tuple(self.meta["grid"]["Sizes"])}))
+
+    @classmethod
+    def start(cls, storeDir: Path, inputArgs) -> None:
+        """
+        Starts a brand new store, recording the seed and grid of the run along with if it was the reduced test suite and if the sets were preprocessed.
+
+        :param storeDir: The directory of the store. Any old shards in it will be wiped.
+        :param inputArgs: The command line arguments passed when the program started.
+        """
+        storeDir.mkdir(parents=True, exist_ok=True)
+        for shard in storeDir.glob("*.npy"):
+            shard.unlink()
+        with open(storeDir / "meta.json", "w") as file:
+            json.dump({"seed": inputArgs.seed, "grid": asdict(inputArgs.grid), "reduced": inputArgs.reduced, "preprocess": inputArgs.preprocess}, file)
+
+    @classmethod
+    def exists(cls, storeDir: Path) -> bool:
+        """
+        Checks if there is a store to read.
+
+        :param storeDir: The directory of the store.
+        :return: If the store has been started.
+        """
+        return (storeDir / "meta.json").is_file()
+
+    def shardPath(self, size: int) -> Path:
+        """
+        :param size: The amount of integers in each set.
+        :return: Where the shard of that integer count is kept.
+        """
+        return self.storeDir / f"size{size:03}.npy"
+
+    def hasShard(self, size: int) -> bool:
+        """
+        :param size: The amount of integers in each set.
+        :return: If that integer count has a shard yet.
+        """
+        return self.shardPath(size).is_file()
+
+    def sizes(self) -> list[int]:
+        """
+        :return: Every integer count with a shard, in the order of the grid.
+        """
+        return [size for size in self.grid.Sizes if self.hasShard(size)]
+
+    def writeShard(self, size: int, records: np.ndarray) -> None:
+        """
+        Saves every test of an integer count. The shard is written to a temporary file first and then moved into place, so a crash can never leave a partial shard behind.
+
+        :param size: The amount of integers in each set.
+        :param records: Every test of that integer count, using the dtype from rawResultsDType.
+        """
+        tempPath = self.shardPath(size).with_suffix(".tmp")
+        with open(tempPath, "wb") as file:
+            np.save(file, records)
+        os.replace(tempPath, self.shardPath(size))
+
+    def readShard(self, size: int) -> np.ndarray:
+        """
+        Memory maps the shard of an integer count, so that it is only read as it gets used.
+
+        :param size: The amount of integers in each set.
+        :return: Every test of that integer count, read only.
+        """
+        return np.load(self.shardPath(size), mmap_mode="r")
+
+    def summarize(self, size: int) -> np.ndarray:
+        """
+        Averages the shard of an integer count back into the same results array the experiment sends to the data processor, with the averages, sample count and confidence interval of each target index.
+        Any algorithm missing from the shard (like Recursive Normal past where it stops being run) is left as nan, the same as the experiment does, and so are the reductions of a run that wasn't preprocessed.
+
+        :param size: The amount of integers in each set.
+        :return: The results array of that integer count.
+        """
+        records = self.readShard(size)
+        summary = np.zeros(self.grid.TargetCount, dtype=SpeedyResultsDType if self.meta["reduced"] else FullResultsDType)
+        for name in summary.dtype.names:
+            if summary.dtype[name].kind == 'f':
+                summary[name] = np.nan
+        algorithms = [algoName for algoName in AlgoNames if algoName != AlgoNames.TargetSum and algoName in records.dtype.names and algoName in summary.dtype.names]
+        for targetIndex in np.unique(records["targetIndex"]):
+            rows = records[records["targetIndex"] == targetIndex]
+            summary[AlgoNames.TargetSum][targetIndex] = rows[AlgoNames.TargetSum][0]
+            summary[sampleCountField][targetIndex] = len(rows)
+            halfWidths = confidenceHalfWidths(np.stack([rows[algoName] for algoName in algorithms], axis=1))
+            for algoIndex, algoName in enumerate(algorithms):
+                summary[algoName][targetIndex] = np.mean(rows[algoName])
+                summary[algoName + confidenceSuffix][targetIndex] = halfWidths[algoIndex]
+                for measureName in MeasureNames:
+                    summary[algoName + measureName][targetIndex] = np.mean(rows[algoName + measureName])
+            for reductionName in ReductionNames:
+                if reductionName in records.dtype.names:
+                    summary[reductionName][targetIndex] = np.mean(rows[reductionName])
+        return summary
@@ -0,0 +1,146 @@
+"""
+Keeps an append only journal of a run, so that a crashed or stopped run can pick up where it left off instead of starting over.
+Every line of the journal is its own JSON record. The first is a header with the seed and options of the run, then there is one record for each test as it finishes, and one for each size once its results have been sent off.
+
+Written by bananathrowingmachine, Mar 11, 2026.
+"""
+from data_processing_code.MiscDataCode import GridSpec, FullSuite, SpeedySuite
+from dataclasses import asdict
+from pathlib import Path
+import json, os
+
+journalOptions = ("reduced", "python", "numpy", "bitset", "iterative", "countsOnly", "preprocess") # The options that change what gets recorded, and so must match for a run to be resumed.
+
+class RunJournal:
+    """
+    Reads in everything already recorded in a journal, and then appends any new records to the end of it. Is meant to be used as a context manager, so that the file is closed once the run is over.
+    """
+    def __init__(self, journalPath: Path):
+        """
+        Opens the journal, loading every test and size that has already been finished. Any unreadable line (such as the last line of a run that crashed mid write) is ignored.
+
+        :param journalPath: The journal file. Must have already been started with RunJournal.start.
+        """
+        self.finishedTests: dict[int, dict[tuple[int, int], tuple[list[int], list[list[float]], list[bool] | None, list[bool | None], list[int] | None]]] = {}
+        self.finishedSizes: dict[int, list[list[float]]] = {}
+        line = "\n"
+        with open(journalPath, "r") as file:
+            for line in file:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if record["kind"] == "test":
+                    self.finishedTests.setdefault(record["size"], {})[(record["targetIndex"], record["testNum"])] = (record["results"], record["measures"], record["disagree"], record["answers"], record["reduction"])
+                elif record["kind"] == "size":
+                    self.finishedSizes[record["size"]] = record["results"]
+        self.file = open(journalPath, "a")
+        if not line.endswith("\n"): # Keeps the first new record from being glued onto the end of a half written one.
+            self.file.write("\n")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.file.close()
+        return False
+
+    @classmethod
+    def start(cls, journalPath: Path, inputArgs) -> None:
+        """
+        Starts a brand new journal, with a header recording the seed, the grid, and every option that has to match for the run to be resumed.
+
+        :param journalPath: The journal file. Any old journal there will be wiped.
+        :param inputArgs: The command line arguments passed when the program started.
+        """
+        journalPath.parent.mkdir(parents=True, exist_ok=True)
+        header = {"kind": "header", "seed": inputArgs.seed, "grid": asdict(inputArgs.grid), "suite": cls.runSuite(inputArgs)} | {option: getattr(inputArgs, option) for option in journalOptions}
+        with open(journalPath, "w") as file:
+            file.write(json.dumps(header) + "\n")
+
+    @classmethod
+    def readHeader(cls, journalPath: Path) -> dict | None:
+        """
+        Reads the header of a journal.
+
+        :param journalPath: The journal file.
+        :return: The header record, or None if there is no journal to resume.
+        """
+        try:
+            with open(journalPath, "r") as file:
+                header = json.loads(file.readline())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return header if header.get("kind") == "header" else None
+
+    @classmethod
+    def readGrid(cls, header: dict) -> GridSpec:
+        """
+        Rebuilds the grid a journal was recorded with.
+
+        :param header: The header record of the journal.
+        :return: The grid of the journaled run.
+        """
+        return GridSpec(**(header["grid"] | {"Sizes": tuple(header["grid"]["Sizes"])}))
+
+    @classmethod
+    def runSuite(cls, inputArgs) -> list[str]:
+        """
+        :param inputArgs: The command line arguments passed when the program started.
+        :return: The name of every algorithm in the test suite being run, in the order their results are journaled.
+        """
+        return [str(name) for name in (SpeedySuite if inputArgs.reduced else FullSuite)]
+
+    @classmethod
+    def mismatchedOptions(cls, header: dict, inputArgs) -> list[str]:
+        """
+        Finds every option that was run differently than the journal was recorded with, along with the test suite if algorithms have been added since. The seed and grid only count if they were given on the command line.
+
+        :param header: The header record of the journal.
+        :param inputArgs: The command line arguments passed when the program started.
+        :return: The name of every mismatched option.
+        """
+        mismatched = [option for option in journalOptions if getattr(inputArgs, option) != header[option]]
+        if header["suite"] != cls.runSuite(inputArgs):
+            mismatched.append("suite")
+        if inputArgs.seed is not None and inputArgs.seed != header["seed"]:
+            mismatched.append("seed")
+        if inputArgs.grid is not None and inputArgs.grid != cls.readGrid(header):
+            mismatched.append("grid")
+        return mismatched
+
+    def recordTest(self, size: int, targetIndex: int, testNum: int, results: tuple[int, ...], measures: list[list[float]], answers: list[bool | None], disagree: list[bool] | None, 
+                   reduction: list[int] | None = None) -> None:
+        """
+        Records a finished test, with the iteration count, measurements and answer from each algorithm, and what each one that was run answered (in result order) if they disagreed. The set itself is not recorded, since it can be rebuilt from the seed.
+
+        :param size: The amount of integers in the set.
+        :param targetIndex: The size target index of the set.
+        :param testNum: The test number of the set.
+        :param results: The iteration counts, in the same order they are stored in by the experiment.
+        :param measures: The wall time, CPU time and peak memory of each algorithm, in the same order as results.
+        :param answers: The answer of each algorithm in the same order as results, or None for any that wasn't run.
+        :param disagree: The answer of each algorithm if they disagreed, or None if they all agreed.
+        :param reduction: What preprocessing left of the set, or None if it wasn't preprocessed.
+        """
+        self.write({"kind": "test", "size": size, "targetIndex": targetIndex, "testNum": testNum, "results": [int(result) for result in results], 
+                    "measures": [[float(value) for value in measure] for measure in measures], "answers": answers, "disagree": disagree, "reduction": reduction})
+
+    def recordSize(self, size: int, rawData) -> None:
+        """
+        Records that every test of a size has finished, along with the averages that were sent off for it. Is forced all the way to the disk, since losing one of these loses the most work.
+
+        :param size: The amount of integers in each set.
+        :param rawData: The results array of the size.
+        """
+        self.write({"kind": "size", "size": size, "results": rawData.tolist()})
+        os.fsync(self.file.fileno())
+
+    def write(self, record: dict) -> None:
+        """
+        Appends a single record to the end of the journal, and flushes it right away so a crash can lose at most the record being written.
+
+        :param record: The record to write.
+        """
+        self.file.write(json.dumps(record) + "\n")
+        self.file.flush()
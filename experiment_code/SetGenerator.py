@@ -0,0 +1,134 @@
+"""
+Builds the randomized sets given to every algorithm. Each set has its own random stream, picked out by its (integer count, target index, test number) coordinates and the seed of the run,
+so any set can be rebuilt exactly on any process just from where it sits in the experiment, instead of being generated once and shipped around.
+
+Written by bananathrowingmachine, Mar 9, 2026.
+"""
+from typing import Iterable
+import numpy as np
+
+class SetGenerator:
+    """
+    Class for building the randomized sets of a single integer count. Every set it makes is fully decided by the seed, the integer count, the target index and the test number,
+    so two generators made with the same seed will always make the exact same sets no matter what order they are asked for them in.
+    """
+    def __init__(self, size: int, seed: int, targetCount: int = 21, maxMagnitude: int = 32767):
+        """
+        Finds the sets of size n with the smallest possible and largest possible absolute sums, then finds the size each targetIndex should be.
+
+        :param size: The amount of integers that should be in each set.
+        :param seed: The seed of the entire run. Every random stream is spawned from it.
+        :param targetCount: How many target indexes to spread evenly from the smallest to the largest possible absolute sum. Must be at least 2.
+        :param maxMagnitude: The largest absolute value any integer in a set can have.
+        """
+        self.setCount = size
+        self.seed = seed
+        self.maxMagnitude = maxMagnitude
+        self.sumSizeTarget = [None for _ in range(targetCount)]
+        self.sumSizeBound = self.findAbsSumBounds() # The maximum allowed difference between the predetermined absolute sum (self.sumSize[i]) and the actual absolute sum.
+        self.intSizeBound = round(self.sumSizeBound/self.setCount)
+
+    def findAbsSumBounds(self) -> int:
+        """
+        Finds the smallest and largest possible set for the size given at object construction, in terms of sum of the absolute values inside of the set. Called by the constructor (so therefore you shouldn't call it).
+        Then fills in the rest of the sumSize as even increments from the smallest to the largest (5% each with the default 21 target indexes), and it's index in the array is known throught the class as "targetIndex".
+
+        :return: 1% of the distance between sumSizeTarget[0] and sumSizeTarget[-1]. Used for the set builder error, so that absolute sums don't leave a 1% range from the target absolute sum.
+        """
+        smallest = 0
+        biggest = self.maxMagnitude # Defaults to the signed 16 bit int limit, which I arbitrarily chose, I know python goes larger.
+        smallBound = 0
+        bigBound = 0
+        toggleChange = True # Due to the 0, the time when I increment smallest and decrement biggest are opposite, so this toggles which one happens.
+        for _ in range(self.setCount): # Since I'm building the max and min absolute sum of a set, instead of dealing with negatives and absolute values, I just add every positive twice.
+            smallBound += smallest
+            bigBound += biggest
+            if toggleChange: smallest += 1
+            else: biggest -= 1
+            toggleChange = not toggleChange
+        lastIndex = len(self.sumSizeTarget) - 1
+        self.sumSizeTarget[0] = smallBound
+        self.sumSizeTarget[lastIndex] = bigBound
+        increment = (bigBound - smallBound)/lastIndex
+        for i in range(1, lastIndex):
+            self.sumSizeTarget[i] = round(increment + self.sumSizeTarget[i-1])
+        return round((bigBound - smallBound)/100)
+
+    def canBuildEveryTarget(self) -> bool:
+        """
+        Checks that a set with no two integers sharing an absolute value can actually land within range of the smallest and largest target absolute sums, since those are the only ones that can be out of reach.
+        With a small max magnitude the smallest possible sums double up on absolute values, so the generator would otherwise keep throwing sets out forever.
+
+        :return: If every target index can be built.
+        """
+        smallestDistinct = self.setCount * (self.setCount - 1) // 2 # 0, 1, 2, ... up to the integer count.
+        largestDistinct = self.setCount * self.maxMagnitude - smallestDistinct # The max magnitude, then 1 less, then 2 less, and so on.
+        for target in (self.sumSizeTarget[0], self.sumSizeTarget[-1]):
+            lowest = max(target - self.sumSizeBound, self.sumSizeTarget[0], smallestDistinct)
+            highest = min(target + self.sumSizeBound, self.sumSizeTarget[-1], largestDistinct)
+            if lowest + lowest % 2 > highest: # The absolute sum always has to be even.
+                return False
+        return True
+
+    def stream(self, *coordinates: int) -> np.random.Generator:
+        """
+        Gives the random stream for a spot in the experiment. It's the exact child that SeedSequence.spawn would hand out at those indices (integer count, then each coordinate given),
+        just made directly so every sibling before it doesn't have to be spawned first.
+
+        :param coordinates: The coordinates after the integer count, normally the target index and test number.
+        :return: A generator that will always give the same numbers for the same seed and coordinates.
+        """
+        return np.random.default_rng(np.random.SeedSequence(self.seed, spawn_key=(self.setCount, *coordinates)))
+
+    def generateRandomSets(self, targetIndex: int, testNums: Iterable[int]) -> np.ndarray:
+        """
+        Generates the sets of random ints of size n and absolute sum +-1% of sumSize[targetIndex] for each test number all at once, one set per row. The absolute sum will also not be above sumSize[-1] or below sumSize[0], will always be even, and the sum will never be 0.
+        No two integers in a set share an absolute value. Uses numpy gaussian distribution to generate the sets, with every check done on the whole array at once and any set that still fails them getting thrown out and remade.
+        Each row only ever draws from its own stream and every step works row by row, so a set comes out the same whether it was made alone or alongside the rest of its target index.
+
+        :param targetIndex: The size target index of the sets, where 0 is smallest possible, the last index is largest possible, and everything else is even increments between them.
+        :param testNums: The test number of each set to generate, starting from 1.
+        :return: A 2D int32 array with one randomized set per row, in the same order as testNums.
+        """
+        streams = [self.stream(targetIndex, testNum) for testNum in testNums]
+        target = self.sumSizeTarget[targetIndex]
+        lowest = max(target - self.sumSizeBound, self.sumSizeTarget[0])
+        highest = min(target + self.sumSizeBound, self.sumSizeTarget[-1])
+        mean = target / self.setCount
+        standardDeviation = (self.intSizeBound * 6) / 12
+        columns = np.arange(self.setCount)
+        columnsLeft = self.setCount - 1 - columns
+
+        output = np.empty((len(streams), self.setCount), dtype=np.int32)
+        missing = np.arange(len(streams)) # The rows of output that still need a valid set.
+        while len(missing) != 0:
+            draws = np.array([streams[row].normal(mean, standardDeviation, self.setCount) for row in missing])
+            magnitudes = np.abs(np.rint(draws)).astype(np.int64)
+            magnitudes = np.abs(np.where(magnitudes > self.maxMagnitude, 2 * self.maxMagnitude - magnitudes, magnitudes)) # Wraps numbers that are too big around, similar to absolute value for negatives.
+            magnitudes += np.rint((target - magnitudes.sum(axis=1)) / self.setCount).astype(np.int64)[:, None] # Shifts each set so its absolute sum lands on the target.
+            magnitudes = np.clip(magnitudes, 0, self.maxMagnitude)
+
+            # Sorting each set lets duplicates be pushed apart without loops. The first pass makes every number at least 1 more than the one before it,
+            # and the second pass pulls numbers back down from the top so none go above the max magnitude, while keeping that same gap.
+            magnitudes.sort(axis=1)
+            magnitudes = np.maximum.accumulate(magnitudes - columns, axis=1) + columns
+            magnitudes = np.minimum(np.minimum.accumulate((magnitudes + columnsLeft)[:, ::-1], axis=1)[:, ::-1], self.maxMagnitude) - columnsLeft
+
+            # The sum being odd is trivial and uninteresting, so the biggest number goes up by 1 (or the smallest down by 1 if it can't), which can never make a duplicate.
+            odd = magnitudes.sum(axis=1) % 2 == 1
+            raiseBiggest = odd & (magnitudes[:, -1] < self.maxMagnitude)
+            lowerSmallest = odd & ~raiseBiggest & (magnitudes[:, 0] > 0)
+            magnitudes[raiseBiggest, -1] += 1
+            magnitudes[lowerSmallest, 0] -= 1
+
+            absSums = magnitudes.sum(axis=1)
+            signs = np.where(np.array([streams[row].integers(0, 2, self.setCount) for row in missing]) == 1, -1, 1)
+            order = np.array([streams[row].permutation(self.setCount) for row in missing])
+            sets = np.take_along_axis(magnitudes * signs, order, axis=1)
+
+            # The sum being equal to 0 is trivial and uninteresting, so those get remade along with any set that still missed its bounds.
+            valid = (absSums >= lowest) & (absSums <= highest) & (absSums % 2 == 0) & (sets.sum(axis=1) != 0)
+            output[missing[valid]] = sets[valid]
+            missing = missing[~valid]
+
+        return output
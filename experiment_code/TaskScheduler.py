@@ -0,0 +1,346 @@
+"""
+Runs every algorithm task of the experiment on one long lived pool of worker processes.
+Instead of giving each set size, target index, or test its own pool, every (set size, target index, test number, algorithm) combination is its own job, and they are all handed out longest expected job first to keep every core busy.
+
+Written by bananathrowingmachine, Mar 2, 2026.
+"""
+from data_processing_code.MiscDataCode import AlgoNames, TestJob, BatchJob, TestResult, GridSpec
+from experiment_code.SetGenerator import SetGenerator
+from experiment_code.Preprocessor import preprocess
+import concurrent.futures as ThreadPool
+from functools import lru_cache, partial
+from typing import Any, Callable, Iterable, Iterator
+import numpy as np
+import heapq, importlib, itertools, multiprocessing, os, sys, time
+
+try:
+    import resource
+except ImportError: # Windows has no resource module, and so no way to measure peak memory here.
+    resource = None
+
+workerRegistry: dict[AlgoNames, Callable[[np.ndarray], tuple[int, bool]]] = {}
+batchRegistry: dict[AlgoNames, Callable[[np.ndarray], list[tuple[int, bool]]]] = {}
+countsOnlyTasks: set[AlgoNames] = set()
+workerSeed: int | None = None
+workerGrid: GridSpec = GridSpec()
+
+def initWorker(inputArgs):
+    """
+    Initializer for each process in the shared worker pool. Imports the algorithm versions and fills in the registry exactly once per process, so that each task only has to do a dictionary lookup.
+
+    :param inputArgs: The command line arguments passed when the program started. Decides which versions of the algorithms get loaded, and gives the seed and grid used to rebuild sets.
+    """
+    global workerSeed, workerGrid
+    workerSeed = inputArgs.seed
+    workerGrid = inputArgs.grid
+    if inputArgs.python or inputArgs.numpy: # The NumPy backend only has the tabulated and meet in the middle versions, so the rest come from the Python versions.
+        from experiment_code.versions.python.MemoizedNormal import MemoizedNormal
+        from experiment_code.versions.python.OldMemoizedCrazy import OldMemoizedCrazy
+        from experiment_code.versions.python.NewMemoizedCrazy import NewMemoizedCrazy
+        import experiment_code.versions.python.TabulatedCrazy as TabulatedCrazy
+        import experiment_code.versions.python.TabulatedNormal as TabulatedNormal
+        from experiment_code.versions.python.RecursiveNormal import RecursiveNormal
+        import experiment_code.versions.python.MeetInMiddle as MeetInMiddle
+        versions = {AlgoNames.NewMemoizedCrazy: NewMemoizedCrazy.testIterations, AlgoNames.OldMemoizedCrazy: OldMemoizedCrazy.testIterations, 
+                    AlgoNames.MemoizedNormal: MemoizedNormal.testIterations, AlgoNames.TabulatedCrazy: TabulatedCrazy.testIterations, 
+                    AlgoNames.TabulatedNormal: TabulatedNormal.testIterations, AlgoNames.RecursiveNormal: RecursiveNormal.testIterations, AlgoNames.MeetInMiddle: MeetInMiddle.testIterations}
+        if inputArgs.numpy:
+            import experiment_code.versions.numpy.TabulatedCrazy as TabulatedCrazyNumPy
+            import experiment_code.versions.numpy.TabulatedNormal as TabulatedNormalNumPy
+            import experiment_code.versions.numpy.MeetInMiddle as MeetInMiddleNumPy
+            versions.update({AlgoNames.TabulatedCrazy: TabulatedCrazyNumPy.testIterations, AlgoNames.TabulatedNormal: TabulatedNormalNumPy.testIterations, AlgoNames.MeetInMiddle: MeetInMiddleNumPy.testIterations})
+        elif inputArgs.bitset:
+            versions.update({AlgoNames.TabulatedCrazy: TabulatedCrazy.testBitsetIterations, AlgoNames.TabulatedNormal: TabulatedNormal.testBitsetIterations})
+        if inputArgs.iterative is not None: # Giving --iterative with no algorithm names swaps every one that has an iterative version.
+            iterativeVersions = {AlgoNames.NewMemoizedCrazy: NewMemoizedCrazy, AlgoNames.OldMemoizedCrazy: OldMemoizedCrazy, AlgoNames.MemoizedNormal: MemoizedNormal, AlgoNames.RecursiveNormal: RecursiveNormal}
+            versions.update({taskName: partial(algorithm.testIterations, iterative=True) for taskName, algorithm in iterativeVersions.items() if len(inputArgs.iterative) == 0 or taskName in inputArgs.iterative})
+        workerRegistry.update({taskName: partial(runPythonVersion, version) for taskName, version in versions.items()})
+    else:
+        for taskName, fileName in {AlgoNames.NewMemoizedCrazy: "NewMemoizedCrazy", AlgoNames.OldMemoizedCrazy: "OldMemoizedCrazy", AlgoNames.MemoizedNormal: "MemoizedNormal", 
+                                   AlgoNames.TabulatedCrazy: "TabulatedCrazy", AlgoNames.TabulatedNormal: "TabulatedNormal", AlgoNames.RecursiveNormal: "RecursiveNormal", AlgoNames.MeetInMiddle: "MeetInMiddle"}.items():
+            module = importlib.import_module(f"experiment_code.versions.c_bin._{fileName}") # Each binary has its own ffi, which is the only one that knows its Output struct.
+            workerRegistry[taskName] = partial(runCVersion, module.lib, module.ffi)
+            batchRegistry[taskName] = partial(runCBatch, module.lib, module.ffi)
+    if inputArgs.countsOnly: # Both tabulated iteration counts are just the size of their table, so the only thing left to solve is the answer, which the rolling bitset does fastest.
+        import experiment_code.versions.python.TabulatedCrazy as TabulatedCrazyOracle
+        import experiment_code.versions.python.TabulatedNormal as TabulatedNormalOracle
+        for taskName, oracle in {AlgoNames.TabulatedCrazy: TabulatedCrazyOracle.testBitsetIterations, AlgoNames.TabulatedNormal: TabulatedNormalOracle.testBitsetIterations}.items():
+            workerRegistry[taskName] = partial(runPythonVersion, oracle)
+            batchRegistry.pop(taskName, None)
+            countsOnlyTasks.add(taskName)
+    if inputArgs.preprocess: # Wrapped last, so every version (oracles included) gets the exact same preprocessed sets.
+        for taskName, version in workerRegistry.items():
+            workerRegistry[taskName] = partial(runPreprocessed, version)
+        for taskName, version in batchRegistry.items():
+            batchRegistry[taskName] = partial(runPreprocessedBatch, version)
+
+def runPythonVersion(version: Callable[[list[int]], tuple[int, bool]], testList: np.ndarray) -> tuple[int, bool]:
+    """
+    Turns the set back into a list of Python ints (so the Python versions never do their math in int32) and runs the Python version on it.
+
+    :param version: The testIterations function of the algorithm.
+    :param testList: The set to be tested.
+    :return: The iteration count and then if the list is partitionable.
+    """
+    return version(testList.tolist())
+
+def runPreprocessed(version: Callable[[np.ndarray], tuple[int, bool]], testList: np.ndarray) -> tuple[int, bool]:
+    """
+    Runs a set through the preprocessing stage before handing whatever is left to a version. Sets the stage answers by itself never reach the version, and count as 0 iterations.
+
+    :param version: The registered version of the algorithm.
+    :param testList: The set to be tested.
+    :return: The iteration count and then if the list is partitionable.
+    """
+    reducedList, reduction = preprocess(testList)
+    if reduction.Answer is not None:
+        return (0, reduction.Answer)
+    return version(reducedList)
+
+def runPreprocessedBatch(version: Callable[[list[np.ndarray]], list[tuple[int, bool]]], testLists: np.ndarray) -> list[tuple[int, bool]]:
+    """
+    The batched version of runPreprocessed. Every set still left after preprocessing goes to the version in a single call, and the answered ones are slotted back in around them.
+
+    :param version: The registered batched version of the algorithm.
+    :param testLists: The sets to be tested, one per row.
+    :return: The iteration count and then if the list is partitionable, for each set in order.
+    """
+    reduced = [preprocess(testList) for testList in testLists]
+    unsolved = [reducedList for reducedList, reduction in reduced if reduction.Answer is None]
+    solved = iter(version(unsolved) if len(unsolved) != 0 else [])
+    return [(0, reduction.Answer) if reduction.Answer is not None else next(solved) for _, reduction in reduced]
+
+def runCVersion(lib, ffi, testList: np.ndarray) -> tuple[int, bool]:
+    """
+    Gives the set's own int32 buffer straight to the C version, and converts the output struct back into Python types. 
+
+    :param lib: The compiled cffi library of the algorithm.
+    :param ffi: The cffi interface used to pass the buffer along.
+    :param testList: The set to be tested, as a contiguous int32 array.
+    :return: The iteration count and then if the list is partitionable.
+    """
+    testList = np.ascontiguousarray(testList, dtype=np.int32)
+    result = lib.testIterations(ffi.from_buffer("int[]", testList), len(testList))
+    return (int(result.iterationCount), bool(result.result))
+
+def runCBatch(lib, ffi, testLists: np.ndarray | list[np.ndarray]) -> list[tuple[int, bool]]:
+    """
+    Gives every set to the C version with a single call, using the rows of the array as one contiguous buffer, and converts each output struct back into Python types.
+
+    :param lib: The compiled cffi library of the algorithm.
+    :param ffi: The cffi interface used to pass the buffers along.
+    :param testLists: The sets to be tested, one per row of a 2D int32 array, or a list of sets that can each be a different length (like after preprocessing).
+    :return: The iteration count and then if the list is partitionable, for each set in order.
+    """
+    if isinstance(testLists, np.ndarray):
+        flatLists = np.ascontiguousarray(testLists, dtype=np.int32)
+        offsets = np.arange(0, flatLists.size + 1, flatLists.shape[1], dtype=np.int32)
+    else: # Packed end to end, with the offsets marking where each one starts.
+        flatLists = np.ascontiguousarray(np.concatenate(testLists), dtype=np.int32)
+        offsets = np.cumsum([0] + [len(testList) for testList in testLists], dtype=np.int32)
+    outputs = ffi.new("Output[]", len(testLists))
+    lib.testIterationsBatch(ffi.from_buffer("int[]", flatLists), ffi.from_buffer("int[]", offsets), len(testLists), outputs)
+    return [(int(output.iterationCount), bool(output.result)) for output in outputs]
+
+@lru_cache(maxsize=None)
+def loadGenerator(intCount: int) -> SetGenerator:
+    """
+    Gives back the set generator for an integer count, only making it the first time this process needs it.
+
+    :param intCount: The amount of integers in each set.
+    :return: The set generator, using the seed and grid of the run.
+    """
+    return SetGenerator(intCount, workerSeed, workerGrid.TargetCount, workerGrid.MaxMagnitude)
+
+@lru_cache(maxsize=128)
+def loadSets(intCount: int, targetIndex: int, testNums: tuple[int, ...]) -> np.ndarray:
+    """
+    Rebuilds the sets at the given coordinates. Recently rebuilt sets are kept around, since the other algorithms of the same set often land on the same worker.
+
+    :param intCount: The amount of integers in each set.
+    :param targetIndex: The size target index of the sets.
+    :param testNums: The test number of each set.
+    :return: A 2D int32 array with one set per row, in the same order as testNums.
+    """
+    return loadGenerator(intCount).generateRandomSets(targetIndex, testNums)
+
+def markMemory() -> int:
+    """
+    Gets ready to measure the peak memory of whatever runs next. On Linux the peak memory of the process gets reset so only what runs next is counted, and elsewhere it falls back to the all time peak of the process, which only catches growth past the previous peak.
+
+    :return: The amount of memory to measure the next peak against, in bytes.
+    """
+    if sys.platform == 'linux':
+        try:
+            with open("/proc/self/clear_refs", "w") as file:
+                file.write("5") # Resets the peak resident memory of this process.
+            return readProcStatus("VmRSS")
+        except OSError:
+            pass
+    return peakMemory()
+
+def peakMemory() -> int:
+    """
+    Gets the peak memory of the process since the last call to markMemory, or all time if it can't be reset.
+
+    :return: The peak resident memory in bytes, or 0 if the platform has no way of telling.
+    """
+    if sys.platform == 'linux':
+        try:
+            return readProcStatus("VmHWM")
+        except OSError:
+            pass
+    if resource is None:
+        return 0
+    maxRss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxRss if sys.platform == 'darwin' else maxRss * 1024 # Mac gives bytes while everything else gives kilobytes.
+
+def readProcStatus(field: str) -> int:
+    """
+    Reads a memory field of /proc/self/status.
+
+    :param field: The name of the field.
+    :return: The field's value in bytes.
+    """
+    with open("/proc/self/status", "r") as file:
+        for line in file:
+            if line.startswith(field + ":"):
+                return int(line.split()[1]) * 1024
+    raise OSError(f"{field} is missing from /proc/self/status")
+
+def measure(run: Callable[[], Any]) -> tuple[Any, int, int, int]:
+    """
+    Runs something while measuring its wall time, the CPU time of this process, and how much the memory of this process peaked above where it started.
+
+    :param run: What to run.
+    :return: What it gave back, then the wall time and CPU time in nanoseconds, and then the peak memory in bytes.
+    """
+    memoryStart = markMemory()
+    cpuStart = time.process_time_ns()
+    wallStart = time.perf_counter_ns()
+    output = run()
+    wallTime = time.perf_counter_ns() - wallStart
+    cpuTime = time.process_time_ns() - cpuStart
+    return output, wallTime, cpuTime, max(peakMemory() - memoryStart, 0)
+
+def worker(taskName: AlgoNames, intCount: int, targetIndex: int, testNum: int) -> TestResult:
+    """
+    Worker function for the pool so that python can pickle everything. Relies on initWorker having already filled the registry for this process.
+    Only the coordinates of the set are sent over, and the set itself gets rebuilt here from its own random stream. Rebuilding the set is not included in the measurements. Preprocessing is, since it's part of solving the set.
+    
+    :param taskName: The name of the task
+    :param intCount: The amount of integers in the set
+    :param targetIndex: The size target index of the set
+    :param testNum: The test number of the set
+    :return: The result of the experiment, with the iteration count, if the list is partitionable, and how long and how much memory it took
+    """
+    testList = loadSets(intCount, targetIndex, (testNum,))[0]
+    if taskName in countsOnlyTasks: # Measuring the oracle would say nothing about the real algorithm, so it's left as not measured.
+        iterationCount, result = workerRegistry[taskName](testList)
+        return TestResult(iterationCount, result, np.nan, np.nan, np.nan)
+    (iterationCount, result), wallTime, cpuTime, memory = measure(lambda: workerRegistry[taskName](testList))
+    return TestResult(iterationCount, result, wallTime, cpuTime, memory)
+
+def batchWorker(taskName: AlgoNames, intCount: int, targetIndex: int, testNums: tuple[int, ...]) -> list[TestResult]:
+    """
+    Worker function for a whole batch of sets run on the same algorithm. Uses the batched entry point if the loaded versions have one, and otherwise just runs each set one after another.
+    The batched entry point can only be timed as a whole, so its time is split evenly between each set (which still gives the exact same averages) and each set is given the peak memory of the whole batch.
+
+    :param taskName: The name of the task
+    :param intCount: The amount of integers in every set of the batch
+    :param targetIndex: The size target index of every set of the batch
+    :param testNums: The test number of each set in the batch
+    :return: The result of the experiment on each set in order, with the iteration count, if the list is partitionable, and how long and how much memory it took
+    """
+    testLists = loadSets(intCount, targetIndex, testNums)
+    if taskName not in batchRegistry:
+        return [worker(taskName, intCount, targetIndex, testNum) for testNum in testNums]
+    results, wallTime, cpuTime, memory = measure(lambda: batchRegistry[taskName](testLists))
+    return [TestResult(iterationCount, result, wallTime / len(results), cpuTime / len(results), memory) for iterationCount, result in results]
+
+def warmWorker(delay: float) -> int:
+    """
+    Does nothing besides wait a moment, so that a batch of them forces every process in a pool to start up (and run initWorker) before any real tests are given out.
+
+    :param delay: How long to wait in seconds.
+    :return: The process id of the worker, so the scheduler knows which processes are its own.
+    """
+    time.sleep(delay)
+    return os.getpid()
+
+class TaskScheduler:
+    """
+    Hands out jobs to the shared worker pool in longest expected job first order. Only a couple of jobs per worker are given to the pool at once, so that jobs added while others are running still get sorted in properly.
+    Is meant to be used as a context manager, so that the pool gets shut down once the run is over.
+    """
+    def __init__(self, inputArgs, workerCount: int | None = None):
+        """
+        Creates the pool, sized to the amount of cores of the machine unless told otherwise, and waits for every worker in it to start up.
+
+        :param inputArgs: The command line arguments passed when the program started, given to each worker to decide which versions of the algorithms to load.
+        :param workerCount: How many worker processes to use. Defaults to one per core of the machine.
+        """
+        self.workerCount = workerCount if workerCount is not None else os.cpu_count() or 1
+        self.pool = ThreadPool.ProcessPoolExecutor(max_workers=self.workerCount, initializer=initWorker, initargs=(inputArgs,))
+        self.workerPids: set[int] = set()
+        while len(self.workerPids) < self.workerCount: # A worker can get more than one of the warm up jobs, so it's repeated until every worker has given back its process id.
+            self.workerPids.update(self.pool.map(warmWorker, [0.05] * self.workerCount))
+        self.maxActive = self.workerCount * 2
+        self.pending: list[tuple[float, int, TestJob | BatchJob]] = [] # A heap, with the expected cost negated so the longest job is on top.
+        self.active: dict[ThreadPool.Future, TestJob | BatchJob] = {}
+        self.jobOrder = itertools.count() # Tie breaker so that equally expensive jobs keep the order they were added in.
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        if excType is not None:
+            self.cancel()
+            for process in multiprocessing.active_children(): # After a Ctrl-C some workers can be left waiting on a pool that is already gone, which would keep this process from ever exiting.
+                if process.pid in self.workerPids:
+                    process.terminate()
+        self.pool.shutdown(wait=excType is None, cancel_futures=True)
+        return False
+
+    def addJobs(self, jobs: Iterable[TestJob | BatchJob]) -> None:
+        """
+        Adds jobs to the waiting list. Can be called at any time, including while results are being iterated over.
+
+        :param jobs: The jobs to add.
+        """
+        for job in jobs:
+            heapq.heappush(self.pending, (-job.ExpectedCost, next(self.jobOrder), job))
+
+    def results(self) -> Iterator[tuple[TestJob, TestResult]]:
+        """
+        Runs jobs until none are left, giving back each one the moment it finishes.
+
+        :return: An iterator of each finished job along with the iteration count, answer and measurements it produced. Batches are split back up into the jobs they were made of.
+        """
+        try:
+            while len(self.pending) != 0 or len(self.active) != 0:
+                while len(self.active) < self.maxActive and len(self.pending) != 0:
+                    job = heapq.heappop(self.pending)[2]
+                    if isinstance(job, BatchJob):
+                        self.active[self.pool.submit(batchWorker, job.Algorithm, job.Jobs[0].IntCount, job.Jobs[0].TargetIndex, tuple(subJob.TestNum for subJob in job.Jobs))] = job
+                    else:
+                        self.active[self.pool.submit(worker, job.Algorithm, job.IntCount, job.TargetIndex, job.TestNum)] = job
+                finished, _ = ThreadPool.wait(self.active, return_when=ThreadPool.FIRST_COMPLETED)
+                for future in finished:
+                    job = self.active.pop(future)
+                    if isinstance(job, BatchJob):
+                        yield from zip(job.Jobs, future.result())
+                    else:
+                        yield job, future.result()
+        except (KeyboardInterrupt, GeneratorExit):
+            self.cancel()
+            raise
+
+    def cancel(self) -> None:
+        """
+        Throws away every waiting job and cancels the ones that were already handed to the pool.
+        """
+        for future in self.active:
+            future.cancel()
+        self.active.clear()
+        self.pending.clear()
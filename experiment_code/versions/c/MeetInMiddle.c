@@ -0,0 +1,86 @@
+/**
+ * MeetInMiddle.py written completely in C. For more information check there.
+ * Builds each half's subset sums already sorted, by merging the sums so far with a copy of them shifted by the next integer, so no sort is ever needed.
+ *
+ * Made by bananathrowingmachine on Mar 20, 2026.
+ */
+#include <stdlib.h>
+#include <typedefs.h>
+#include <batch.h>
+
+static int* halfSums(int* numbers, int count);
+static uint8_t twoPointer(int* leftSums, int64_t leftCount, int* rightSums, int64_t rightCount, int goal);
+
+/**
+ * Tests the iteration count of the meet in the middle partition algorithm, which is how many half sums were generated.
+ */
+Output testIterations(int* inputList, int listLength) {
+  int sum = 0;
+  for (int i = 0; i < listLength; i++)
+    sum += inputList[i];
+  int half = listLength / 2;
+  int64_t leftCount = (int64_t)1 << half;
+  int64_t rightCount = (int64_t)1 << (listLength - half);
+  int* leftSums = halfSums(inputList, half);
+  int* rightSums = halfSums(inputList + half, listLength - half);
+
+  Output output;
+  output.iterationCount = leftCount + rightCount;
+  output.result = twoPointer(leftSums, leftCount, rightSums, rightCount, sum / 2);
+  free(leftSums);
+  free(rightSums);
+  return output;
+}
+
+/**
+ * Lists the sum of every subset of a half, smallest first.
+ *
+ * @param numbers The integers of the half.
+ * @param count How many integers are in the half.
+ * @returns An array of 2^count sorted sums, which the caller frees.
+ */
+static int* halfSums(int* numbers, int count) {
+  int64_t total = (int64_t)1 << count;
+  int* sums = malloc(total * sizeof(int));
+  int* merged = malloc(total * sizeof(int));
+  sums[0] = 0;
+  int64_t length = 1;
+  for (int i = 0; i < count; i++) {
+    int num = numbers[i];
+    int64_t plain = 0, shifted = 0, out = 0;
+    while (plain < length && shifted < length) { // Both the sums and the shifted sums are sorted, so this is a plain merge.
+      if (sums[plain] <= sums[shifted] + num)
+        merged[out++] = sums[plain++];
+      else
+        merged[out++] = sums[shifted++] + num;
+    }
+    while (plain < length)
+      merged[out++] = sums[plain++];
+    while (shifted < length)
+      merged[out++] = sums[shifted++] + num;
+    int* temp = sums; // Swapped after the merge, so sums is always the finished list.
+    sums = merged;
+    merged = temp;
+    length *= 2;
+  }
+  free(merged);
+  return sums;
+}
+
+/**
+ * Walks up the left sums and down the right sums at the same time, looking for a pair that adds up to the goal.
+ */
+static uint8_t twoPointer(int* leftSums, int64_t leftCount, int* rightSums, int64_t rightCount, int goal) {
+  int64_t leftIndex = 0;
+  int64_t rightIndex = rightCount - 1;
+  while (leftIndex < leftCount && rightIndex >= 0) {
+    int pairSum = leftSums[leftIndex] + rightSums[rightIndex];
+    if (pairSum == goal)
+      return 1;
+    if (pairSum < goal)
+      leftIndex++;
+    else
+      rightIndex--;
+  }
+  return 0;
+}
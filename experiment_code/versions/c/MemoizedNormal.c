@@ -1,14 +1,14 @@
 /**
  * Solves the partition problem using a top down dynamic programming algorithm, which is an algorithm that recurses but it stores results of solved subproblems and refers back to them if needed.
+ * Uses the same answer map as the memoized crazy versions. Its goals can be negative, so each one is shifted up by the negative sum before being stored, which keeps every goal between 0 and the absolute sum.
  *
  * Made by bananathrowingmachine on Feb 24, 2026.
  */
-#include <khash.h>
+#include <answerMap.h>
 #include <typedefs.h>
+#include <batch.h>
 
-KHASH_MAP_INIT_INT(answerMap, uint8_t)
-
-static uint8_t subsetSum(Constants* constants, int index, int goal, khash_t(answerMap) * h);
+static uint8_t subsetSum(Constants* constants, int index, int goal, AnswerMap* answerMap);
 
 /**
  * Tests the iteration count of a basic recursive partition algorithm.
@@ -25,46 +25,42 @@ Output testIterations(int* inputList, int listLength) {
     else
       constants.negSum += inputList[i];
   }
-  khash_t(answerMap)* hashTable = kh_init(answerMap);
+  AnswerMap answerMap;
+  answerMapInit(&answerMap, listLength, constants.posSum - constants.negSum);
   Output output;
-  output.result = subsetSum(&constants, 0, (constants.posSum + constants.negSum) / 2, hashTable);
-  output.iterationCount = kh_size(hashTable);
-  kh_destroy(answerMap, hashTable);
+  output.result = subsetSum(&constants, 0, (constants.posSum + constants.negSum) / 2, &answerMap);
+  output.iterationCount = answerMap.size;
+  answerMapDestroy(&answerMap);
   return output;
 }
 
 /**
  * Solves the subset sum problem recursively with memoized answers to prevent calculating the same subproblem multiple times.
+ *
+ * @param constants Pointer to the constants throughtout execution.
+ * @param index The current index.
+ * @param goal The current goal, which can be negative.
+ * @param answerMap Pointer to the answer map, whose size is the iteration count.
  */
-static uint8_t subsetSum(Constants* constants, int index, int goal, khash_t(answerMap) * hashTable) {
-  int ret;
-  khiter_t hashIter;
+static uint8_t subsetSum(Constants* constants, int index, int goal, AnswerMap* answerMap) {
   if (goal == 0)
     return 1;
   if (index >= constants->listLength)
     return 0;
 
   int goalDiff = goal - constants->inputList[index];
-  if (goalDiff < constants->posSum && goalDiff > constants->negSum) {
-    uint8_t take;
-    int num = ((uint32_t)(goalDiff) << 7) | (index + 1);
-    hashIter = kh_put(answerMap, hashTable, num, &ret);
-    if (ret == 0)
-      take = kh_val(hashTable, hashIter);
-    else
-      take = subsetSum(constants, index + 1, goalDiff, hashTable);
+  if (goalDiff <= constants->posSum && goalDiff >= constants->negSum) {
+    int take = answerMapGet(answerMap, index + 1, goalDiff - constants->negSum);
+    if (take == -1)
+      take = subsetSum(constants, index + 1, goalDiff, answerMap);
     if (take) {
-      kh_val(hashTable, kh_put(answerMap, hashTable, num - 1, &ret)) = 1;
+      answerMapSet(answerMap, index, goal - constants->negSum, 1);
       return 1;
     }
   }
-  uint8_t skip;
-  int num = ((uint32_t)(goal) << 7) | (index + 1);
-  hashIter = kh_put(answerMap, hashTable, num, &ret);
-  if (ret == 0)
-    skip = kh_val(hashTable, hashIter);
-  else
-    skip = subsetSum(constants, index + 1, goal, hashTable);
-  kh_val(hashTable, kh_put(answerMap, hashTable, num - 1, &ret)) = skip;
+  int skip = answerMapGet(answerMap, index + 1, goal - constants->negSum);
+  if (skip == -1)
+    skip = subsetSum(constants, index + 1, goal, answerMap);
+  answerMapSet(answerMap, index, goal - constants->negSum, skip);
   return skip;
-}
\ No newline at end of file
+}
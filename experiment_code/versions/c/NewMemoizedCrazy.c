@@ -1,42 +1,94 @@
 /**
  * NewMemoizedCrazy.py written completely in C. For more information check there.
- * NOT IMPLEMENTED YET THIS JUST PUTS THE ARRAYS SUM IN ITERATIONCOUNT AND RETURNS TRUE (used for C->Python testing)
+ * Uses the same heuristics in the same order, so it gives the exact same iteration count and answer as the Python version.
  *
  * Made by bananathrowingmachine on Feb 17, 2026.
  */
-#include <khash.h>
+#include <answerMap.h>
 #include <typedefs.h>
+#include <batch.h>
 
-static uint8_t subsetSum(Constants* constants, int index, int goal, int* iterationCount);
+typedef struct CrazyConstants {
+  int* absoluteList;
+  int* remainingSum;
+  int listLength;
+} CrazyConstants;
+
+static uint8_t subsetSum(CrazyConstants* constants, int index, int goal, AnswerMap* answerMap);
 
 /**
- * Tests the iteration count of a basic recursive partition algorithm.
+ * Sorts integers from biggest to smallest with qsort.
+ */
+static int descending(const void* a, const void* b) {
+  int first = *(const int*)a;
+  int second = *(const int*)b;
+  return (first < second) - (first > second);
+}
+
+/**
+ * Tests the iteration count of the memoized crazy partition algorithm. Works on its own copy of the list, so the caller's list is never changed.
  */
 Output testIterations(int* inputList, int listLength) {
-  Constants constants;
-  constants.inputList = inputList;
-  constants.listLength = listLength;
-  constants.posSum = 0;
-  constants.negSum = 0;
+  int* absoluteList = malloc((listLength + 1) * sizeof(int));
+  int* remainingSum = malloc((listLength + 1) * sizeof(int));
+  int sum = 0;
   for (int i = 0; i < listLength; i++) {
-    if (inputList[i] > 0)
-      constants.posSum += inputList[i];
-    else
-      constants.negSum += inputList[i];
+    absoluteList[i] = inputList[i];
+    sum += abs(inputList[i]);
+  }
+  qsort(absoluteList, listLength, sizeof(int), descending); // Sorted with their signs still on, same as the Python version.
+  remainingSum[listLength] = 0;
+  for (int i = listLength - 1; i >= 0; i--) {
+    absoluteList[i] = abs(absoluteList[i]);
+    remainingSum[i] = remainingSum[i + 1] + absoluteList[i];
   }
+
+  CrazyConstants constants;
+  constants.absoluteList = absoluteList;
+  constants.remainingSum = remainingSum;
+  constants.listLength = listLength;
+  AnswerMap answerMap;
+  answerMapInit(&answerMap, listLength, sum / 2);
   Output output;
-  output.iterationCount = 0;
-  output.result = subsetSum(&constants, 0, (constants.posSum + constants.negSum) / 2, &output.iterationCount);
+  output.result = subsetSum(&constants, 0, sum / 2, &answerMap);
+  output.iterationCount = answerMap.size;
+  answerMapDestroy(&answerMap);
+  free(absoluteList);
+  free(remainingSum);
   return output;
 }
 
 /**
- * Solves the subset sum problem recursively.
- * NOT IMPLEMENTED YET THIS JUST PUTS THE ARRAYS ABSOLUTE SUM IN ITERATIONCOUNT AND RETURNS TRUE (used for C->Python testing)
+ * Solves the subset sum problem recursively with memoized answers, skipping any subproblem whose goal can't (or can only just) be reached by everything left in the list.
+ *
+ * @param constants Pointer to the sorted absolute list and its suffix sums.
+ * @param index The current index.
+ * @param goal The current goal.
+ * @param answerMap Pointer to the answer map, whose size is the iteration count.
  */
-static uint8_t subsetSum(Constants* constants, int index, int goal, int* iterationCount) {
-  for (int i = 0; i < constants->listLength; i++)
-    *iterationCount += abs(constants->inputList[i]);
-  *iterationCount *= 1;
-  return 1;
-}
\ No newline at end of file
+static uint8_t subsetSum(CrazyConstants* constants, int index, int goal, AnswerMap* answerMap) {
+  if (goal == 0)
+    return 1;
+  if (index >= constants->listLength)
+    return 0;
+  if (goal - constants->remainingSum[index] > 0)
+    return 0;
+  if (goal - constants->remainingSum[index] == 0)
+    return 1;
+
+  int number = constants->absoluteList[index];
+  if (goal >= number) { // Bounds checking, better than the others though as it can use the current goal.
+    int take = answerMapGet(answerMap, index + 1, goal - number);
+    if (take == -1)
+      take = subsetSum(constants, index + 1, goal - number, answerMap);
+    if (take) {
+      answerMapSet(answerMap, index, goal, 1);
+      return 1;
+    }
+  }
+  int skip = answerMapGet(answerMap, index + 1, goal);
+  if (skip == -1)
+    skip = subsetSum(constants, index + 1, goal, answerMap);
+  answerMapSet(answerMap, index, goal, skip);
+  return skip;
+}
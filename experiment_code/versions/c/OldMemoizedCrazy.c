@@ -1,42 +1,66 @@
 /**
  * OldMemoizedCrazy.py written completely in C. For more information check there.
- * NOT IMPLEMENTED YET THIS JUST PUTS THE ARRAYS SUM IN ITERATIONCOUNT AND RETURNS TRUE (used for C->Python testing)
+ * Gives the exact same iteration count and answer as the Python version.
  *
  * Made by bananathrowingmachine on Feb 17, 2026.
  */
-#include <khash.h>
+#include <answerMap.h>
 #include <typedefs.h>
+#include <batch.h>
 
-static uint8_t subsetSum(Constants* constants, int index, int goal, int* iterationCount);
+static uint8_t subsetSum(Constants* constants, int index, int goal, AnswerMap* answerMap);
 
 /**
- * Tests the iteration count of a basic recursive partition algorithm.
+ * Tests the iteration count of the old memoized crazy partition algorithm. Works on its own copy of the list, so the caller's list is never changed.
  */
 Output testIterations(int* inputList, int listLength) {
-  Constants constants;
-  constants.inputList = inputList;
-  constants.listLength = listLength;
-  constants.posSum = 0;
-  constants.negSum = 0;
+  int* absoluteList = malloc((listLength + 1) * sizeof(int));
+  int sum = 0;
   for (int i = 0; i < listLength; i++) {
-    if (inputList[i] > 0)
-      constants.posSum += inputList[i];
-    else
-      constants.negSum += inputList[i];
+    absoluteList[i] = abs(inputList[i]);
+    sum += absoluteList[i];
   }
+
+  Constants constants;
+  constants.inputList = absoluteList;
+  constants.listLength = listLength;
+  AnswerMap answerMap;
+  answerMapInit(&answerMap, listLength, sum / 2);
   Output output;
-  output.iterationCount = 0;
-  output.result = subsetSum(&constants, 0, (constants.posSum + constants.negSum) / 2, &output.iterationCount);
+  output.result = subsetSum(&constants, 0, sum / 2, &answerMap);
+  output.iterationCount = answerMap.size;
+  answerMapDestroy(&answerMap);
+  free(absoluteList);
   return output;
 }
 
 /**
- * Solves the subset sum problem recursively.
- * NOT IMPLEMENTED YET THIS JUST PUTS THE ARRAYS ABSOLUTE SUM IN ITERATIONCOUNT AND RETURNS TRUE (used for C->Python testing)
+ * Solves the subset sum problem recursively with memoized answers, only ever checking skip if take didn't work.
+ *
+ * @param constants Pointer to the constants throughtout execution, where inputList is the absolute list.
+ * @param index The current index.
+ * @param goal The current goal.
+ * @param answerMap Pointer to the answer map, whose size is the iteration count.
  */
-static uint8_t subsetSum(Constants* constants, int index, int goal, int* iterationCount) {
-  for (int i = 0; i < constants->listLength; i++)
-    *iterationCount += abs(constants->inputList[i]);
-  *iterationCount *= 2;
-  return 1;
-}
\ No newline at end of file
+static uint8_t subsetSum(Constants* constants, int index, int goal, AnswerMap* answerMap) {
+  if (goal == 0)
+    return 1;
+  if (index >= constants->listLength)
+    return 0;
+
+  int number = constants->inputList[index];
+  if (goal >= number) { // Bounds checking, better than the others though as it can use the current goal.
+    int take = answerMapGet(answerMap, index + 1, goal - number);
+    if (take == -1)
+      take = subsetSum(constants, index + 1, goal - number, answerMap);
+    if (take) {
+      answerMapSet(answerMap, index, goal, 1);
+      return 1;
+    }
+  }
+  int skip = answerMapGet(answerMap, index + 1, goal);
+  if (skip == -1)
+    skip = subsetSum(constants, index + 1, goal, answerMap);
+  answerMapSet(answerMap, index, goal, skip);
+  return skip;
+}
@@ -7,8 +7,9 @@
  * Made by bananathrowingmachine on Feb 17, 2026.
  */
 #include <typedefs.h>
+#include <batch.h>
 
-static uint8_t subsetSum(Constants* constants, int index, int goal, int* iterationCount);
+static uint8_t subsetSum(Constants* constants, int index, int goal, int64_t* iterationCount);
 
 Output testIterations(int* inputList, int listLength) {
   Constants constants;
@@ -36,7 +37,7 @@ Output testIterations(int* inputList, int listLength) {
  * @param goal The current goal.
  * @param iterationCount Pointer to the algorithm iteration count.
  */
-static uint8_t subsetSum(Constants* constants, int index, int goal, int* iterationCount) {
+static uint8_t subsetSum(Constants* constants, int index, int goal, int64_t* iterationCount) {
   if (goal == 0)
     return 1;
   if (index >= constants->listLength)
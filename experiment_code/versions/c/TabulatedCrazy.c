@@ -1,46 +1,54 @@
 /**
  * Solves the partition problem using a bottom up dynamic programming algorithm, which is an algorithm that iteratively fills a list of subproblems in reverse order to then end at the answer.
  * Additionally uses an absolute value trick to reduce the dynamic programming array by half.
- * UNFINISHED
  *
  * Made by bananathrowingmachine on Feb 24, 2026.
  */
 #include <typedefs.h>
+#include <batch.h>
 
 static Output partition(Constants* constants, int index, int goal);
 
+/**
+ * Tests the iteration count of the tabulated crazy partition algorithm. Works on its own copy of the absolute values, so the caller's list is never changed.
+ */
 Output testIterations(int* inputList, int listLength) {
+  int* absoluteList = malloc((listLength + 1) * sizeof(int));
   Constants constants;
   constants.posSum = 0;
   for (int i = 0; i < listLength; i++) {
-    int absNumber = abs(inputList[i]);
-    constants.posSum += absNumber;
-    inputList[i] = absNumber;
+    absoluteList[i] = abs(inputList[i]);
+    constants.posSum += absoluteList[i];
   }
-  constants.inputList = inputList;
+  constants.inputList = absoluteList;
   constants.listLength = listLength;
-  return partition(&constants, 0, constants.posSum / 2);
+  Output output = partition(&constants, 0, constants.posSum / 2);
+  free(absoluteList);
+  return output;
 }
 
 /**
  * Solves the partition problem with dynamic programming.
  */
 static Output partition(Constants* constants, int index, int goal) {
-  uint8_t* prev = calloc(goal + 1, sizeof(uint8_t));
+  uint8_t* prev = calloc(goal + 1, sizeof(uint8_t)); // The row below the table, where only the empty set (summing to 0) has been considered.
   uint8_t* next = malloc(goal + 1);
+  prev[0] = 1;
 
   for (int i = constants->listLength - 1; i >= 0; i--) {
-    uint8_t* temp = prev;
-    prev = next;
-    next = temp;
     next[0] = 1;
     for (int j = 1; j < goal + 1; j++) {
       next[j] = prev[j] || (constants->inputList[i] <= j && prev[j - constants->inputList[i]]);
     }
+    uint8_t* temp = prev; // Swapped after the row is filled, so prev is always the last finished row.
+    prev = next;
+    next = temp;
   }
 
   Output output;
-  output.iterationCount = goal * constants->listLength;
-  output.result = next[goal];
+  output.iterationCount = (int64_t)goal * constants->listLength;
+  output.result = prev[goal];
+  free(prev);
+  free(next);
   return output;
 }
\ No newline at end of file
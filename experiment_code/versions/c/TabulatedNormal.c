@@ -4,6 +4,7 @@
  * Made by bananathrowingmachine on Feb 24, 2026.
  */
 #include <typedefs.h>
+#include <batch.h>
 
 static Output partition(Constants* constants, int index, int goal);
 
@@ -30,12 +31,9 @@ static Output partition(Constants* constants, int index, int goal) {
   int sumRange = constants->posSum + absNegSum + 1;
   uint8_t* prev = calloc(sumRange, sizeof(uint8_t));
   uint8_t* next = malloc(sumRange);
-  prev[absNegSum] = 1;
+  prev[absNegSum] = 1; // The row below the table, where only the empty set (summing to 0) has been considered.
 
   for (int i = constants->listLength - 1; i >= 0; i--) {
-    uint8_t* temp = prev;
-    prev = next;
-    next = temp;
     for (int j = constants->negSum; j <= constants->posSum; j++) {
       int nextGoal = j - constants->inputList[i];
       if (nextGoal > constants->posSum || nextGoal < constants->negSum)
@@ -43,10 +41,15 @@ static Output partition(Constants* constants, int index, int goal) {
       else
         next[j + absNegSum] = prev[j + absNegSum] || prev[nextGoal + absNegSum];
     }
+    uint8_t* temp = prev; // Swapped after the row is filled, so prev is always the last finished row.
+    prev = next;
+    next = temp;
   }
 
   Output output;
-  output.iterationCount = sumRange * constants->listLength;
-  output.result = next[(constants->posSum - absNegSum) / 2 + absNegSum];
+  output.iterationCount = (int64_t)sumRange * constants->listLength;
+  output.result = prev[(constants->posSum - absNegSum) / 2 + absNegSum];
+  free(prev);
+  free(next);
   return output;
 }
\ No newline at end of file
@@ -0,0 +1,86 @@
+/**
+ * Answer map shared by the memoized versions. Since their goals never go below 0 or above the starting goal (once Memoized Normal shifts its goals up by the negative sum), every subproblem can be given its own spot in a dense table,
+ * which is used (at 2 bits a subproblem) whenever the whole table fits under DENSE_MEMO_LIMIT subproblems. Anything bigger falls back to a khash map of packed (goal, index) keys.
+ * Compile with -DDENSE_MEMO_LIMIT=0 to always use the khash map.
+ *
+ * Made by bananathrowingmachine on Mar 16, 2026.
+ */
+#ifndef ANSWERMAP_H
+#define ANSWERMAP_H
+#include <stdlib.h>
+#include <khash.h>
+#include <typedefs.h>
+
+#ifndef DENSE_MEMO_LIMIT
+#define DENSE_MEMO_LIMIT (1 << 26) // 16 MiB of table.
+#endif
+
+KHASH_MAP_INIT_INT64(answerMap, uint8_t)
+
+typedef struct AnswerMap {
+  uint8_t* dense; // 4 subproblems a byte, where 0 is unsolved, 1 is false and 2 is true. NULL if the khash map is used instead.
+  khash_t(answerMap) * sparse;
+  int64_t rowLength;
+  int shift;
+  int64_t size;
+} AnswerMap;
+
+/**
+ * Sets up an empty answer map, picking the dense table if it fits.
+ *
+ * @param map The answer map to set up.
+ * @param listLength The length of the input list, so indexes go from 0 to listLength.
+ * @param goal The starting goal, which is the largest goal that can ever be asked about.
+ */
+static void answerMapInit(AnswerMap* map, int listLength, int goal) {
+  map->size = 0;
+  map->dense = NULL;
+  map->sparse = NULL;
+  map->rowLength = (int64_t)goal + 1;
+  map->shift = 0;
+  while ((1 << map->shift) <= listLength)
+    map->shift++;
+  if (goal >= 0 && map->rowLength * (listLength + 1) <= DENSE_MEMO_LIMIT)
+    map->dense = calloc((map->rowLength * (listLength + 1) + 3) / 4, sizeof(uint8_t));
+  if (map->dense == NULL)
+    map->sparse = kh_init(answerMap);
+}
+
+/**
+ * Looks up a subproblem.
+ *
+ * @returns 1 or 0 for a solved subproblem, or -1 if it hasn't been solved yet.
+ */
+static inline int answerMapGet(AnswerMap* map, int index, int goal) {
+  if (map->dense != NULL) {
+    int64_t cell = index * map->rowLength + goal;
+    return ((map->dense[cell >> 2] >> ((cell & 3) << 1)) & 3) - 1;
+  }
+  khiter_t hashIter = kh_get(answerMap, map->sparse, ((int64_t)goal << map->shift) | index);
+  return hashIter == kh_end(map->sparse) ? -1 : kh_val(map->sparse, hashIter);
+}
+
+/**
+ * Records the answer to a subproblem. Every subproblem is only ever recorded once, so the size of the map is the amount of subproblems solved.
+ */
+static inline void answerMapSet(AnswerMap* map, int index, int goal, uint8_t answer) {
+  map->size++;
+  if (map->dense != NULL) {
+    int64_t cell = index * map->rowLength + goal;
+    map->dense[cell >> 2] |= (answer + 1) << ((cell & 3) << 1);
+    return;
+  }
+  int ret;
+  khiter_t hashIter = kh_put(answerMap, map->sparse, ((int64_t)goal << map->shift) | index, &ret);
+  kh_val(map->sparse, hashIter) = answer;
+}
+
+/**
+ * Frees whichever table the answer map used.
+ */
+static void answerMapDestroy(AnswerMap* map) {
+  free(map->dense);
+  if (map->sparse != NULL)
+    kh_destroy(answerMap, map->sparse);
+}
+#endif
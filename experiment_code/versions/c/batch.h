@@ -0,0 +1,18 @@
+/**
+ * Batched entry point shared by every C version, so that a whole group of sets can be solved with a single call from Python instead of one call per set.
+ *
+ * Made by bananathrowingmachine on Mar 5, 2026.
+ */
+#include <typedefs.h>
+
+/**
+ * Runs testIterations on every list in the buffer. The loop is an OpenMP parallel for if compiled with OpenMP, and a plain loop otherwise.
+ * OpenMP is not turned on by default, as the experiment already runs one worker process per core.
+ */
+void testIterationsBatch(int* flatLists, int* offsets, int numLists, Output* out) {
+#ifdef _OPENMP
+#pragma omp parallel for schedule(dynamic)
+#endif
+  for (int i = 0; i < numLists; i++)
+    out[i] = testIterations(flatLists + offsets[i], offsets[i + 1] - offsets[i]);
+}
@@ -3,6 +3,8 @@
  *
  * Made by bananathrowingmachine of Feb 17, 2024
  */
+#ifndef TYPEDEFS_H
+#define TYPEDEFS_H
 #include <stdint.h>
 
 typedef struct Constants {
@@ -13,7 +15,7 @@ typedef struct Constants {
 } Constants;
 
 typedef struct Output {
-  int iterationCount;
+  int64_t iterationCount;
   uint8_t result;
 } Output;
 
@@ -25,3 +27,14 @@ typedef struct Output {
  * @returns Struct of the iteration count followed by a boolean on if the input can be partitioned.
  */
 Output testIterations(int* inputList, int listLength);
+
+/**
+ * Tests the iteration count of the algorithm it shares a file with on many lists at once, all stored one after another in a single buffer.
+ *
+ * @param flatLists Every list to be tested on, stored back to back.
+ * @param offsets Where each list starts in flatLists, with one extra entry at the end for where the last list ends (so numLists + 1 entries).
+ * @param numLists The amount of lists in flatLists.
+ * @param out Array of numLists outputs, which gets filled in with the output of each list in order.
+ */
+void testIterationsBatch(int* flatLists, int* offsets, int numLists, Output* out);
+#endif
@@ -0,0 +1,33 @@
+"""
+MeetInMiddle.py from the Python versions, but with the half sums built and searched by NumPy. For more information check there.
+Instead of walking the two lists with a pointer each, every left sum binary searches the right sums for its partner all at once, which finds a pair exactly when the two pointer walk would.
+
+Made by bananathrowingmachine on Mar 20, 2026.
+"""
+import numpy as np
+
+def testIterations(inputList: list[int]) -> tuple[int, bool]:
+    """
+    Splits the set in half and sends both halves off to be solved. Same iteration count as the Python version, so results stay comparable.
+
+    :param inputList: The inputted list to solve the partition question on.
+    :return: A tuple containing the iteration count, and the computed answer.
+    """
+    half = len(inputList) // 2
+    leftSums = halfSums(inputList[:half])
+    rightSums = np.sort(halfSums(inputList[half:]))
+    partners = int(sum(inputList) / 2) - leftSums
+    spots = np.minimum(np.searchsorted(rightSums, partners), len(rightSums) - 1)
+    return len(leftSums) + len(rightSums), bool(np.any(rightSums[spots] == partners))
+
+def halfSums(numbers: list[int]) -> np.ndarray:
+    """
+    Lists the sum of every subset of a half, doubling the array once per integer.
+
+    :param numbers: The integers of the half.
+    :return: Every subset sum of the half (with repeats), in no particular order.
+    """
+    sums = np.zeros(1, dtype=np.int64)
+    for num in numbers:
+        sums = np.concatenate((sums, sums + num))
+    return sums
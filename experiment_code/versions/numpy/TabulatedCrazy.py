@@ -0,0 +1,34 @@
+"""
+TabulatedCrazy.py from the Python versions, but with each row of the table filled in all at once by NumPy. For more information check there.
+Only ever keeps the current row since each row only depends on the one before it.
+
+Made by bananathrowingmachine on Mar 4, 2026.
+"""
+import numpy as np
+
+def testIterations(inputList: list[int]) -> tuple[int, bool]:
+    """
+    Maps the set to it's absolute values, then sends it off to partition and returns it's answer directly.
+
+    :param inputList: The inputted list to solve the partition question on.
+    :return: A tuple containing the iteration count, and the computed answer.
+    """
+    absList = list(map(abs, inputList))
+    return partition(absList)
+
+def partition(inputList: list[int]) -> tuple[int, bool]:
+    """
+    Solves the partition problem with dynamic programming, one vector OR of the row with a shifted copy of itself per integer in the set.
+
+    :param inputList: The inputted list to solve the partition question on. Must be all non negative.
+    :return: A tuple containing the iteration count, and the computed answer.
+    """
+    goal = int(sum(inputList) / 2)
+    row = np.zeros(goal + 1, dtype=np.bool_)
+    row[0] = True # Only the empty set has been considered, which sums to 0.
+
+    for num in reversed(inputList):
+        if 0 < num <= goal:
+            row[num:] |= row[:-num] # NumPy copies overlapping operands first, so this reads the previous row.
+
+    return (goal * len(inputList), bool(row[goal])) # Same iteration count as the Python version, so results stay comparable.
@@ -0,0 +1,45 @@
+"""
+TabulatedNormal.py from the Python versions, but with each row of the table filled in all at once by NumPy. For more information check there.
+Uses the same negSum..posSum layout as the Python version, with sum j stored at index j - negSum, and only ever keeps the current row since each row only depends on the one before it.
+
+Made by bananathrowingmachine on Mar 4, 2026.
+"""
+import numpy as np
+
+def testIterations(inputList: list[int]) -> tuple[int, bool]:
+    """
+    Finds a few details about the input set then send it off to partition and returns it's answer directly.
+
+    :param inputList: The inputted list to solve the partition question on.
+    :return: A tuple containing the iteration count, and the computed answer.
+    """
+    posSum = 0
+    negSum = 0
+    for num in inputList:
+        if num > 0:
+            posSum += num
+        else:
+            negSum += num
+    return partition(inputList, posSum, negSum)
+
+def partition(inputList: list[int], posSum: int, negSum: int) -> tuple[int, bool]:
+    """
+    Solves the partition problem with dynamic programming, one vector OR of the row with a shifted copy of itself per integer in the set.
+    The bounds checking of the Python version is handled by the slicing, as a shifted sum that would leave negSum..posSum is simply cut off.
+
+    :param inputList: The inputted list to solve the partition question on.
+    :param posSum: The sum of all the positive integers in the set.
+    :param negSum: The sum of all the negative integers in the set.
+    :return: A tuple containing the iteration count, and the computed answer.
+    """
+    sumRange = posSum + abs(negSum) + 1
+    row = np.zeros(sumRange, dtype=np.bool_)
+    row[abs(negSum)] = True # Only the empty set has been considered, which sums to 0.
+
+    for num in reversed(inputList):
+        if num > 0:
+            row[num:] |= row[:-num] # NumPy copies overlapping operands first, so this reads the previous row.
+        elif num < 0:
+            row[:num] |= row[-num:]
+
+    return (sumRange * len(inputList), bool(row[int((posSum + negSum) / 2) - negSum])) # Same iteration count as the Python version, so results stay comparable.
@@ -0,0 +1,53 @@
+"""
+Solves the partition problem with the Horowitz and Sahni meet in the middle algorithm, which splits the set into two halves, lists every subset sum of each half, and then walks the two sorted lists towards each other looking for a pair that adds up to the goal.
+It takes 2^(n/2) time no matter how big the integers are, so it's slowest where the dynamic programming algorithms are fastest and fastest where they are slowest (sets with few integers but huge sums).
+Like Recursive Normal it works on the signed integers, so it gives the exact answer to the same subset sum question every other algorithm is asked.
+
+The algorithm is from Horowitz and Sahni's 1974 paper "Computing Partitions with Applications to the Knapsack Problem".
+
+Made by bananathrowingmachine on Mar 20, 2026.
+"""
+def testIterations(inputList: list[int]) -> tuple[int, bool]:
+    """
+    Splits the set in half and sends both halves off to be solved. The iteration count is how many half sums were generated, which is always 2^(first half) + 2^(second half).
+
+    :param inputList: The inputted list to solve the partition question on.
+    :return: A tuple containing the iteration count, and the computed answer.
+    """
+    half = len(inputList) // 2
+    leftSums = halfSums(inputList[:half])
+    rightSums = halfSums(inputList[half:])
+    return len(leftSums) + len(rightSums), twoPointer(leftSums, rightSums, int(sum(inputList) / 2))
+
+def halfSums(numbers: list[int]) -> list[int]:
+    """
+    Lists the sum of every subset of a half, smallest first. Each integer doubles the list, by adding a copy of it shifted by that integer, and since both copies are already sorted the sort only has to merge two runs.
+
+    :param numbers: The integers of the half.
+    :return: Every subset sum of the half (with repeats), sorted.
+    """
+    sums = [0]
+    for num in numbers:
+        sums = sorted(sums + [subsetSum + num for subsetSum in sums]) # Timsort finds the two sorted runs, so this is a single linear merge.
+    return sums
+
+def twoPointer(leftSums: list[int], rightSums: list[int], goal: int) -> bool:
+    """
+    Walks up the left sums and down the right sums at the same time, looking for a pair that adds up to the goal. If the pair is too small the left sum has to grow, and if it's too big the right sum has to shrink, so every pair that could work gets passed by.
+
+    :param leftSums: Every subset sum of the first half, sorted.
+    :param rightSums: Every subset sum of the second half, sorted.
+    :param goal: The goal the pair needs to add up to.
+    :return: If some subset of the whole set adds up to the goal.
+    """
+    leftIndex = 0
+    rightIndex = len(rightSums) - 1
+    while leftIndex < len(leftSums) and rightIndex >= 0:
+        pairSum = leftSums[leftIndex] + rightSums[rightIndex]
+        if pairSum == goal:
+            return True
+        if pairSum < goal:
+            leftIndex += 1
+        else:
+            rightIndex -= 1
+    return False
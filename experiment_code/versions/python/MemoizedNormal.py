@@ -17,7 +17,8 @@ class MemoizedNormal:
         :param inputList: The inputted list, which is simply stored for easy reference by the algorithm later.
         """
         self.inputList = inputList
-        self.answerMap: dict[tuple[int, int], bool] = {}
+        self.answerMap: dict[int, bool] = {}
+        self.shift = len(self.inputList).bit_length() # How far the goal is shifted over in each answer map key, leaving just enough bits below it for every index.
         posSum = 0
         negSum = 0
         for num in self.inputList:
@@ -29,16 +30,27 @@ class MemoizedNormal:
         self.negSum = negSum
 
     @classmethod
-    def testIterations(cls, inputList: list[int]) -> tuple[int, bool]:
+    def testIterations(cls, inputList: list[int], iterative: bool = False) -> tuple[int, bool]:
         """
         Tests the iteration count of a partition algorithm that uses top down dynamic programming to allow it solve given inputs quicker.
 
         :param inputList: The inputted list to solve the partition question on.
+        :param iterative: If the explicit stack version of the algorithm should be used instead of the recursive one. Gives the exact same iteration count and answer.
         :return: A tuple containing the iteration count, and the computed answer.
         """
-        solver = cls(inputList)
-        result = solver.subsetSum(0, int(sum(inputList)/2))
-        return len(solver.answerMap), result # Since the answer map is added to each recursive call, it's length is an iteration count.
+        return cls(inputList).query(int(sum(inputList)/2), iterative)
+
+    def query(self, goal: int, iterative: bool = False) -> tuple[int, bool]:
+        """
+        Asks if some subset of the list reaches the goal. The answer map is kept between queries, since a subproblem's answer doesn't depend on which goal it was reached from, so asking again about a different goal only solves the subproblems that haven't been solved yet.
+
+        :param goal: The goal to reach.
+        :param iterative: If the explicit stack version of the algorithm should be used instead of the recursive one.
+        :return: A tuple containing how many new subproblems this query solved, and the answer.
+        """
+        before = len(self.answerMap)
+        result = (self.subsetSumIterative if iterative else self.subsetSum)(0, goal)
+        return len(self.answerMap) - before, result # Since the answer map is added to each recursive call, it's growth is an iteration count.
     
     def subsetSum(self, index, goal) -> bool:
         """
@@ -53,19 +65,71 @@ class MemoizedNormal:
         if index >= len(self.inputList):
             return False
         
-        if goal - self.inputList[index] < self.posSum and goal - self.inputList[index] > self.negSum: # Bounds checking
-            if (index + 1, goal-self.inputList[index]) in self.answerMap:
-                take = self.answerMap[(index + 1, goal-self.inputList[index])]
+        key = (goal << self.shift) | index # Packs the subproblem into a single int like the C version does, which is far cheaper to hash and store than a tuple.
+        if goal - self.inputList[index] <= self.posSum and goal - self.inputList[index] >= self.negSum: # Bounds checking, which lets the goal land exactly on either sum like RecursiveNormal does.
+            takeKey = ((goal-self.inputList[index]) << self.shift) | (index + 1)
+            if takeKey in self.answerMap:
+                take = self.answerMap[takeKey]
             else:
                 take = self.subsetSum(index + 1, goal-self.inputList[index])
             if take == True: # This causes OR short circuiting behavior. 
-                self.answerMap[(index, goal)] = True
+                self.answerMap[key] = True
                 return True
             
-        if (index + 1, goal) in self.answerMap:
-            skip = self.answerMap[(index + 1, goal)]
+        skipKey = key + 1 # The same goal one index later.
+        if skipKey in self.answerMap:
+            skip = self.answerMap[skipKey]
         else:
             skip = self.subsetSum(index + 1, goal)
 
-        self.answerMap[(index, goal)] = skip
-        return skip
\ No newline at end of file
+        self.answerMap[key] = skip
+        return skip
+
+    def subsetSumIterative(self, index, goal) -> bool:
+        """
+        Solves the same problem as subsetSum in the exact same order, but with its own stack instead of recursing, so it never hits Python's recursion limit and can handle sets far bigger than the recursive version can. Python 3.11 and newer make calls cheap enough that the recursive version is usually still faster on small sets, so this is opt in.
+        Every subproblem fills in the answer map exactly like subsetSum does, so the iteration count stays the same.
+
+        :param index: The index of the list to start from.
+        :param goal: The goal the algorithm needs to reach to find a valid answer.
+        :return: A boolean of if the set (list) can be partitioned.
+        """
+        answerMap = self.answerMap # Everything used in the loop is made local, since looking up attributes slows down every step.
+        numbers = self.inputList
+        length = len(numbers)
+        posSum = self.posSum
+        negSum = self.negSum
+        shift = self.shift
+        stack = [(index, goal, 0)] # Each frame is (index, goal, stage), where stage 0 is a new call, 1 is waiting on the take answer, and 2 is waiting on the skip answer.
+        returned = False
+        push = stack.append
+        pop = stack.pop
+        while stack:
+            index, goal, stage = pop()
+            if stage == 0:
+                if goal == 0:
+                    returned = True
+                    continue
+                if index >= length:
+                    returned = False
+                    continue
+                returned = False
+                number = numbers[index]
+                if goal - number <= posSum and goal - number >= negSum: # Bounds checking
+                    returned = answerMap.get(((goal-number) << shift) | (index + 1))
+                    if returned is None:
+                        push((index, goal, 1))
+                        push((index + 1, goal-number, 0))
+                        continue
+                stage = 1
+            if stage == 1:
+                if returned == True: # This causes OR short circuiting behavior.
+                    answerMap[(goal << shift) | index] = True
+                    continue
+                returned = answerMap.get(((goal << shift) | index) + 1)
+                if returned is None:
+                    push((index, goal, 2))
+                    push((index + 1, goal, 0))
+                    continue
+            answerMap[(goal << shift) | index] = returned
+        return returned
\ No newline at end of file
@@ -19,20 +19,32 @@ class NewMemoizedCrazy:
         :param inputList: The inputted list, which will mapped to a list of absolute values in the input.
         """
         self.absoluteList = list(map(abs, inputList))
-        self.answerMap: dict[tuple[int, int], bool] = {}
+        self.answerMap: dict[int, bool] = {}
+        self.shift = len(self.absoluteList).bit_length() # How far the goal is shifted over in each answer map key, leaving just enough bits below it for every index.
         self.remainingSum = [sum(self.absoluteList[i:]) for i in range(len(self.absoluteList))]
 
     @classmethod
-    def testIterations(cls, inputList: list[int]) -> tuple[int, bool]:
+    def testIterations(cls, inputList: list[int], iterative: bool = False) -> tuple[int, bool]:
         """
         Tests the iteration count of a very slightly modified subset sum that uses top down dynamic programming with a bit of extra input and output code to produce an answer to partition for the same input.
 
         :param inputList: The inputted list, which will mapped to a list of absolute values in the input internally.
+        :param iterative: If the explicit stack version of the algorithm should be used instead of the recursive one. Gives the exact same iteration count and answer.
         :return: A tuple containing the iteration count, and the computed answer.
         """
-        solver = cls(sorted(inputList, reverse=True))
-        result = solver.subsetSum(0, int(sum(inputList)/2))
-        return len(solver.answerMap), result # Since the answer map is added to each recursive call, it's length is an iteration count.
+        return cls(sorted(inputList, reverse=True)).query(sum(map(abs, inputList)) // 2, iterative) # Half the absolute sum, since that is what the absolute list has to be split into.
+
+    def query(self, goal: int, iterative: bool = False) -> tuple[int, bool]:
+        """
+        Asks if some subset of the absolute list adds up to the goal, keeping the answer map warm for the next query. Works the same way as MemoizedNormal.query, except goals past the sum of the whole list are turned down right away by the remaining sum check without solving anything.
+
+        :param goal: The goal to reach.
+        :param iterative: If the explicit stack version of the algorithm should be used instead of the recursive one.
+        :return: A tuple containing how many new subproblems this query solved, and the answer.
+        """
+        before = len(self.answerMap)
+        result = (self.subsetSumIterative if iterative else self.subsetSum)(0, goal)
+        return len(self.answerMap) - before, result # Since the answer map is added to each recursive call, it's growth is an iteration count.
     
     def subsetSum(self, index, goal) -> bool:
         """
@@ -51,19 +63,76 @@ class NewMemoizedCrazy:
         if goal - self.remainingSum[index] == 0:
             return True
         
+        key = (goal << self.shift) | index # Packs the subproblem into a single int like the C version does, which is far cheaper to hash and store than a tuple.
         if goal >= self.absoluteList[index]: # Bounds checking, better than the others though as it can use the current goal.
-            if (index + 1, goal-self.absoluteList[index]) in self.answerMap:
-                take = self.answerMap[(index + 1, goal-self.absoluteList[index])]
+            takeKey = ((goal-self.absoluteList[index]) << self.shift) | (index + 1)
+            if takeKey in self.answerMap:
+                take = self.answerMap[takeKey]
             else:
                 take = self.subsetSum(index + 1, goal-self.absoluteList[index])
             if take == True: # This causes OR short circuiting behavior. 
-                self.answerMap[(index, goal)] = True
+                self.answerMap[key] = True
                 return True
 
-        if (index + 1, goal) in self.answerMap:
-            skip = self.answerMap[(index + 1, goal)]
+        skipKey = key + 1 # The same goal one index later.
+        if skipKey in self.answerMap:
+            skip = self.answerMap[skipKey]
         else:
             skip = self.subsetSum(index + 1, goal)
         
-        self.answerMap[(index, goal)] = skip
-        return skip
\ No newline at end of file
+        self.answerMap[key] = skip
+        return skip
+
+    def subsetSumIterative(self, index, goal) -> bool:
+        """
+        The explicit stack version of subsetSum, visiting subproblems in the exact same order. Works the same way as (and is opt in for the same reasons as) MemoizedNormal.subsetSumIterative.
+        Every subproblem fills in the answer map exactly like subsetSum does, so the iteration count stays the same.
+
+        :param index: The index of the list to start from.
+        :param goal: The goal the algorithm needs to reach to find a valid answer.
+        :return: A boolean of if the set (list) can be partitioned.
+        """
+        answerMap = self.answerMap
+        numbers = self.absoluteList
+        length = len(numbers)
+        remainingSum = self.remainingSum
+        shift = self.shift
+        stack = [(index, goal, 0)] # Each frame is (index, goal, stage), where stage 0 is a new call, 1 is waiting on the take answer, and 2 is waiting on the skip answer.
+        returned = False
+        push = stack.append
+        pop = stack.pop
+        while stack:
+            index, goal, stage = pop()
+            if stage == 0:
+                if goal == 0:
+                    returned = True
+                    continue
+                if index >= length:
+                    returned = False
+                    continue
+                if goal - remainingSum[index] > 0:
+                    returned = False
+                    continue
+                if goal - remainingSum[index] == 0:
+                    returned = True
+                    continue
+                returned = False
+                number = numbers[index]
+                if goal >= number: # Bounds checking, better than the others though as it can use the current goal.
+                    returned = answerMap.get(((goal-number) << shift) | (index + 1))
+                    if returned is None:
+                        push((index, goal, 1))
+                        push((index + 1, goal-number, 0))
+                        continue
+                stage = 1
+            if stage == 1:
+                if returned == True: # This causes OR short circuiting behavior.
+                    answerMap[(goal << shift) | index] = True
+                    continue
+                returned = answerMap.get(((goal << shift) | index) + 1)
+                if returned is None:
+                    push((index, goal, 2))
+                    push((index + 1, goal, 0))
+                    continue
+            answerMap[(goal << shift) | index] = returned
+        return returned
\ No newline at end of file
@@ -29,15 +29,16 @@ class RecursiveNormal:
         self.negSum = negSum
 
     @classmethod
-    def testIterations(cls, inputList: list[int]) -> tuple[int, bool]:
+    def testIterations(cls, inputList: list[int], iterative: bool = False) -> tuple[int, bool]:
         """
         Tests the iteration count of a basic recursive partition algorithm.
 
         :param inputList: The inputted list to solve the partition question on.
+        :param iterative: If the explicit stack version of the algorithm should be used instead of the recursive one. Gives the exact same iteration count and answer.
         :return: A tuple containing the iteration count, and the computed answer.
         """
         solver = cls(inputList)
-        result = solver.subsetSum(0, int(sum(inputList)/2))
+        result = (solver.subsetSumIterative if iterative else solver.subsetSum)(0, int(sum(inputList)/2))
         return solver.iterationCount, result
 
     def subsetSum(self, index, goal) -> bool:
@@ -56,3 +57,43 @@ class RecursiveNormal:
         if goal - self.inputList[index] > self.posSum or goal - self.inputList[index] < self.negSum: # Bounds checking
             return self.subsetSum(index + 1, goal)
         return self.subsetSum(index + 1, goal - self.inputList[index]) or self.subsetSum(index + 1, goal)
+
+    def subsetSumIterative(self, index, goal) -> bool:
+        """
+        The explicit stack version of subsetSum, visiting subproblems in the exact same order so that deep sets don't hit Python's recursion limit. Opt in for the same reasons as MemoizedNormal.subsetSumIterative.
+        Counts every subproblem exactly like subsetSum does, so the iteration count stays the same.
+
+        :param index: The index of the list to start from.
+        :param goal: The goal the algorithm needs to reach to find a valid answer.
+        :return: A boolean of if the set (list) can be partitioned.
+        """
+        numbers = self.inputList
+        length = len(numbers)
+        posSum = self.posSum
+        negSum = self.negSum
+        iterationCount = 0
+        stack = [(index, goal, 0)] # Each frame is (index, goal, stage), where stage 0 is a new call and 1 is waiting on the take answer.
+        returned = False
+        push = stack.append
+        pop = stack.pop
+        while stack:
+            index, goal, stage = pop()
+            if stage == 1:
+                if returned == False: # This causes OR short circuiting behavior, as the skip answer only gets tried if take failed.
+                    push((index + 1, goal, 0))
+                continue
+            if goal == 0:
+                returned = True
+                continue
+            if index >= length:
+                returned = False
+                continue
+            iterationCount += 1
+            number = numbers[index]
+            if goal - number > posSum or goal - number < negSum: # Bounds checking
+                push((index + 1, goal, 0))
+                continue
+            push((index, goal, 1))
+            push((index + 1, goal - number, 0))
+        self.iterationCount += iterationCount
+        return returned
\ No newline at end of file
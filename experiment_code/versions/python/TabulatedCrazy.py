@@ -18,6 +18,16 @@ def testIterations(inputList: list[int]) -> tuple[int, bool]:
     absList = list(map(abs, inputList))
     return partition(absList)
 
+def testBitsetIterations(inputList: list[int]) -> tuple[int, bool]:
+    """
+    Exactly the same as testIterations, but sends the absolute values off to the rolling bitset version of partition instead.
+
+    :param inputList: The inputted list to solve the partition question on.
+    :return: A tuple containing the iteration count, and the computed answer.
+    """
+    absList = list(map(abs, inputList))
+    return bitsetPartition(absList)
+
 def partition(inputList: list[int]) -> tuple[int, bool]:
     """
     Finds a few details about the input set then send it off to partition and returns it's answer directly.
@@ -35,4 +45,21 @@ def partition(inputList: list[int]) -> tuple[int, bool]:
         for j in range(1, goal + 1):
             resultsTable[i][j] = resultsTable[i+1][j] or (inputList[i] <= j and resultsTable[i+1][j-inputList[i]])
 
-    return (goal * len(inputList), resultsTable[0][goal]) # The iterations count will always be exactly the size of the tabulation table that is not predetermined (aka not a edge case bound).
\ No newline at end of file
+    return (goal * len(inputList), resultsTable[0][goal]) # The iterations count will always be exactly the size of the tabulation table that is not predetermined (aka not a edge case bound).
+
+def bitsetPartition(inputList: list[int]) -> tuple[int, bool]:
+    """
+    Solves the same table as partition, but only ever keeps a single row of it, stored as the bits of one Python integer where bit j is if the sum j is reachable.
+    Moving to the next row is then just or-ing the row with a shifted copy of itself, with every sum above the goal masked off since it can never come back down.
+
+    :param inputList: The inputted list to solve the partition question on. Must be all non negative.
+    :return: A tuple containing the iteration count, and the computed answer.
+    """
+    goal = int(sum(inputList) / 2)
+    mask = (1 << (goal + 1)) - 1
+    reachable = 1 # Only the empty set has been considered, which sums to 0.
+
+    for num in reversed(inputList):
+        reachable = (reachable | (reachable << num)) & mask
+
+    return (goal * len(inputList), (reachable >> goal) & 1 == 1) # Same iteration count as partition, so results stay comparable.
\ No newline at end of file
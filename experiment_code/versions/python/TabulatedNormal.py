@@ -22,6 +22,22 @@ def testIterations(inputList: list[int]) -> tuple[int, bool]:
             negSum += num
     return partition(inputList, posSum, negSum)
 
+def testBitsetIterations(inputList: list[int]) -> tuple[int, bool]:
+    """
+    Exactly the same as testIterations, but sends the set off to the rolling bitset version of partition instead.
+
+    :param inputList: The inputted list to solve the partition question on.
+    :return: A tuple containing the iteration count, and the computed answer.
+    """
+    posSum = 0
+    negSum = 0
+    for num in inputList:
+        if num > 0:
+            posSum += num
+        else:
+            negSum += num
+    return bitsetPartition(inputList, posSum, negSum)
+
 def partition(inputList: list[int], posSum: int, negSum: int) -> tuple[int, bool]:
     """
     Finds a few details about the input set then send it off to partition and returns it's answer directly.
@@ -43,4 +59,26 @@ def partition(inputList: list[int], posSum: int, negSum: int) -> tuple[int, bool
             else:
                 resultsTable[i][j] = resultsTable[i+1][j] or resultsTable[i+1][j-inputList[i]]
 
-    return (sumRange * len(inputList), resultsTable[0][int((posSum + negSum) / 2)]) # The iterations count will always be exactly the size of the tabulation table that is not predetermined (aka not a edge case bound).
\ No newline at end of file
+    return (sumRange * len(inputList), resultsTable[0][int((posSum + negSum) / 2)]) # The iterations count will always be exactly the size of the tabulation table that is not predetermined (aka not a edge case bound).
+
+def bitsetPartition(inputList: list[int], posSum: int, negSum: int) -> tuple[int, bool]:
+    """
+    Solves the same table as partition, but only ever keeps a single row of it, stored as the bits of one Python integer where bit j - negSum is if the sum j is reachable.
+    Moving to the next row is then just or-ing the row with a shifted copy of itself, which Python does in C a machine word at a time instead of one cell at a time.
+    The bounds checking is not needed, as a subset sum can never leave the range negSum..posSum.
+
+    :param inputList: The inputted list to solve the partition question on.
+    :param posSum: The sum of all the positive integers in the set.
+    :param negSum: The sum of all the negative integers in the set.
+    :return: A tuple containing the iteration count, and the computed answer.
+    """
+    sumRange = posSum + abs(negSum) + 1
+    reachable = 1 << abs(negSum) # Only the empty set has been considered, which sums to 0.
+
+    for num in reversed(inputList):
+        if num >= 0:
+            reachable |= reachable << num
+        else:
+            reachable |= reachable >> -num
+
+    return (sumRange * len(inputList), (reachable >> (int((posSum + negSum) / 2) - negSum)) & 1 == 1) # Same iteration count as partition, so results stay comparable.
\ No newline at end of file
@@ -0,0 +1,47 @@
+"""
+Fixtures shared by every test: the command line arguments of a run, random sets to test on, and a brute force answer to check the algorithms against.
+
+Written by bananathrowingmachine, Mar 22, 2026.
+"""
+from data_processing_code.MiscDataCode import GridSpec
+
+from argparse import Namespace
+import numpy as np
+import pytest, random
+
+@pytest.fixture
+def runArgs():
+    """
+    :return: A function that gives the command line arguments of a run, with every option at its default unless it is given.
+    """
+    def build(**options) -> Namespace:
+        return Namespace(**({"example": False, "python": False, "numpy": False, "bitset": False, "countsOnly": False, "preprocess": False, "reduced": False, "seed": 0, "iterative": None, "grid": GridSpec()} | options))
+    return build
+
+@pytest.fixture
+def bruteForce():
+    """
+    :return: A function that checks if a set can be partitioned by listing every subset sum of its absolute values, which is slow but can't be wrong.
+    """
+    def solve(testList) -> bool:
+        absolutes = [abs(int(num)) for num in testList]
+        sums = {0}
+        for num in absolutes:
+            sums |= {subsetSum + num for subsetSum in sums}
+        return sum(absolutes) % 2 == 0 and sum(absolutes) // 2 in sums
+    return solve
+
+@pytest.fixture
+def randomLists():
+    """
+    :return: A function that makes random lists of integers, each with an even sum. Zeros and repeated absolute values are left in, since the generated sets never have them but the algorithms should still handle them.
+    """
+    def build(count: int, maxSize: int, maxMagnitude: int, seed: int) -> list[np.ndarray]:
+        rng = random.Random(seed)
+        testLists = []
+        for _ in range(count):
+            testList = [rng.randint(-maxMagnitude, maxMagnitude) for _ in range(rng.randint(1, maxSize))]
+            testList[0] += sum(testList) % 2
+            testLists.append(np.array(testList, dtype=np.int32))
+        return testLists
+    return build
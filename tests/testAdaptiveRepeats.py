@@ -0,0 +1,51 @@
+"""
+Checks the adaptive repeat counts, where each integer count and target index only gets more sets until the confidence interval of every average is tight enough.
+
+Written by bananathrowingmachine, Mar 22, 2026.
+"""
+from experiment_code.ComplexityExperiment import ComplexityExperiment, OutLevel
+from data_processing_code.MiscDataCode import GridSpec, sampleCountField, confidenceSuffix, confidenceHalfWidths, AlgoNames, FullSuite
+
+import numpy as np
+import pytest
+
+def runTests(experiment: ComplexityExperiment, targetIndex: int, counts: list[int]) -> bool:
+    """
+    Finishes every test the target index currently needs, giving each one the next iteration count (for every algorithm) out of counts.
+
+    :return: If the whole size finished.
+    """
+    finished = False
+    while experiment.testsDone[targetIndex] < experiment.testsRun[targetIndex]:
+        count = counts[experiment.testsDone[targetIndex]]
+        finished = experiment.finishTest(targetIndex, experiment.testsDone[targetIndex] + 1, (count,) * len(FullSuite), [[0.0] * 3] * len(FullSuite), [True] * len(FullSuite))
+    return finished
+
+def testHalfWidths():
+    results = np.array([[10, 4], [12, 4], [14, 4], [16, 4], [18, 4]])
+    assert confidenceHalfWidths(results) == pytest.approx([2.776445 * np.std([10, 12, 14, 16, 18], ddof=1) / np.sqrt(5), 0.0], rel=1.5e-3) # The exact t value at 4 degrees of freedom.
+    assert confidenceHalfWidths(np.arange(30)[:, None])[0] == pytest.approx(2.045230 * np.std(np.arange(30), ddof=1) / np.sqrt(30), rel=1e-5)
+    assert np.all(np.isnan(confidenceHalfWidths(results[:1])))
+
+def testStopsOnceConverged(runArgs):
+    experiment = ComplexityExperiment(30, OutLevel.NONE, runArgs(grid=GridSpec(Sizes=(30,), TargetCount=2, Repeats=40, Tolerance=0.05, MinRepeats=4)))
+    assert experiment.testsRun == [4, 4]
+    assert not runTests(experiment, 0, [1000] * 40) # Every set took the same amount, so 4 is already plenty.
+    assert experiment.testsRun[0] == 4 and not experiment.extended
+
+    noisy = [100, 1000] * 20
+    for testNum in range(1, 5):
+        assert not experiment.finishTest(1, testNum, (noisy[testNum - 1],) * len(FullSuite), [[0.0] * 3] * len(FullSuite), [True] * len(FullSuite))
+    assert experiment.extended and 4 < experiment.testsRun[1] <= 40
+    assert runTests(experiment, 1, noisy) # Never converges, so it stops at the most repeats allowed.
+    assert experiment.testsRun[1] == 40
+    results = experiment.allRegResults
+    assert list(results[sampleCountField]) == [4, 40]
+    assert results[AlgoNames.MemoizedNormal + confidenceSuffix][0] == 0 and results[AlgoNames.MemoizedNormal + confidenceSuffix][1] > 0.05 * 550
+
+def testFixedRepeatsRecordCounts(runArgs):
+    experiment = ComplexityExperiment(30, OutLevel.NONE, runArgs(grid=GridSpec(Sizes=(30,), TargetCount=2, Repeats=6)))
+    assert experiment.testsRun == [6, 6]
+    runTests(experiment, 0, [100, 1000] * 3)
+    assert runTests(experiment, 1, [5] * 6)
+    assert list(experiment.allRegResults[sampleCountField]) == [6, 6] and not experiment.extended
@@ -0,0 +1,46 @@
+"""
+Checks the benchmark's corpus, statistics, and baseline comparison, so that a benchmark failing (or passing) always means the code actually changed speed.
+
+Written by bananathrowingmachine, Mar 22, 2026.
+"""
+from BenchmarkVersions import buildCorpus, summarize, compareToBaseline, timeCell
+
+import numpy as np
+
+def makeCell(medianNs: float, ciLowNs: float, ciHighNs: float, iterationCounts: tuple[int, ...] = (10, 20)) -> dict:
+    """
+    :return: A single benchmark cell of Python Tabulated Normal at size 5 and target index 0, with the given timings and iteration counts.
+    """
+    return {"implementation": "python", "algorithm": "TabulatedNormal", "size": 5, "targetIndex": 0, "medianNs": medianNs, "ciLowNs": ciLowNs, "ciHighNs": ciHighNs, "iterationCounts": list(iterationCounts)}
+
+def testCorpusIsFixed():
+    first = buildCorpus([5, 12], [0, 20], 3, 4)
+    second = buildCorpus([5, 12], [0, 20], 3, 4)
+    assert list(first) == [(5, 0), (5, 20), (12, 0), (12, 20)]
+    for cell, testLists in first.items():
+        assert len(testLists) == 3
+        for testList, again in zip(testLists, second[cell]):
+            assert testList.dtype == np.int32 and len(testList) == cell[0] and np.array_equal(testList, again)
+
+def testSummarizeBracketsMedian():
+    samples = np.random.default_rng(1).normal(1000, 50, 400)
+    summary = summarize(samples, 500, np.random.default_rng(2))
+    assert summary["ciLowNs"] <= summary["medianNs"] <= summary["ciHighNs"]
+    assert summary["medianNs"] < summary["p95Ns"]
+
+def testTimeCell():
+    samples, iterationCounts = timeCell(lambda testList: (len(testList), True), [np.arange(3), np.arange(5)], 1, 4)
+    assert len(samples) == 8 and np.all(samples >= 0) and iterationCounts == [3, 5]
+
+def testBaselineRegressions():
+    baseline = {"results": [makeCell(1_000_000, 990_000, 1_010_000)]}
+    assert compareToBaseline([makeCell(1_050_000, 1_040_000, 1_060_000)], baseline, 0.10, 1000) == ([], []) # Within the tolerance.
+    assert compareToBaseline([makeCell(1_500_000, 1_000_000, 2_000_000)], baseline, 0.10, 1000) == ([], []) # Its interval overlaps the baseline's, so it might just be noise.
+    assert compareToBaseline([makeCell(1_500, 1_400, 1_600)], {"results": [makeCell(1_000, 990, 1_010)]}, 0.10, 1000) == ([], []) # Under the noise floor.
+    regressions, countChanges = compareToBaseline([makeCell(1_500_000, 1_400_000, 1_600_000)], baseline, 0.10, 1000)
+    assert len(regressions) == 1 and countChanges == []
+
+def testBaselineCountChanges():
+    baseline = {"results": [makeCell(1_000_000, 990_000, 1_010_000)]}
+    regressions, countChanges = compareToBaseline([makeCell(1_000_000, 990_000, 1_010_000, (10, 21))], baseline, 0.10, 1000)
+    assert regressions == [] and len(countChanges) == 1 and "[10, 20] -> [10, 21]" in countChanges[0]
@@ -0,0 +1,48 @@
+"""
+Checks that the data processor writes the results table and renders every graph with data in parallel, both at the end of a run and live as each integer count comes in, and that graphs of unmeasured frames are skipped.
+
+Written by bananathrowingmachine, Mar 22, 2026.
+"""
+from data_processing_code.MainDataProcessor import MainDataProcessor
+from data_processing_code.MiscDataCode import ResultsWrapper, SpeedyResultsDType, AlgoNames, MeasureNames, GridSpec
+
+import numpy as np
+import pytest
+import sys
+
+pytestmark = pytest.mark.skipif(sys.platform == 'win32', reason="Every graph is shown interactively on Windows.")
+
+grid = GridSpec(Sizes=(5, 10), TargetCount=3, Repeats=2)
+presets = (AlgoNames.TargetSum, AlgoNames.NewMemoizedCrazy, AlgoNames.OldMemoizedCrazy)
+
+def speedyResults(size: int, unmeasured: tuple[str, ...] = ()) -> ResultsWrapper:
+    """
+    :return: A chunk of made up results for an integer count, with the given fields left unmeasured.
+    """
+    rawData = np.zeros(grid.TargetCount, dtype=SpeedyResultsDType)
+    for field in SpeedyResultsDType.names:
+        rawData[field] = np.arange(1, grid.TargetCount + 1) * size
+    for field in unmeasured:
+        rawData[field] = np.nan
+    return ResultsWrapper(size, None, rawData)
+
+def testGraphsRenderedAtEnd(tmp_path):
+    processor = MainDataProcessor(tmp_path, presets, grid)
+    unmeasured = tuple(AlgoNames.OldMemoizedCrazy + measureName for measureName in MeasureNames)
+    for size in grid.Sizes:
+        processor.appendData(speedyResults(size, unmeasured))
+    assert not any(tmp_path.rglob("*.png")) and not any(tmp_path.rglob("*.xlsx")) # Nothing is written until the end without live mode.
+    assert processor.outputImageData() == []
+    assert (tmp_path / "data_tables" / "Results.xlsx").exists()
+    assert sorted(path.name for path in (tmp_path / "graphs").iterdir()) == sorted(["New Memoized Crazy Graph.png", "Old Memoized Crazy Graph.png", "New Memoized Crazy Wall Time Graph.png",
+                                                                                  "New Memoized Crazy CPU Time Graph.png", "New Memoized Crazy Peak Memory Graph.png"])
+
+def testLiveGraphs(tmp_path):
+    processor = MainDataProcessor(tmp_path, presets, grid, live=True)
+    processor.appendData(speedyResults(5))
+    assert (tmp_path / "data_tables" / "Results.xlsx").exists()
+    assert len(processor.staleGraphs) == 0 and len(processor.pendingGraphs) == 8
+    processor.appendData(speedyResults(10))
+    assert processor.outputImageData() == []
+    assert len(processor.pendingGraphs) == 0 and processor.renderPool is None
+    assert len(list((tmp_path / "graphs").iterdir())) == 8
@@ -0,0 +1,67 @@
+"""
+Checks the disagreement log, where every disagreement is appended as a JSON line the moment it arrives and the Word document is only rendered from the log once at the end.
+Also checks that the answers of a disagreement are kept in the order the document labels them, both when it happens and when it is replayed from the run journal.
+
+Written by bananathrowingmachine, Mar 22, 2026.
+"""
+import data_processing_code.DisagreeProcessor as DisagreeModule
+from data_processing_code.DisagreeProcessor import DisagreeProcessor
+from data_processing_code.MiscDataCode import DisagreeData, AlgoNames, GridSpec, FullSuite
+import data_processing_code.MiscDataCode as MiscDataCode
+from experiment_code.ComplexityExperiment import ComplexityExperiment, OutLevel
+from experiment_code.RunJournal import RunJournal
+
+from docx import Document
+
+def fakeDisagreements(count: int) -> list[DisagreeData]:
+    """
+    :return: Made up disagreements of a full run, each with its own test number.
+    """
+    return [DisagreeData([True, True, False, True, True, True], 6, 3, testNum, 120, [40, -20, 35, 15, -6, 4], 99, list(FullSuite)) for testNum in range(1, count + 1)]
+
+def renderedNumbers(genFilesDir) -> list[str]:
+    """
+    :return: The heading of every disagreement written out in the Word document.
+    """
+    document = Document(genFilesDir / "solution_conflicts" / "DisagreementRecord.docx")
+    return [paragraph.text for paragraph in document.paragraphs if paragraph.text.startswith("Disagreement number")]
+
+def testLogRoundTrip(tmp_path):
+    processor = DisagreeProcessor(tmp_path)
+    disagreements = fakeDisagreements(5)
+    processor.appendDisagreements(disagreements[:2])
+    processor.appendDisagreements(disagreements[2:])
+    assert processor.readLog() == disagreements # Every append is flushed, so the log is readable while the run is still going.
+    processor.renderRecord()
+    assert renderedNumbers(tmp_path) == [f"Disagreement number {idNum}:" for idNum in range(1, 6)]
+
+def testNoDisagreements(tmp_path):
+    processor = DisagreeProcessor(tmp_path)
+    processor.renderRecord()
+    document = Document(tmp_path / "solution_conflicts" / "DisagreementRecord.docx")
+    assert any("no recorded disagreements" in paragraph.text for paragraph in document.paragraphs)
+
+def testRecordLimited(tmp_path, monkeypatch):
+    monkeypatch.setattr(DisagreeModule, "docxLimit", 3)
+    processor = DisagreeProcessor(tmp_path)
+    processor.appendDisagreements(fakeDisagreements(7))
+    processor.renderRecord()
+    assert len(renderedNumbers(tmp_path)) == 3
+    assert len(processor.readLog()) == 7
+
+def testAnswersInResultOrder(runArgs, tmp_path):
+    args = runArgs(grid=GridSpec(Sizes=(6,), TargetCount=2, Repeats=2))
+    journalPath = tmp_path / "RunJournal.jsonl"
+    RunJournal.start(journalPath, args)
+    with RunJournal(journalPath) as journal:
+        experiment = ComplexityExperiment(6, OutLevel.NONE, args, journal)
+        testList = experiment.generator.generateRandomSets(1, [2])[0]
+        results = {name: MiscDataCode.TestResult(10, name != AlgoNames.TabulatedCrazy, 0.0, 0.0, 0.0) for name in experiment.tasks} # New Memoized Crazy is the last task, but the first result.
+        experiment.runSingleTest(1, 2, testList, results)
+    assert experiment.disagreeList[0].Algorithms == list(FullSuite)
+    assert experiment.disagreeList[0].AlgoOutputs == [name != AlgoNames.TabulatedCrazy for name in FullSuite] and experiment.disagreeList[0].CurrentList == testList.tolist()
+
+    with RunJournal(journalPath) as journal:
+        replayed = ComplexityExperiment(6, OutLevel.NONE, args, journal)
+        replayed.replayTests()
+    assert replayed.disagreeList == experiment.disagreeList
@@ -0,0 +1,54 @@
+"""
+Checks how the grid of the experiment gets built from the grid file and options, and that any grid the generator could never build sets for is turned down before the run starts.
+
+Written by bananathrowingmachine, Mar 22, 2026.
+"""
+from FastPartitionExperiment import buildGrid
+from data_processing_code.MiscDataCode import GridSpec
+from experiment_code.SetGenerator import SetGenerator
+
+from argparse import ArgumentParser, Namespace
+import numpy as np
+import json, pytest
+
+def gridArgs(**options) -> Namespace:
+    """
+    :param options: Any grid options to give.
+    :return: The parsed command line arguments, with every grid option not given left out.
+    """
+    return Namespace(**({"gridFile": None, "sizes": None, "targets": None, "repeats": None, "max_magnitude": None, "tolerance": None, "min_repeats": None} | options))
+
+def testGridOptions(tmp_path):
+    assert buildGrid(ArgumentParser(), gridArgs()) is None
+    assert buildGrid(ArgumentParser(), gridArgs(sizes=[5, 10], repeats=3)) == GridSpec(Sizes=(5, 10), Repeats=3)
+    gridFile = tmp_path / "grid.json"
+    gridFile.write_text(json.dumps({"sizes": [4, 8], "targets": 5, "maxMagnitude": 500}))
+    assert buildGrid(ArgumentParser(), gridArgs(gridFile=gridFile, targets=7)) == GridSpec(Sizes=(4, 8), TargetCount=7, MaxMagnitude=500) # The options win over the file.
+
+@pytest.mark.parametrize("options", [{"sizes": [5, 5]}, {"sizes": [0]}, {"targets": 1}, {"repeats": 0}, {"sizes": [40], "max_magnitude": 30},
+                                     {"sizes": [40], "max_magnitude": 60}, {"sizes": [100], "max_magnitude": 2 ** 25},
+                                     {"tolerance": 0}, {"tolerance": 0.05, "min_repeats": 3}, {"tolerance": 0.05, "min_repeats": 60}])
+def testBadGridsRejected(options):
+    with pytest.raises(SystemExit):
+        buildGrid(ArgumentParser(), gridArgs(**options))
+
+def testBadGridFileRejected(tmp_path):
+    gridFile = tmp_path / "grid.json"
+    gridFile.write_text(json.dumps({"sizes": [5], "size": 10}))
+    with pytest.raises(SystemExit):
+        buildGrid(ArgumentParser(), gridArgs(gridFile=gridFile))
+    with pytest.raises(SystemExit):
+        buildGrid(ArgumentParser(), gridArgs(gridFile=tmp_path / "missing.json"))
+
+def testSmallGridSets():
+    grid = buildGrid(ArgumentParser(), gridArgs(sizes=[6, 30], targets=4, max_magnitude=1000))
+    for size in grid.Sizes:
+        generator = SetGenerator(size, 5, grid.TargetCount, grid.MaxMagnitude)
+        assert len(generator.sumSizeTarget) == 4
+        for targetIndex in range(grid.TargetCount):
+            testSets = generator.generateRandomSets(targetIndex, range(1, grid.Repeats + 1))
+            assert np.all(np.abs(testSets) <= 1000) and np.all(np.abs(testSets).sum(axis=1) % 2 == 0)
+            assert all(len(set(np.abs(testSet).tolist())) == size for testSet in testSets)
+
+def testDefaultGridKeepsSets():
+    assert SetGenerator(6, 11).generateRandomSets(7, [1, 2]).tolist() == [[-11465, 11216, -11846, -11411, -11365, -11509], [-11629, 11184, 11387, -11563, 11727, 11320]] # What the seed gave before the grid could be changed.
@@ -0,0 +1,49 @@
+"""
+Checks the reusable partition solver against brute force, and that its answer map really does stay warm between queries.
+
+Written by bananathrowingmachine, Mar 22, 2026.
+"""
+from experiment_code.PartitionSolver import PartitionSolver
+from data_processing_code.MiscDataCode import AlgoNames
+
+import pytest
+
+crazyVersions = [(AlgoNames.NewMemoizedCrazy, False), (AlgoNames.OldMemoizedCrazy, False), (AlgoNames.NewMemoizedCrazy, True), (AlgoNames.OldMemoizedCrazy, True)]
+
+@pytest.mark.parametrize("algorithm, iterative", crazyVersions)
+def testPartitionMatchesBruteForce(randomLists, bruteForce, algorithm, iterative):
+    for testList in randomLists(300, 12, 80, 8):
+        assert PartitionSolver(testList.tolist(), algorithm, iterative).partition() == bruteForce(testList), testList.tolist()
+
+@pytest.mark.parametrize("algorithm, iterative", crazyVersions)
+def testOddSumNotPartitionable(algorithm, iterative):
+    for testList in ([1, 2], [3, -4, 2], [7]):
+        solver = PartitionSolver(testList, algorithm, iterative)
+        assert not solver.partition() and solver.iterationCount == 0, testList
+
+@pytest.mark.parametrize("algorithm, iterative", crazyVersions)
+def testAchievableSums(randomLists, algorithm, iterative):
+    for testList in randomLists(40, 8, 30, 9):
+        sums = {0}
+        for num in testList.tolist():
+            sums |= {subsetSum + abs(num) for subsetSum in sums}
+        assert PartitionSolver(testList.tolist(), algorithm, iterative).achievableSums() == sorted(sums), testList.tolist()
+
+def testAnswerMapStaysWarm(randomLists):
+    testList = randomLists(1, 14, 60, 10)[0].tolist()
+    solver = PartitionSolver(testList)
+    goals = range(0, sum(map(abs, testList)) + 1, 7)
+    for goal in goals:
+        solver.query(goal)
+    warmIterations = solver.iterationCount
+    assert solver.query(goals[-1]) == solver.query(goals[-1]) and solver.iterationCount == warmIterations # Asking again solves nothing new.
+    coldIterations = 0
+    for goal in goals:
+        coldSolver = PartitionSolver(testList)
+        coldSolver.query(goal)
+        coldIterations += coldSolver.iterationCount
+    assert warmIterations < coldIterations
+
+def testNormalRejected():
+    with pytest.raises(ValueError):
+        PartitionSolver([1, 1], AlgoNames.MemoizedNormal)
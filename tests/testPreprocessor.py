@@ -0,0 +1,58 @@
+"""
+Checks that the preprocessing stage never changes if a set can be partitioned, by solving every set by brute force both before and after it goes through the stage, and that what it reports about each set is what it actually did.
+
+Written by bananathrowingmachine, Mar 22, 2026.
+"""
+from experiment_code.Preprocessor import preprocess, groupRepeats
+from experiment_code.TaskScheduler import initWorker, runPreprocessedBatch, workerRegistry, batchRegistry, countsOnlyTasks
+from data_processing_code.MiscDataCode import AlgoNames
+
+import numpy as np
+
+def randomSets() -> list[np.ndarray]:
+    """
+    :return: Random sets with every kind of thing the stage looks for: zeros, a shared divisor, repeated absolute values, odd sums and one integer bigger than the rest.
+    """
+    rng = np.random.default_rng(21)
+    testLists = [np.zeros(3, dtype=np.int32), np.array([5], dtype=np.int32), np.array([40, -4, 6, 10], dtype=np.int32)]
+    for _ in range(600):
+        testList = rng.integers(-9, 10, size=rng.integers(1, 13))
+        if rng.random() < 0.75:
+            testList[0] += np.abs(testList).sum() % 2
+        testList *= rng.choice([1, 2, 3, 6, 1000])
+        if rng.random() < 0.2:
+            testList[0] = 10 * np.abs(testList).sum() + 1
+        testLists.append(testList.astype(np.int32))
+    return testLists
+
+def testPreprocessMatchesBruteForce(bruteForce):
+    for testList in randomSets():
+        reducedList, reduction = preprocess(testList)
+        expected = bruteForce(testList)
+        assert reducedList.dtype == np.int32
+        if reduction.Answer is not None:
+            assert reduction.Answer == expected and len(reducedList) == 0 and reduction.IntCount == 0 and reduction.AbsSum == 0, testList.tolist()
+            continue
+        assert bruteForce(reducedList) == expected, testList.tolist()
+        assert reduction.IntCount == len(reducedList) and reduction.AbsSum == int(np.abs(reducedList).sum()), testList.tolist()
+        assert reduction.Divisor == int(np.gcd.reduce(np.abs(testList))) and int(np.gcd.reduce(np.abs(reducedList))) == 1, testList.tolist()
+        assert np.all(reducedList != 0) and len(reducedList) <= np.count_nonzero(testList), testList.tolist()
+
+def testGroupRepeats():
+    distinct = np.array([7, -3, 12, 1])
+    assert groupRepeats(distinct).tolist() == distinct.tolist()
+    grouped = groupRepeats(np.array([5, -2] + [3] * 5 + [-3] * 2 + [-4] * 3))
+    assert sorted(grouped.tolist()) == sorted([5, -2, 3, 6, 12, -4, -8]) # 7 copies of 3 become 1, 2 and 4 copies, and 3 copies of -4 become 1 and 2.
+
+def testPreprocessedVersions(runArgs, bruteForce):
+    for registry in (workerRegistry, batchRegistry, countsOnlyTasks):
+        registry.clear()
+    initWorker(runArgs(python=True, bitset=True, preprocess=True))
+    testLists = randomSets()
+    for testList in testLists:
+        expected = bruteForce(testList)
+        for name in workerRegistry:
+            assert workerRegistry[name](testList)[1] == expected, f"{name} on {testList.tolist()}"
+    version = workerRegistry[AlgoNames.MemoizedNormal].args[0] # The batched wrapper is only ever given C versions, so a plain loop stands in for one here.
+    assert runPreprocessedBatch(lambda reducedLists: [version(reducedList) for reducedList in reducedLists], testLists) == [workerRegistry[AlgoNames.MemoizedNormal](testList) for testList in testLists]
+    workerRegistry.clear()
@@ -0,0 +1,74 @@
+"""
+Round trips the raw results store, checking that a shard reads back exactly as it was written and that summarizing it gives the same averages and confidence intervals as working them out by hand.
+
+Written by bananathrowingmachine, Mar 22, 2026.
+"""
+from experiment_code.RawResultsStore import RawResultsStore
+from data_processing_code.MiscDataCode import AlgoNames, MeasureNames, GridSpec, rawResultsDType, answerSuffix, confidenceSuffix, confidenceHalfWidths, sampleCountField
+
+import numpy as np
+
+smallGrid = GridSpec(Sizes=(5, 10), TargetCount=3, Repeats=4)
+fullAlgorithms = [AlgoNames.NewMemoizedCrazy, AlgoNames.MemoizedNormal, AlgoNames.TabulatedCrazy, AlgoNames.TabulatedNormal, AlgoNames.RecursiveNormal]
+
+def fakeShard(size: int, algorithms: list[AlgoNames], rng: np.random.Generator) -> np.ndarray:
+    """
+    :param size: The amount of integers in each set.
+    :param algorithms: The algorithms to give fields.
+    :param rng: Where every value comes from.
+    :return: A shard with random values, where every target index of the small grid has a different amount of tests.
+    """
+    targetIndexes = np.repeat(np.arange(3), [4, 1, 3])
+    records = np.zeros(len(targetIndexes), dtype=rawResultsDType(algorithms))
+    records['size'] = size
+    records['targetIndex'] = targetIndexes
+    records['testNum'] = np.concatenate([np.arange(1, count + 1) for count in (4, 1, 3)])
+    records[AlgoNames.TargetSum] = 100 * (targetIndexes + 1)
+    for algoName in algorithms:
+        records[algoName] = rng.integers(1, 10**6, size=len(records))
+        records[algoName + answerSuffix] = rng.integers(-1, 2, size=len(records))
+        for measureName in MeasureNames:
+            records[algoName + measureName] = rng.random(len(records))
+    return records
+
+def testRawResultsRoundTrip(runArgs, tmp_path):
+    storeDir = tmp_path / "raw_results"
+    args = runArgs(seed=7, grid=smallGrid)
+    RawResultsStore.start(storeDir, args)
+    store = RawResultsStore(storeDir)
+    assert store.grid == args.grid and store.meta["seed"] == 7 and not store.meta["reduced"]
+    assert store.sizes() == []
+
+    records = fakeShard(10, fullAlgorithms, np.random.default_rng(3))
+    store.writeShard(10, records)
+    assert store.sizes() == [10] and not store.hasShard(5)
+    assert RawResultsStore(storeDir).readShard(10).tobytes() == records.tobytes()
+
+    summary = store.summarize(10)
+    for targetIndex in range(3):
+        rows = records[records["targetIndex"] == targetIndex]
+        assert summary[AlgoNames.TargetSum][targetIndex] == 100 * (targetIndex + 1)
+        assert summary[sampleCountField][targetIndex] == len(rows)
+        halfWidths = confidenceHalfWidths(np.stack([rows[algoName] for algoName in fullAlgorithms], axis=1))
+        for algoIndex, algoName in enumerate(fullAlgorithms):
+            assert summary[algoName][targetIndex] == np.mean(rows[algoName])
+            np.testing.assert_equal(summary[algoName + confidenceSuffix][targetIndex], halfWidths[algoIndex]) # A target index with a single test has no interval.
+            for measureName in MeasureNames:
+                assert summary[algoName + measureName][targetIndex] == np.mean(rows[algoName + measureName])
+
+    RawResultsStore.start(storeDir, args)
+    assert RawResultsStore(storeDir).sizes() == []
+
+def testRawResultsMissingFields(runArgs, tmp_path):
+    storeDir = tmp_path / "raw_results"
+    RawResultsStore.start(storeDir, runArgs(grid=smallGrid))
+    store = RawResultsStore(storeDir)
+    algorithms = [algoName for algoName in fullAlgorithms if algoName != AlgoNames.RecursiveNormal] # Like a size past where Recursive Normal stops being run.
+    records = fakeShard(5, algorithms, np.random.default_rng(4))
+    for measureName in MeasureNames: # Like the tabulated versions with --counts-only.
+        records[AlgoNames.TabulatedNormal + measureName] = np.nan
+    store.writeShard(5, records)
+    summary = store.summarize(5)
+    assert np.all(np.isnan(summary[AlgoNames.RecursiveNormal])) and np.all(np.isnan(summary[AlgoNames.RecursiveNormal + MeasureNames.WallTime]))
+    assert np.all(np.isnan(summary[AlgoNames.TabulatedNormal + MeasureNames.CpuTime])) and not np.any(np.isnan(summary[AlgoNames.TabulatedNormal]))
+    assert not np.any(np.isnan(summary[AlgoNames.MemoizedNormal + MeasureNames.PeakMemory]))
@@ -0,0 +1,52 @@
+"""
+Round trips the run journal a crashed or stopped run is resumed from, checking that every recorded test and size reads back the same and that a half written last line never stops the journal from being read or added to.
+
+Written by bananathrowingmachine, Mar 22, 2026.
+"""
+from experiment_code.RunJournal import RunJournal
+from data_processing_code.MiscDataCode import GridSpec
+
+import numpy as np
+
+def testJournalRoundTrip(runArgs, tmp_path):
+    journalPath = tmp_path / "run_journal" / "RunJournal.jsonl"
+    args = runArgs(seed=7, grid=GridSpec(Sizes=(5, 10), TargetCount=3, Repeats=4))
+    RunJournal.start(journalPath, args)
+    measures = [[float(algoIndex), 2.5, np.float32(64)] for algoIndex in range(5)]
+    with RunJournal(journalPath) as journal:
+        assert journal.finishedTests == {} and journal.finishedSizes == {}
+        journal.recordTest(5, 0, 1, (np.uint32(4), 9, 16, 25, 36), measures, [True, True, None, False, True], [True, True, False, True, True], [3, 12])
+        journal.recordTest(5, 2, 4, (1, 2, 3, 4, 5), measures, [False] * 5, None)
+        journal.recordSize(5, np.arange(6, dtype=np.float64).reshape(3, 2))
+
+    with RunJournal(journalPath) as journal:
+        assert journal.finishedTests == {5: {(0, 1): ([4, 9, 16, 25, 36], measures, [True, True, False, True, True], [True, True, None, False, True], [3, 12]),
+                                             (2, 4): ([1, 2, 3, 4, 5], measures, None, [False] * 5, None)}}
+        assert journal.finishedSizes == {5: [[0.0, 1.0], [2.0, 3.0], [4.0, 5.0]]}
+
+    header = RunJournal.readHeader(journalPath)
+    assert header["seed"] == 7 and RunJournal.readGrid(header) == args.grid
+    assert RunJournal.mismatchedOptions(header, runArgs(seed=None, grid=None)) == []
+    assert RunJournal.mismatchedOptions(header, args) == []
+    assert RunJournal.mismatchedOptions(header, runArgs(reduced=True, seed=8, grid=args.grid)) == ["reduced", "suite", "seed"] # The reduced test suite runs different algorithms too.
+    assert RunJournal.mismatchedOptions(header, runArgs(seed=7)) == ["grid"]
+    assert RunJournal.mismatchedOptions(header, runArgs(preprocess=True, seed=7, grid=args.grid)) == ["preprocess"]
+
+def testJournalSkipsTornLine(runArgs, tmp_path):
+    journalPath = tmp_path / "RunJournal.jsonl"
+    RunJournal.start(journalPath, runArgs())
+    with RunJournal(journalPath) as journal:
+        journal.recordTest(10, 1, 2, (1, 2, 3, 4, 5), [[0.0] * 3] * 5, [True] * 5, None)
+    with open(journalPath, "a") as file: # What a crash in the middle of a write leaves behind.
+        file.write('{"kind": "test", "size": 10, "targ')
+
+    with RunJournal(journalPath) as journal:
+        assert list(journal.finishedTests[10]) == [(1, 2)]
+        journal.recordTest(10, 1, 3, (1, 2, 3, 4, 5), [[0.0] * 3] * 5, [True] * 5, None)
+    with RunJournal(journalPath) as journal:
+        assert list(journal.finishedTests[10]) == [(1, 2), (1, 3)]
+
+def testJournalHeaderMissing(tmp_path):
+    assert RunJournal.readHeader(tmp_path / "RunJournal.jsonl") is None
+    (tmp_path / "RunJournal.jsonl").write_text('{"kind": "test"}\n')
+    assert RunJournal.readHeader(tmp_path / "RunJournal.jsonl") is None
@@ -0,0 +1,33 @@
+"""
+Checks that the sets the experiment generates follow every rule the algorithms are measured under, no matter the size or target, and that any set can be rebuilt exactly from the seed and its coordinates.
+
+Written by bananathrowingmachine, Mar 22, 2026.
+"""
+from experiment_code.SetGenerator import SetGenerator
+
+import numpy as np
+import pytest
+
+@pytest.mark.parametrize("size", [2, 5, 13, 40, 150])
+def testGeneratedSetsFollowRules(size):
+    generator = SetGenerator(size, size)
+    for targetIndex in range(21):
+        testSets = generator.generateRandomSets(targetIndex, range(1, 51))
+        assert testSets.shape == (50, size) and testSets.dtype == np.int32
+        absSums = np.abs(testSets).sum(axis=1)
+        assert np.all(absSums % 2 == 0)
+        assert np.all(absSums >= max(generator.sumSizeTarget[targetIndex] - generator.sumSizeBound, generator.sumSizeTarget[0]))
+        assert np.all(absSums <= min(generator.sumSizeTarget[targetIndex] + generator.sumSizeBound, generator.sumSizeTarget[20]))
+        assert np.all(testSets.sum(axis=1) != 0)
+        assert np.all(np.abs(testSets) <= 32767)
+        for testSet in testSets: # No two integers may share an absolute value.
+            assert len(set(np.abs(testSet).tolist())) == size, testSet
+
+def testSetsRebuildAlone():
+    testSets = SetGenerator(30, 11).generateRandomSets(7, range(1, 51))
+    rebuilder = SetGenerator(30, 11)
+    for testNum in (50, 1, 23): # Asked for out of order and one at a time, on a brand new generator.
+        assert np.array_equal(rebuilder.generateRandomSets(7, [testNum])[0], testSets[testNum - 1])
+
+def testSeedChangesSets():
+    assert not np.array_equal(SetGenerator(30, 11).generateRandomSets(7, range(1, 6)), SetGenerator(30, 12).generateRandomSets(7, range(1, 6)))
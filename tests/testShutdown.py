@@ -0,0 +1,74 @@
+"""
+Checks that the data collector always ends the stream, whether it finishes, crashes or gets stopped with Ctrl-C, and that the data processor stops on the end of stream marker and saves what it got.
+
+Written by bananathrowingmachine, Mar 22, 2026.
+"""
+from experiment_code.ComplexityExperiment import ComplexityExperiment
+from experiment_code.RunJournal import RunJournal
+from experiment_code.RawResultsStore import RawResultsStore
+from data_processing_code.MiscDataCode import ResultsWrapper, GridSpec
+from FastPartitionExperiment import collectData, reprocessData, processData, endOfStream, queueLimit
+
+from multiprocessing import Queue
+import numpy as np
+import pytest
+import signal
+
+smallGrid = GridSpec(Sizes=(5, 10), TargetCount=2, Repeats=2)
+
+def drain(queue: Queue) -> list:
+    """
+    :return: Everything sent over the queue, up to and including the end of stream marker.
+    """
+    items = [queue.get(timeout=10)]
+    while items[-1] != endOfStream:
+        items.append(queue.get(timeout=10))
+    return items
+
+def testFinishedRunEndsStream(runArgs, tmp_path):
+    args = runArgs(python=True, grid=smallGrid)
+    journalPath = tmp_path / "RunJournal.jsonl"
+    RunJournal.start(journalPath, args)
+    RawResultsStore.start(tmp_path / "raw_results", args)
+    queue = Queue(maxsize=queueLimit)
+    collectData(queue, args, journalPath, tmp_path / "raw_results")
+    items = drain(queue)
+    collected = {item.IntCount: item.RawData for item in items if isinstance(item, ResultsWrapper)}
+    assert sorted(collected) == [5, 10]
+    assert None not in items # Nothing disagreeing doesn't need a marker of its own anymore.
+
+    reprocessData(queue, tmp_path / "raw_results") # Reprocessing sends the same averages back, straight from the saved tests.
+    items = drain(queue)
+    assert [item.IntCount for item in items[:-1]] == [5, 10]
+    for item in items[:-1]:
+        for field in item.RawData.dtype.names:
+            np.testing.assert_allclose(item.RawData[field], collected[item.IntCount][field], rtol=1e-12)
+
+@pytest.mark.parametrize("stop", [RuntimeError, KeyboardInterrupt])
+def testStoppedRunEndsStream(runArgs, tmp_path, monkeypatch, stop):
+    def testProblemSizes(*_):
+        yield from ()
+        raise stop
+    monkeypatch.setattr(ComplexityExperiment, "testProblemSizes", staticmethod(testProblemSizes))
+    args = runArgs(python=True, grid=smallGrid)
+    journalPath = tmp_path / "RunJournal.jsonl"
+    RunJournal.start(journalPath, args)
+    RawResultsStore.start(tmp_path / "raw_results", args)
+    queue = Queue(maxsize=queueLimit)
+    if stop is KeyboardInterrupt: # Ctrl-C is a normal way to stop, so only a crash gets raised back up.
+        collectData(queue, args, journalPath, tmp_path / "raw_results")
+    else:
+        with pytest.raises(stop):
+            collectData(queue, args, journalPath, tmp_path / "raw_results")
+    assert drain(queue) == [endOfStream]
+
+def testProcessorStopsOnEndOfStream(tmp_path):
+    queue = Queue(maxsize=queueLimit)
+    queue.put(endOfStream)
+    handler = signal.getsignal(signal.SIGINT)
+    try:
+        processData(queue, tmp_path, True, smallGrid, False, False)
+    finally:
+        signal.signal(signal.SIGINT, handler) # The processor ignores Ctrl-C, which shouldn't stick around for the rest of the tests.
+    assert (tmp_path / "data_tables" / "Results.xlsx").exists()
+    assert any(tmp_path.rglob("DisagreementRecord.docx"))
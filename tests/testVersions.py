@@ -0,0 +1,188 @@
+"""
+Checks the versions of every algorithm against each other and against a brute force answer, so that a faster version can never quietly give a different answer or iteration count.
+
+Written by bananathrowingmachine, Mar 22, 2026.
+"""
+from experiment_code.TaskScheduler import initWorker, workerRegistry, batchRegistry
+from experiment_code.SetGenerator import SetGenerator
+from data_processing_code.MiscDataCode import AlgoNames
+import experiment_code.versions.python.TabulatedCrazy as TabulatedCrazy
+import experiment_code.versions.python.TabulatedNormal as TabulatedNormal
+import experiment_code.versions.numpy.TabulatedCrazy as TabulatedCrazyNumPy
+import experiment_code.versions.numpy.TabulatedNormal as TabulatedNormalNumPy
+from experiment_code.versions.python.MemoizedNormal import MemoizedNormal
+from experiment_code.versions.python.NewMemoizedCrazy import NewMemoizedCrazy
+from experiment_code.versions.python.OldMemoizedCrazy import OldMemoizedCrazy
+from experiment_code.versions.python.RecursiveNormal import RecursiveNormal
+from FastPartitionExperiment import buildCLibrary
+
+from pathlib import Path
+import numpy as np
+import json
+
+versionsDir = Path(__file__).resolve().parent.parent / "experiment_code" / "versions"
+
+def testBitsetMatchesTable(randomLists, bruteForce):
+    for testList in randomLists(400, 12, 60, 5):
+        expected = bruteForce(testList)
+        for version in (TabulatedCrazy, TabulatedNormal):
+            assert version.testBitsetIterations(testList.tolist()) == version.testIterations(testList.tolist()), f"{version.__name__} on {testList}"
+            assert version.testBitsetIterations(testList.tolist())[1] == expected, f"{version.__name__} on {testList}"
+
+def testBitsetRegistry(runArgs, randomLists, bruteForce):
+    workerRegistry.clear()
+    initWorker(runArgs(python=True, bitset=True))
+    for testList in randomLists(100, 10, 40, 6):
+        for name in (AlgoNames.TabulatedCrazy, AlgoNames.TabulatedNormal):
+            assert workerRegistry[name](testList)[1] == bruteForce(testList), f"{name} on {testList}"
+    workerRegistry.clear()
+
+def testNumPyMatchesPython(runArgs, randomLists, bruteForce):
+    workerRegistry.clear()
+    initWorker(runArgs(numpy=True))
+    for testList in randomLists(400, 12, 60, 7):
+        expected = bruteForce(testList)
+        for version, pythonVersion in ((TabulatedCrazyNumPy, TabulatedCrazy), (TabulatedNormalNumPy, TabulatedNormal)):
+            assert version.testIterations(testList.tolist()) == pythonVersion.testIterations(testList.tolist()), f"{version.__name__} on {testList}"
+            assert version.testIterations(testList.tolist())[1] == expected, f"{version.__name__} on {testList}"
+        for name in (AlgoNames.TabulatedCrazy, AlgoNames.TabulatedNormal):
+            assert workerRegistry[name](testList)[1] == expected, f"{name} on {testList}"
+    workerRegistry.clear()
+
+def testMeetInMiddleMatchesBruteForce(runArgs, randomLists, bruteForce):
+    buildCLibrary(versionsDir)
+    versions = {}
+    for backend in ({"python": True}, {"numpy": True}, {}):
+        workerRegistry.clear()
+        initWorker(runArgs(**backend))
+        versions[str(backend)] = workerRegistry[AlgoNames.MeetInMiddle]
+    workerRegistry.clear()
+    for testList in randomLists(300, 12, 60, 13) + randomLists(40, 16, 32767, 14): # Huge integers don't slow it down at all, unlike every table or answer map.
+        half = len(testList) // 2
+        expected = (2 ** half + 2 ** (len(testList) - half), bruteForce(testList))
+        for backend, version in versions.items():
+            assert version(testList) == expected, f"{backend} on {testList.tolist()}"
+
+def testIterativeMatchesRecursive(randomLists, bruteForce):
+    for testList in randomLists(600, 12, 80, 10):
+        testList = testList.tolist()
+        for version in (NewMemoizedCrazy, OldMemoizedCrazy, MemoizedNormal, RecursiveNormal):
+            assert version.testIterations(testList, iterative=True) == version.testIterations(testList), f"{version.__name__} on {testList}"
+        for version in (NewMemoizedCrazy, OldMemoizedCrazy, MemoizedNormal, RecursiveNormal):
+            assert version.testIterations(testList, iterative=True)[1] == bruteForce(testList), f"{version.__name__} on {testList}"
+        for version, goal in ((NewMemoizedCrazy, sum(map(abs, testList)) // 2), (OldMemoizedCrazy, sum(map(abs, testList)) // 2), (MemoizedNormal, int(sum(testList)/2))): # The same subproblems have to be solved with the same answers, not just as many of them.
+            recursive, iterative = version(testList), version(testList)
+            recursive.subsetSum(0, goal)
+            iterative.subsetSumIterative(0, goal)
+            assert recursive.answerMap == iterative.answerMap, f"{version.__name__} on {testList}"
+
+def testIterativePastRecursionLimit():
+    testList = [1] * 3001 + [-1] # Taking 1500 ones in a row goes deeper than the recursion limit allows.
+    for version in (NewMemoizedCrazy, OldMemoizedCrazy, MemoizedNormal):
+        iterationCount, result = version.testIterations(testList, iterative=True)
+        assert iterationCount >= 1500 and result, version.__name__
+
+def testMemoizedNormalBounds(runArgs):
+    buildCLibrary(versionsDir)
+    workerRegistry.clear()
+    initWorker(runArgs())
+    for testList in ([506, 497, 504, 496, 501, 498], [1] * 4000): # Every way of splitting these takes an integer that lands the goal exactly on one of the bounds, which the old strict check never allowed.
+        assert MemoizedNormal.testIterations(testList, iterative=True)[1], testList[:6]
+        assert workerRegistry[AlgoNames.MemoizedNormal](np.array(testList, dtype=np.int32))[1], testList[:6]
+        if len(testList) < 100: # The recursive version can't go 2000 calls deep.
+            assert MemoizedNormal.testIterations(testList)[1], testList
+    workerRegistry.clear()
+
+def testMemoizedMatchRecorded(randomLists):
+    with open(Path(__file__).resolve().parent / "memoizedResults.json", "r") as file: # What each version gave back on these lists before its answer map keys were packed into ints, with the crazy versions redone once their goal became half the absolute sum, and Memoized Normal redone once its bounds check let goals land on either sum.
+        recorded = json.load(file)
+    testLists = [testList.tolist() for testList in randomLists(200, 12, 60, 12)]
+    for version in (NewMemoizedCrazy, OldMemoizedCrazy, MemoizedNormal):
+        for testList, (iterationCount, result) in zip(testLists, recorded[version.__name__], strict=True):
+            assert version.testIterations(testList) == (iterationCount, result), f"{version.__name__} on {testList}"
+            assert version.testIterations(testList, iterative=True) == (iterationCount, result), f"{version.__name__} on {testList}"
+
+def testCBatchMatchesSingle(runArgs, randomLists):
+    buildCLibrary(versionsDir)
+    workerRegistry.clear()
+    batchRegistry.clear()
+    initWorker(runArgs())
+    testLists = randomLists(300, 14, 2000, 8)
+    for name, batch in batchRegistry.items():
+        for size in {len(testList) for testList in testLists}: # A batch holds sets of one size, one per row.
+            sizeLists = [testList for testList in testLists if len(testList) == size]
+            assert batch(np.stack(sizeLists)) == [workerRegistry[name](testList) for testList in sizeLists], name
+    workerRegistry.clear()
+    batchRegistry.clear()
+
+def testCMatchesPython(runArgs, randomLists, bruteForce):
+    buildCLibrary(versionsDir)
+    workerRegistry.clear()
+    initWorker(runArgs(python=True))
+    pythonVersions = dict(workerRegistry)
+    workerRegistry.clear()
+    initWorker(runArgs())
+    for testList in randomLists(500, 12, 300, 11):
+        original = testList.copy()
+        for name, version in workerRegistry.items():
+            if name == AlgoNames.RecursiveNormal and len(testList) > 10:
+                continue
+            assert version(testList) == pythonVersions[name](testList), f"{name} on {testList.tolist()}"
+            assert np.array_equal(testList, original), f"{name} changed its input" # Every algorithm of a test reads the same buffer, one after another.
+            assert version(testList)[1] == bruteForce(testList), f"{name} on {testList.tolist()}"
+    workerRegistry.clear()
+
+def testCMemoizedCrazyLargeGoals(runArgs):
+    buildCLibrary(versionsDir)
+    workerRegistry.clear()
+    initWorker(runArgs(python=True))
+    pythonVersions = dict(workerRegistry)
+    workerRegistry.clear()
+    initWorker(runArgs())
+    for testList in SetGenerator(100, 3).generateRandomSets(20, range(1, 11)): # Far too many cells for the dense memo, so these use the khash one.
+        for name in (AlgoNames.NewMemoizedCrazy, AlgoNames.OldMemoizedCrazy):
+            assert workerRegistry[name](testList) == pythonVersions[name](testList), f"{name} on {testList.tolist()}"
+    workerRegistry.clear()
+
+def testCCountsPast32Bits(runArgs):
+    buildCLibrary(versionsDir)
+    workerRegistry.clear()
+    initWorker(runArgs())
+    testList = (32000 - np.arange(370)).astype(np.int32) # The table has 370 rows of almost 6 million sums, more cells than an int32 can count.
+    iterationCount, result = workerRegistry[AlgoNames.TabulatedCrazy](testList)
+    assert (iterationCount, result) == TabulatedCrazy.testBitsetIterations(testList.tolist())
+    assert iterationCount > 2 ** 31
+    workerRegistry.clear()
+
+def testCMemoizedLargeSizes(runArgs):
+    buildCLibrary(versionsDir)
+    workerRegistry.clear()
+    initWorker(runArgs(python=True))
+    pythonVersions = dict(workerRegistry)
+    workerRegistry.clear()
+    initWorker(runArgs())
+    rng = np.random.default_rng(17)
+    for _ in range(5): # Multiples of 4 with a few odd integers mixed in have few partitions, so the search goes deep enough to reach index 128 and past it.
+        testList = rng.permutation(np.concatenate([4 * rng.integers(1, 30, size=rng.integers(125, 147)), 2 * rng.integers(1, 60, size=3) - 1]))
+        testList[0] += testList.sum() % 2
+        testList = testList.astype(np.int32)
+        for name in (AlgoNames.NewMemoizedCrazy, AlgoNames.OldMemoizedCrazy, AlgoNames.MemoizedNormal):
+            assert workerRegistry[name](testList) == pythonVersions[name](testList), f"{name} on {testList.tolist()}"
+    workerRegistry.clear()
+
+def testCMemoizedHugeGoals(runArgs):
+    buildCLibrary(versionsDir)
+    workerRegistry.clear()
+    initWorker(runArgs(python=True))
+    pythonVersions = dict(workerRegistry)
+    workerRegistry.clear()
+    initWorker(runArgs())
+    rng = np.random.default_rng(13)
+    for _ in range(300): # Integers a few multiples of 2^25 apart keep every goal past where a 32 bit key can hold it, while still landing subproblems on top of each other.
+        size = rng.integers(4, 12)
+        testList = rng.integers(-20, 21, size=size) + (1 << 25) * rng.integers(-2, 3, size=size)
+        testList[0] += testList.sum() % 2
+        testList = testList.astype(np.int32)
+        for name in (AlgoNames.NewMemoizedCrazy, AlgoNames.OldMemoizedCrazy, AlgoNames.MemoizedNormal):
+            assert workerRegistry[name](testList) == pythonVersions[name](testList), f"{name} on {testList.tolist()}"
+    workerRegistry.clear()
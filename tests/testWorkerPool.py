@@ -0,0 +1,94 @@
+"""
+Checks the task scheduler and its shared worker pool, where every process loads the algorithms once and then runs whatever jobs it is handed for the rest of the run, longest expected job first.
+
+Written by bananathrowingmachine, Mar 22, 2026.
+"""
+from experiment_code.TaskScheduler import TaskScheduler, initWorker, workerRegistry, batchRegistry, countsOnlyTasks, worker, measure
+from experiment_code.SetGenerator import SetGenerator
+from data_processing_code.MiscDataCode import AlgoNames
+import data_processing_code.MiscDataCode as MiscDataCode
+from FastPartitionExperiment import buildCLibrary
+
+from pathlib import Path
+import numpy as np
+import pytest
+import random, sys
+
+versionsDir = Path(__file__).resolve().parent.parent / "experiment_code" / "versions"
+
+def testPoolMatchesInProcess(runArgs):
+    workerRegistry.clear()
+    initWorker(runArgs(python=True))
+    generator = SetGenerator(8, 0)
+    jobs = [MiscDataCode.TestJob(8, targetIndex, testNum, name, 0.0) for targetIndex in range(3) for testNum in range(1, 6) for name in workerRegistry]
+    with TaskScheduler(runArgs(python=True), 2) as scheduler:
+        scheduler.addJobs(jobs)
+        results = {(job.TargetIndex, job.TestNum, job.Algorithm): (result.IterationCount, result.Result) for job, result in scheduler.results()}
+    assert results == {(job.TargetIndex, job.TestNum, job.Algorithm): workerRegistry[job.Algorithm](generator.generateRandomSets(job.TargetIndex, [job.TestNum])[0]) for job in jobs}
+    workerRegistry.clear()
+
+def testBatchesSplitBack(runArgs):
+    workerRegistry.clear()
+    initWorker(runArgs(python=True))
+    generator = SetGenerator(7, 0)
+    jobs = {name: tuple(MiscDataCode.TestJob(7, 1, testNum, name, 1.0) for testNum in range(1, 21)) for name in workerRegistry}
+    with TaskScheduler(runArgs(python=True), 2) as scheduler: # The Python versions have no batched entry point, so this also covers running a batch one set at a time.
+        scheduler.addJobs(MiscDataCode.BatchJob(name, nameJobs, len(nameJobs)) for name, nameJobs in jobs.items())
+        results = {(job.TestNum, job.Algorithm): (result.IterationCount, result.Result) for job, result in scheduler.results()}
+    assert results == {(job.TestNum, job.Algorithm): workerRegistry[job.Algorithm](generator.generateRandomSets(1, [job.TestNum])[0]) for nameJobs in jobs.values() for job in nameJobs}
+    workerRegistry.clear()
+
+def testLongestJobFirst(runArgs):
+    costs = random.Random(4).sample(range(1000), 16)
+    jobs = [MiscDataCode.TestJob(6, 0, testNum, AlgoNames.TabulatedNormal, cost) for testNum, cost in enumerate(costs[:12], 1)]
+    lateJobs = [MiscDataCode.TestJob(6, 1, testNum, AlgoNames.TabulatedNormal, cost) for testNum, cost in enumerate(costs[12:], 1)]
+    finished = []
+    with TaskScheduler(runArgs(python=True), 1) as scheduler:
+        scheduler.maxActive = 1 # Only handing out one job at a time makes the order they finish in the order they were handed out.
+        scheduler.addJobs(jobs)
+        for job, _ in scheduler.results():
+            if len(finished) == 0:
+                scheduler.addJobs(lateJobs)
+            finished.append(job)
+    assert sorted(finished, key=lambda job: (job.TargetIndex, job.TestNum)) == sorted(jobs + lateJobs, key=lambda job: (job.TargetIndex, job.TestNum))
+    assert [job.ExpectedCost for job in finished[1:]] == sorted((job.ExpectedCost for job in finished[1:]), reverse=True) # The first was handed out before the rest were added.
+    assert finished[0].ExpectedCost == max(job.ExpectedCost for job in jobs)
+
+def testCVersionsLongLived(runArgs, randomLists):
+    buildCLibrary(versionsDir)
+    workerRegistry.clear()
+    initWorker(runArgs())
+    testLists = randomLists(300, 14, 3000, 2)
+    for name, version in workerRegistry.items(): # A process now runs each version thousands of times, so a write through a stale khash value pointer would corrupt the heap and crash it.
+        for testList in testLists:
+            iterationCount, result = version(testList)
+            assert iterationCount > 0 and isinstance(result, bool), name
+    workerRegistry.clear()
+
+@pytest.mark.parametrize("backend", [{"python": True}, {"numpy": True}, {}], ids=["python", "numpy", "c"])
+def testCountsOnlyUnmeasured(runArgs, backend):
+    if len(backend) == 0:
+        buildCLibrary(versionsDir)
+    coordinates = [(9, targetIndex, testNum) for targetIndex in range(0, 21, 5) for testNum in range(1, 4)]
+    runs = []
+    for countsOnly in (False, True):
+        for registry in (workerRegistry, batchRegistry, countsOnlyTasks):
+            registry.clear()
+        initWorker(runArgs(countsOnly=countsOnly, **backend))
+        runs.append({(name, *coordinate): worker(name, *coordinate) for name in workerRegistry for coordinate in coordinates})
+    for key, result in runs[1].items(): # Every backend gets the same counts and answers, but only the algorithms that really ran get measured.
+        assert (result.IterationCount, result.Result) == (runs[0][key].IterationCount, runs[0][key].Result), key
+        unmeasured = key[0] in (AlgoNames.TabulatedCrazy, AlgoNames.TabulatedNormal)
+        assert all(np.isnan(measure) == unmeasured for measure in (result.WallTime, result.CpuTime, result.PeakMemory)), key
+    assert AlgoNames.TabulatedCrazy not in batchRegistry and AlgoNames.TabulatedNormal not in batchRegistry
+    for registry in (workerRegistry, batchRegistry, countsOnlyTasks):
+        registry.clear()
+
+def testMeasureCountsPeakMemory():
+    total, wallTime, cpuTime, memory = measure(lambda: float(np.ones(8_000_000).sum())) # 64 MB that is written to, so it really gets used.
+    assert total == 8_000_000.0 and wallTime > 0 and cpuTime >= 0
+    if sys.platform == 'linux':
+        assert memory >= 32_000_000
+    _, _, _, memory = measure(lambda: sum(range(1000))) # The peak is reset before each measurement, so the big array before doesn't count here.
+    if sys.platform == 'linux':
+        assert memory < 32_000_000